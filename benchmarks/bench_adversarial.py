@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the validation of adversarial values of components and
+CPE Names.
+
+Validates values crafted to make the patterns of version 2.3 used
+before, copied here, backtrack: long sequences of wildcards or of
+characters ended by an invalid one. Compares them with the validators
+of components, which scan each value once, for values of increasing
+length. The time of the validators must grow linearly with the length.
+Then parses adversarial CPE Names, which are rejected by the maximum
+length or by the count of components before they are matched.
+
+Usage: python benchmarks/bench_adversarial.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+from cpe.comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+
+#: Lengths of the values to validate
+SIZES = (1024, 4096, 16384)
+
+#: Patterns of values of version 2.3 used before
+_uri = CPEComponent2_3_URI
+_uri_string = "(({0}|{1})*|({2}?({0}|{1})+{2}?))".format(
+    _uri._UNRESERVED, _uri._PCT_ENCODED, _uri._SPEC_CHRS)
+
+_wfn = CPEComponent2_3_WFN
+_wfn_quoted1 = "{0}({1}|{2}|{3})".format(_wfn._ESCAPE, _wfn._ESCAPE,
+                                         _wfn._special, _wfn._PUNC_NO_DASH)
+_wfn_body1 = "\\w|{0}".format(_wfn_quoted1)
+_wfn_body2 = "\\w|{0}".format(_wfn._quoted2)
+_wfn_body = "(({0})({1})*)|{2}({3})+".format(_wfn_body1, _wfn_body2,
+                                             _wfn_body2, _wfn_body2)
+
+_fs = CPEComponent2_3_FS
+_fs_logical = "(\\{0}|{1})".format(_fs.VALUE_ANY, _fs.VALUE_NA)
+
+PATTERNS_BEFORE = {
+    _uri: re.compile("^{0}$".format(_uri_string)),
+    _wfn: re.compile("^((({0})|(({1})({2})*))({3})?)$".format(
+        _wfn_body, _wfn._spec_chrs, _wfn_body2, _wfn._spec_chrs)),
+    _fs: re.compile(
+        "^(({0}+|{1}*({2})+|{3}({4})+)({5})?|{6})$".format(
+            _fs._quest, _fs._quest, _fs._avstring, _fs._asterisk,
+            _fs._avstring, _fs._spec_chrs, _fs_logical)),
+}
+
+#: Adversarial values by class of component: functions of the length
+VALUES = (
+    ("FS ?...!", _fs, lambda n: "?" * n + "!"),
+    ("FS ?...a...!", _fs, lambda n: "?" * (n // 2) + "a" * (n // 2) + "!"),
+    ("URI %01...!", _uri, lambda n: "%01" * (n // 3) + "!"),
+    ("URI %21...%01!", _uri, lambda n: "%21" * (n // 3) + "%01!"),
+    ("WFN ?...!", _wfn, lambda n: "?" * n + "!"),
+    ("WFN \\-...!", _wfn, lambda n: "\\-" * (n // 2) + "!"),
+)
+
+#: Adversarial CPE Names: functions of the length
+NAMES = (
+    ("URI many :", lambda n: "cpe:/a:" + "x" * n + ":" * 10),
+    ("URI long", lambda n: "cpe:/a:" + "x" * n),
+    ("FS long", lambda n: "cpe:2.3:a:" + "?" * n + "!:*:*:*:*:*:*:*:*:*"),
+)
+
+
+def main(count):
+    att = CPEComponent.ATT_VERSION
+
+    print("{0:<16}{1:>8}{2:>16}{3:>16}".format(
+        "value", "length", "before (ms)", "now (ms)"))
+
+    for label, cls, build in VALUES:
+        before = PATTERNS_BEFORE[cls]
+
+        for size in SIZES:
+            value = build(size)
+            assert (before.match(value) is None) and not cls.validate(att, value)
+
+            # The patterns used before are run once on the longest values
+            number = count if size == SIZES[0] else 1
+            prev = timeit.timeit(lambda: before.match(value), number=number)
+            now = timeit.timeit(lambda: cls.validate(att, value), number=count)
+
+            print("{0:<16}{1:>8}{2:>16.3f}{3:>16.3f}".format(
+                label, size, prev * 1e3 / number, now * 1e3 / count))
+
+    print()
+    print("{0:<16}{1:>8}{2:>16}".format("name", "length", "parse (ms)"))
+
+    for label, build in NAMES:
+        for size in SIZES:
+            cpe_str = build(size)
+
+            def parse():
+                try:
+                    CPE(cpe_str)
+                except (ValueError, NotImplementedError):
+                    pass
+
+            now = timeit.timeit(parse, number=count)
+
+            print("{0:<16}{1:>8}{2:>16.3f}".format(
+                label, size, now * 1e3 / count))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
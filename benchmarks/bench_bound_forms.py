@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memoization of the bound forms of a CPE Name.
+
+Binds a CPE Name of each version and style to the three styles of
+version 2.3 repeatedly, computing the strings each time (as before the
+memoization), with the strings stored in the mutable name, and with the
+strings stored in the frozen name, which does not check its components.
+
+Usage: python benchmarks/bench_bound_forms.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+
+#: CPE Names of every version and style
+NAMES = (
+    ("2.3 FS", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta"),
+    ("2.3 WFN", 'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta"]'),
+    ("2.2", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1"),
+    ("1.1", "cpe://microsoft:windows:xp"),
+)
+
+
+def computed(c):
+    c._as_fs()
+    c._as_uri_2_3()
+    c._as_wfn()
+
+
+def memoized(c):
+    c.as_fs()
+    c.as_uri_2_3()
+    c.as_wfn()
+
+
+def main(count):
+    print("{0:<10}{1:>16}{2:>16}{3:>16}".format(
+        "name", "computed (us)", "mutable (us)", "frozen (us)"))
+
+    for label, cpe_str in NAMES:
+        c = CPE(cpe_str)
+        frozen = CPE(cpe_str)
+        frozen.freeze()
+
+        times = [timeit.timeit(lambda: computed(c), number=count),
+                 timeit.timeit(lambda: memoized(c), number=count),
+                 timeit.timeit(lambda: memoized(frozen), number=count)]
+
+        print("{0:<10}{1:>16.1f}{2:>16.1f}{3:>16.1f}".format(
+            label, *[t * 1e6 / count / 3 for t in times]))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the cache of CPE Names.
+
+Parses a list of CPE Names of every version and style, repeated as in a
+set of per-host reports, with the cache of CPE Names disabled and enabled,
+and shows the counters of the cache.
+
+Usage: python benchmarks/bench_cache.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+
+#: CPE Names of every version and style
+NAMES = (
+    "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*",
+    "cpe:/a:microsoft:internet_explorer:8.0.6001:beta",
+    'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta"]',
+    "cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1",
+    "cpe://microsoft:windows:xp!vista",
+)
+
+
+def parse_all():
+    """
+    Parses all the CPE Names.
+    """
+
+    for cpe_str in NAMES:
+        CPE(cpe_str)
+
+
+def main(count):
+    CPE.disable_cache()
+    before = timeit.timeit(parse_all, number=count)
+
+    cache = CPE.enable_cache()
+    after = timeit.timeit(parse_all, number=count)
+    CPE.disable_cache()
+
+    total = count * len(NAMES)
+    print("{0:<10}{1:>16}".format("cache", "names/s"))
+    print("{0:<10}{1:>16.0f}".format("disabled", total / before))
+    print("{0:<10}{1:>16.0f}".format("enabled", total / after))
+    print("speedup: {0:.1f}x".format(before / after))
+    print(cache)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
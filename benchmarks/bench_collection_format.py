@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the reload of a collection of CPE Names.
+
+Builds a collection from formatted strings similar to the ones of the
+official dictionary, and measures three ways of loading it again: a cold
+parse of the strings, trusted, without shared components; the pickle of
+the collection; and the binary format of collections, from a file.
+Besides, shows the size of the strings, the pickle and the file.
+
+Usage: python benchmarks/bench_collection_format.py [names]
+"""
+
+from __future__ import print_function
+
+import os
+import pickle
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpecollection import CPECollection
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+
+def new_names(size):
+    return ["cpe:2.3:{0}:vendor{1}:product{2}:{3}.{4}:{5}:*:*:*:{6}:*:*".format(
+        "aoh"[i % 3], i // 50, i // 5, i % 7, i % 11,
+        "-" if i % 2 else "*", ("windows", "linux", "*")[i % 3])
+        for i in range(size)]
+
+
+def parse(names):
+    CPEComponentSimple._interned.clear()
+    return CPECollection(names, validate=False)
+
+
+def load(path):
+    with open(path, "rb") as f:
+        return CPECollection.load(f)
+
+
+def main(size):
+    names = new_names(size)
+    collection = parse(names)
+
+    data = pickle.dumps(collection, pickle.HIGHEST_PROTOCOL)
+
+    fd, path = tempfile.mkstemp(suffix=".cpec")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            collection.dump(f)
+
+        loaded = load(path)
+        assert [loaded.get_record(i) for i in range(0, size, 97)] == [
+            collection.get_record(i) for i in range(0, size, 97)]
+
+        rows = (
+            ("text parse", lambda: parse(names),
+             sum(len(s) + 1 for s in names)),
+            ("pickle", lambda: pickle.loads(data), len(data)),
+            ("binary format", lambda: load(path), os.path.getsize(path)),
+        )
+
+        print("{0} names".format(size))
+        print("{0:<16}{1:>12}{2:>14}".format("load", "time (ms)", "size (KB)"))
+
+        for label, f, nbytes in rows:
+            number = 1 if label == "text parse" else 5
+            t = timeit.timeit(f, number=number) / number
+
+            print("{0:<16}{1:>12.1f}{2:>14.1f}".format(
+                label, t * 1e3, nbytes / 1024.0))
+
+        t = timeit.timeit(loaded.to_set, number=1)
+        print("{0:<16}{1:>12.1f}".format("to_set", t * 1e3))
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
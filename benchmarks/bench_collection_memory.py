@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memory used by a columnar collection of CPE Names.
+
+Builds a list of formatted strings of version 2.3 like the ones of a
+dictionary, with some thousands of products and many versions, and
+measures the memory allocated per name by a CPESet2_3, which stores
+the names as CPE2_3_WFN objects, and by a CPECollection. The memory of
+the whole official dictionary (about a million of names) is estimated
+from it. Requires tracemalloc (Python 3).
+
+Usage: python benchmarks/bench_collection_memory.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+from cpe.cpeset2_3 import CPESet2_3
+
+#: Count of names of the official dictionary, to estimate its memory
+DICTIONARY_SIZE = 1000000
+
+
+def names(count):
+    """
+    Returns count formatted strings.
+    """
+
+    return ["cpe:2.3:a:vendor{0}:product{1}:{2}.{3}:*:*:en:*:*:*:*".format(
+        i % 500, i % 3000, i // 3000, i % 17) for i in range(count)]
+
+
+def measure(create, cpe_strs):
+    """
+    Returns the memory allocated per name by the structure created from
+    the formatted strings.
+    """
+
+    tracemalloc.start()
+    structure = create(cpe_strs)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del structure
+    return size / float(len(cpe_strs))
+
+
+def new_set(cpe_strs):
+    s = CPESet2_3()
+    # Appended without looking for duplicates, which takes quadratic time
+    s.K = [CPE2_3_WFN(CPE2_3_FS(cpe_str).as_wfn()) for cpe_str in cpe_strs]
+    return s
+
+
+def main(count):
+    cpe_strs = names(count)
+
+    for label, create in (("CPESet2_3", new_set),
+                          ("CPECollection", CPECollection)):
+        per_name = measure(create, cpe_strs)
+        print("{0:<16}{1:>10.0f} bytes/name{2:>10.0f} MB/dictionary".format(
+            label, per_name, per_name * DICTIONARY_SIZE / 2 ** 20))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 30000)
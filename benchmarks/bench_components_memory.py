@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memory used by parsed CPE Names.
+
+Parses a list of formatted strings of version 2.3 like the ones of a
+dictionary, with a few vendors and products and many versions, and
+measures the memory allocated by the parsed CPE Names with a new
+component for each value, as by default, and with the shared components
+of the CPE Names stored in the cache of CPE Names, which are frozen.
+Requires tracemalloc (Python 3).
+
+Usage: python benchmarks/bench_components_memory.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe import CPE
+from cpe.cpe2_3_fs import CPE2_3_FS
+
+#: Vendors and products of CPE Names
+PRODUCTS = (
+    ("microsoft", "windows"), ("microsoft", "office"),
+    ("mozilla", "firefox"), ("apache", "http_server"),
+    ("oracle", "database"), ("cisco", "ios"))
+
+
+def names(count):
+    """
+    Returns count formatted strings.
+    """
+
+    return ["cpe:2.3:a:{0}:{1}:{2}.{3}:*:*:en:*:*:*:*".format(
+        vendor, product, i // 100, i % 100)
+        for i in range(count // len(PRODUCTS))
+        for vendor, product in PRODUCTS]
+
+
+def measure(cpe_strs):
+    """
+    Returns the memory allocated by the parsed CPE Names and the time of
+    parsing.
+    """
+
+    tracemalloc.start()
+    start = time.time()
+    parsed = [CPE2_3_FS(cpe_str) for cpe_str in cpe_strs]
+    elapsed = time.time() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del parsed
+    return size, elapsed
+
+
+def main(count):
+    cpe_strs = names(count)
+
+    fresh = measure(cpe_strs)
+
+    CPE.enable_cache(len(cpe_strs))
+    try:
+        shared = measure(cpe_strs)
+    finally:
+        CPE.disable_cache()
+
+    print("{0} names".format(len(cpe_strs)))
+    print("{0:<10}{1:>14}{2:>12}".format("components", "memory (KB)", "time (s)"))
+    print("{0:<10}{1:>14.0f}{2:>12.2f}".format("new", fresh[0] / 1024.0, fresh[1]))
+    print("{0:<10}{1:>14.0f}{2:>12.2f}".format("shared", shared[0] / 1024.0, shared[1]))
+    print("memory reduction: {0:.1f}x".format(fresh[0] / float(shared[0])))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 6000)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the conversion of a dictionary of CPE Names between
+binding styles.
+
+Converts a list of formatted strings like the ones of a dictionary into
+the other styles, writing them to a stream in memory, with a loop that
+parses each name as a CPE object and writes its binding (as before the
+streaming converter) and with CPEConverter.
+
+Usage: python benchmarks/bench_convert.py [count]
+"""
+
+from __future__ import print_function
+
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.convert import CPEConverter
+
+#: Methods of CPE objects of each binding style
+METHODS = {
+    CPEConverter.BINDING_FS: "as_fs",
+    CPEConverter.BINDING_URI: "as_uri_2_3",
+    CPEConverter.BINDING_WFN: "as_wfn",
+}
+
+
+def names(count):
+    """
+    Returns count formatted strings, one per line.
+    """
+
+    return [u"cpe:2.3:a:vendor{0}:product{1}:{2}.{3}:*:*:en:*:*:*:*\n".format(
+        i % 500, i % 3000, i // 3000, i % 17) for i in range(count)]
+
+
+def loop(lines, binding):
+    output = io.StringIO()
+    method = METHODS[binding]
+
+    for line in lines:
+        output.write(u"" + getattr(CPE(line.strip()), method)() + u"\n")
+
+
+def stream(lines, binding):
+    CPEConverter(binding).write(lines, io.StringIO())
+
+
+def main(count):
+    lines = names(count)
+
+    print("{0:<8}{1:>18}{2:>18}{3:>10}".format(
+        "to", "loop (names/s)", "stream (names/s)", "speedup"))
+
+    for binding in (CPEConverter.BINDING_URI, CPEConverter.BINDING_WFN):
+        before = timeit.timeit(lambda: loop(lines, binding), number=1)
+        after = timeit.timeit(lambda: stream(lines, binding), number=1)
+
+        print("{0:<8}{1:>18.0f}{2:>18.0f}{3:>9.1f}x".format(
+            binding, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
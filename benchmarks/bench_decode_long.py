@@ -0,0 +1,238 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the decoding of long values of components.
+
+Decodes values of 1 KB and 64 KB bound to URI and formatted string of
+version 2.3 and to version 1.1, with the decoders of the components and
+with the decoders used before, copied here, which joined the error
+message at each character. The copies run once on 64 KB, and the copy
+of the URI decoder is not run on 64 KB, because it joins the whole
+value once per character.
+
+Usage: python benchmarks/bench_decode_long.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.comp.cpecomp1_1 import CPEComponent1_1
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+#: Sizes of the values to decode
+SIZES = (("1 KB", 1024), ("64 KB", 64 * 1024))
+
+#: Largest value decoded more than once with the copies of the decoders
+MAX_REPEATED_SIZE = 1024
+
+#: Largest value decoded with the copy of the decoder of URI
+MAX_URI_SIZE = 1024
+
+#: Sequences repeated to build the values of each binding
+SEQUENCES = (
+    ("2.3 URI", "foo%21bar.", "uri"),
+    ("2.3 FS", "foo\\!bar.", "fs"),
+    ("1.1", "foo!bar(x)", "1.1"),
+)
+
+
+def decode_uri_before(s):
+    """
+    Decodes the value bound to URI as the decoder did before.
+    """
+
+    result = []
+    idx = 0
+    embedded = False
+
+    errmsg = []
+    errmsg.append("Invalid value: ")
+
+    while (idx < len(s)):
+        errmsg.append(s)
+        errmsg_str = "".join(errmsg)
+
+        c = s[idx]
+
+        if ((c == '.') or (c == '-') or (c == '~')):
+            result.append("\\")
+            result.append(c)
+            idx += 1
+            embedded = True
+            continue
+
+        if (c != '%'):
+            result.append(c)
+            idx += 1
+            embedded = True
+            continue
+
+        form = s[idx: idx + 3]
+
+        if form == CPEComponent2_3_URI.WILDCARD_ONE:
+            if (((idx == 0) or (idx == (len(s)-3))) or
+                ((not embedded) and (s[idx - 3:idx] == CPEComponent2_3_URI.WILDCARD_ONE)) or
+                (embedded and (len(s) >= idx + 6) and (s[idx + 3:idx + 6] == CPEComponent2_3_URI.WILDCARD_ONE))):
+                result.append("?")
+                idx += 3
+                continue
+            else:
+                raise ValueError(errmsg_str)
+
+        elif form == CPEComponent2_3_URI.WILDCARD_MULTI:
+            if ((idx == 0) or (idx == (len(s) - 3))):
+                result.append("*")
+            else:
+                raise ValueError(errmsg_str)
+
+        elif form in CPEComponent2_3_URI.pce_char_to_decode.keys():
+            result.append(CPEComponent2_3_URI.pce_char_to_decode[form])
+
+        else:
+            errmsg.append("Invalid percent-encoded character: ")
+            errmsg.append(s)
+            raise ValueError("".join(errmsg))
+
+        idx += 3
+        embedded = True
+
+    return "".join(result)
+
+
+def decode_fs_before(s):
+    """
+    Decodes the value bound to formatted string as the decoder did before.
+    """
+
+    result = []
+    idx = 0
+    embedded = False
+
+    errmsg = []
+    errmsg.append("Invalid character '")
+
+    while (idx < len(s)):
+        c = s[idx]
+        errmsg.append(c)
+        errmsg.append("'")
+        errmsg_str = "".join(errmsg)
+
+        if (CPEComponentSimple._is_alphanum(c)):
+            result.append(c)
+            idx += 1
+            embedded = True
+            continue
+
+        if c == "\\":
+            result.append(s[idx: idx + 2])
+            idx += 2
+            embedded = True
+            continue
+
+        if (c == "*"):
+            if (idx == 0) or (idx == (len(s) - 1)):
+                result.append(c)
+                idx += 1
+                embedded = True
+                continue
+            else:
+                raise ValueError(errmsg_str)
+
+        if (c == "?"):
+            if (((idx == 0) or (idx == (len(s) - 1))) or
+               ((not embedded) and (s[idx - 1] == "?")) or
+               (embedded and (s[idx + 1] == "?"))):
+                result.append(c)
+                idx += 1
+                embedded = False
+                continue
+            else:
+                raise ValueError(errmsg_str)
+
+        result.append("\\")
+        result.append(c)
+        idx += 1
+        embedded = True
+
+    return "".join(result)
+
+
+def decode_1_1_before(s):
+    """
+    Decodes the value of version 1.1 as the decoder did before.
+    """
+
+    dec_elements = []
+
+    for elem in s.replace('~', '').split('!'):
+        result = []
+        idx = 0
+        while (idx < len(elem)):
+            c = elem[idx]
+
+            if (c in CPEComponent1_1.NON_STANDARD_VALUES):
+                result.append("\\")
+                result.append(c)
+            else:
+                result.append(c)
+
+            idx += 1
+        dec_elements.append("".join(result))
+
+    return dec_elements
+
+
+def decode_1_1(s):
+    """
+    Decodes the value of version 1.1 with the decoder of the component.
+    """
+
+    comp = CPEComponent1_1.__new__(CPEComponent1_1)
+    comp._encoded_value = s
+    comp._decode()
+
+    return comp._standard_value
+
+
+#: Decoders of each binding: before and now
+DECODERS = {
+    "uri": (decode_uri_before, CPEComponent2_3_URI._decode_value),
+    "fs": (decode_fs_before, CPEComponent2_3_FS._decode_value),
+    "1.1": (decode_1_1_before, decode_1_1),
+}
+
+
+def main(count):
+    print("{0:<10}{1:>8}{2:>16}{3:>16}{4:>10}".format(
+        "binding", "size", "before (ms)", "now (ms)", "speedup"))
+
+    for label, sequence, binding in SEQUENCES:
+        before, now = DECODERS[binding]
+
+        for size_label, size in SIZES:
+            value = sequence * (size // len(sequence))
+            after = timeit.timeit(lambda: now(value), number=count) / count
+
+            if binding == "uri" and size > MAX_URI_SIZE:
+                print("{0:<10}{1:>8}{2:>16}{3:>16.3f}{4:>10}".format(
+                    label, size_label, "-", after * 1e3, "-"))
+                continue
+
+            number = count if size <= MAX_REPEATED_SIZE else 1
+            assert before(value) == now(value)
+            prev = timeit.timeit(lambda: before(value), number=number) / number
+
+            print("{0:<10}{1:>8}{2:>16.3f}{3:>16.3f}{4:>9.1f}x".format(
+                label, size_label, prev * 1e3, after * 1e3, prev / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
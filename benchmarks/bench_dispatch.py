@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the version detection of the CPE factory.
+
+Compares, for a CPE Name of each version and style, the throughput of the
+prefix dispatcher of CPE class with the previous detection strategy,
+that tries a full parse of every version (2.3 FS, 2.3 URI, 2.3 WFN, 2.2
+and 1.1) until one of them does not fail.
+
+Usage: python benchmarks/bench_dispatch.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.cpe1_1 import CPE1_1
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+
+#: Classes tried by the previous detection strategy, in order
+TRIAL_CLASSES = (CPE2_3_FS, CPE2_3_URI, CPE2_3_WFN, CPE2_2, CPE1_1)
+
+#: CPE Names of every version and style
+NAMES = (
+    ("2.3 FS", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta"),
+    ("2.3 WFN", 'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta"]'),
+    ("2.2", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1"),
+    ("1.1", "cpe://microsoft:windows:xp!vista"),
+)
+
+
+def trial_parse(cpe_str):
+    """
+    Detects the version of CPE Name trying every version in turn.
+    """
+
+    for cpe_class in TRIAL_CLASSES:
+        try:
+            return cpe_class(cpe_str)
+        except (ValueError, NotImplementedError):
+            continue
+
+    raise NotImplementedError("Version of CPE not implemented")
+
+
+def main(count):
+    print("{0:<10}{1:>16}{2:>16}{3:>10}".format(
+        "name", "trial (ops/s)", "sniff (ops/s)", "speedup"))
+
+    for label, cpe_str in NAMES:
+        assert type(trial_parse(cpe_str)) is type(CPE(cpe_str))
+
+        before = timeit.timeit(lambda: trial_parse(cpe_str), number=count)
+        after = timeit.timeit(lambda: CPE(cpe_str), number=count)
+
+        print("{0:<10}{1:>16.0f}{2:>16.0f}{3:>9.1f}x".format(
+            label, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the flat view of the attributes of CPE Names.
+
+Measures the accessors of a CPE Name of each version and style and the
+comparison of two WFNs with CPESet2_3, with the flat view built when the
+name is parsed and with the view disabled, as if the name had been
+modified, so the accessors loop over its parts and elements.
+
+Usage: python benchmarks/bench_flat_view.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.comp.cpecomp import CPEComponent
+from cpe.cpeset2_3 import CPESet2_3
+
+#: CPE Names of every version and style
+NAMES = (
+    ("2.3 FS", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*", None),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta", None),
+    ("2.3 WFN", 'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta"]', None),
+    ("2.2", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta", CPE.VERSION_2_2),
+)
+
+
+def new_name(cpe_str, version, flat):
+    c = CPE(cpe_str, version)
+
+    if not flat:
+        c._flat_view.valid = False
+
+    return c
+
+
+def read(c):
+    for att in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+        c.get_attribute_values(att)
+        c._get_attribute_components(att)
+    len(c)
+    c[1]
+    c == c
+
+
+def compare(source, target):
+    for att, result in CPESet2_3.compare_wfns(source, target):
+        pass
+
+
+def measure(label, f, count):
+    before = timeit.timeit(lambda: f(False), number=count)
+    after = timeit.timeit(lambda: f(True), number=count)
+
+    print("{0:<26}{1:>14.1f}{2:>14.1f}{3:>9.1f}x".format(
+        label, before * 1e6 / count, after * 1e6 / count, before / after))
+
+
+def main(count):
+    print("{0:<26}{1:>14}{2:>14}{3:>10}".format(
+        "operation", "loops (us)", "flat (us)", "speedup"))
+
+    for label, cpe_str, version in NAMES:
+        names = dict((flat, new_name(cpe_str, version, flat))
+                     for flat in (False, True))
+        measure("accessors " + label, lambda flat: read(names[flat]), count)
+
+    wfn_str = NAMES[2][1]
+    wfns = dict((flat, (new_name(wfn_str, None, flat),
+                        new_name(wfn_str.replace("beta", "sp1"), None, flat)))
+                for flat in (False, True))
+    measure("compare_wfns", lambda flat: compare(*wfns[flat]), count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the partitioning of CPE Names of version 2.3 with formatted
+string style.
+
+Compares the scanner of CPE2_3_FS, that splits the name on unquoted
+colons, with the regular expression previously used to partition the
+name, with eleven lazy groups. Both are measured on short names and on
+pathological long or escaped names. The throughput of a full parse with
+CPE2_3_FS is shown too.
+
+Usage: python benchmarks/bench_fs_parse.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe2_3_fs import CPE2_3_FS
+
+#: Regular expression previously used to partition the names
+_comp = "(?P<{0}>.*?)(?<!\\\\)"
+REGEX = re.compile(
+    "^cpe:2.3:(?P<part>(h|o|a|\\*|-))\\:" +
+    "\\:".join(_comp.format(att) for att in (
+        "vendor", "product", "version", "update", "edition", "language",
+        "sw_edition", "target_sw", "target_hw", "other")) + "$",
+    re.IGNORECASE)
+
+#: CPE Names, valid and bad-formed
+NAMES = (
+    ("short", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"),
+    ("escaped", "cpe:2.3:a:hp:insight_diagnostics:7\\:4\\:0\\:1570:-:*:*:online:win2003:x64:*"),
+    ("long", "cpe:2.3:a:" + "v" * 4096 + ":product:" + "1.0." * 1024 + ":*:*:*:*:*:*:*"),
+    ("long escaped", "cpe:2.3:a:" + "\\:" * 2048 + ":product:1.0:*:*:*:*:*:*:*"),
+    ("bad colons", "cpe:2.3:a:" + "v:" * 256),
+    ("bad escapes", "cpe:2.3:a:" + "\\:" * 2048),
+)
+
+
+def regex_split(cpe_str):
+    """
+    Partitions the CPE Name with the previous regular expression.
+    """
+
+    match = REGEX.match(cpe_str.lower())
+    return None if match is None else match.groups()
+
+
+def scanner_split(cpe_str):
+    """
+    Partitions the CPE Name with the scanner of CPE2_3_FS.
+    """
+
+    return CPE2_3_FS._split(cpe_str.lower()[len(CPE2_3_FS.PREFIX_FS):])
+
+
+def parse(cpe_str):
+    """
+    Parses the CPE Name, ignoring bad-formed names.
+    """
+
+    try:
+        CPE2_3_FS(cpe_str)
+    except ValueError:
+        pass
+
+
+def main(count):
+    print("{0:<14}{1:>16}{2:>16}{3:>10}{4:>16}".format(
+        "name", "regex (ops/s)", "scan (ops/s)", "speedup", "parse (ops/s)"))
+
+    for label, cpe_str in NAMES:
+        before = timeit.timeit(lambda: regex_split(cpe_str), number=count)
+        after = timeit.timeit(lambda: scanner_split(cpe_str), number=count)
+        full = timeit.timeit(lambda: parse(cpe_str), number=count)
+
+        print("{0:<14}{1:>16.0f}{2:>16.0f}{3:>9.1f}x{4:>16.0f}".format(
+            label, count / before, count / after, before / after,
+            count / full))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the canonical key of CPE Names.
+
+Removes the duplicates of a list of frozen CPE Names, a third of them
+repeated in other style, searching each one in a list with equality, as
+it was needed before because CPE Names could not be hashed, and adding
+them to a set. Besides, compares two frozen CPE Names by their keys and
+two CPE Names not frozen by their flat views.
+
+Usage: python benchmarks/bench_key.py [count] [names]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+
+
+def new_names(size):
+    names = []
+
+    for i in range(size):
+        if i % 3 == 2:
+            # The same CPE Name than the previous one, in URI style
+            c = CPE(names[-1].as_uri_2_3())
+        else:
+            c = CPE("cpe:2.3:a:vendor{0}:product:{1}.0:*:*:*:*:*:*:*".format(
+                i // 10, i))
+        c.freeze()
+        names.append(c)
+
+    return names
+
+
+def dedup_with_list(names):
+    unique = []
+    for c in names:
+        if c not in unique:
+            unique.append(c)
+
+    return unique
+
+
+def main(count, size):
+    names = new_names(size)
+    assert len(dedup_with_list(names)) == len(set(names))
+
+    before = timeit.timeit(lambda: dedup_with_list(names), number=1)
+    after = timeit.timeit(lambda: set(names), number=count) / count
+
+    print("{0:<26}{1:>14}{2:>14}{3:>10}".format(
+        "operation", "before (us)", "now (us)", "speedup"))
+    print("{0:<26}{1:>14.1f}{2:>14.1f}{3:>9.1f}x".format(
+        "dedup {0} names".format(size), before * 1e6, after * 1e6,
+        before / after))
+
+    fs = "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"
+    uri = "cpe:/a:microsoft:internet_explorer:8.0.6001:beta"
+    pairs = dict((frozen, (CPE(fs), CPE(uri))) for frozen in (False, True))
+    for c in pairs[True]:
+        c.freeze()
+
+    before = timeit.timeit(lambda: pairs[False][0] == pairs[False][1],
+                           number=count)
+    after = timeit.timeit(lambda: pairs[True][0] == pairs[True][1],
+                          number=count)
+
+    print("{0:<26}{1:>14.2f}{2:>14.2f}{3:>9.1f}x".format(
+        "equality", before * 1e6 / count, after * 1e6 / count,
+        before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 3000)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the lazy decoding of the values of components.
+
+Parses CPE Names of every version and style and reads only the encoded
+value of vendor and product, as a filter of a bulk load does. Compares
+the lazy decoding of components with the decoding of all the values of
+all the components after the parse, as the parsers did before. The
+components are not shared between iterations, to measure the decoding.
+
+Usage: python benchmarks/bench_lazy_decode.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+#: CPE Names of every version and style
+NAMES = (
+    ("2.3 FS", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta"),
+    ("2.3 WFN", 'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta"]'),
+    ("2.2", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1"),
+    ("1.1", "cpe://microsoft:windows:xp!vista"),
+)
+
+
+def filter_name(cpe_str, eager):
+    """
+    Parses the CPE Name and reads its vendor and product.
+    """
+
+    CPEComponentSimple._interned.clear()
+    c = CPE(cpe_str)
+
+    if eager:
+        # Decode all the values, as the parsers did before
+        for pk in CPE.CPE_PART_KEYS:
+            for elem in c.get(pk):
+                for comp in elem.values():
+                    comp._standard_value
+
+    for comp in c._get_attribute_components(CPEComponent.ATT_VENDOR):
+        comp.get_value()
+    for comp in c._get_attribute_components(CPEComponent.ATT_PRODUCT):
+        comp.get_value()
+
+
+def main(count):
+    print("{0:<10}{1:>16}{2:>16}{3:>10}".format(
+        "name", "eager (ops/s)", "lazy (ops/s)", "speedup"))
+
+    for label, cpe_str in NAMES:
+        before = timeit.timeit(lambda: filter_name(cpe_str, True), number=count)
+        after = timeit.timeit(lambda: filter_name(cpe_str, False), number=count)
+
+        print("{0:<10}{1:>16.0f}{2:>16.0f}{3:>9.1f}x".format(
+            label, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the matching of an inventory of CPE Names against a set of
+CPE Names of version 2.3.
+
+Builds a set with the records of a collection of CPE Names, and an
+inventory of formatted strings of the same products, some of them
+repeated, with versions that are not always in the set. Matches the
+inventory calling name_match with the WFN of each CPE Name, and with a
+only call of match_many, and finds the positions of the members matched
+by each CPE Name.
+
+Usage: python benchmarks/bench_match_many.py [names] [inventory]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+
+
+def new_set(size):
+    names = ["cpe:2.3:a:vendor{0}:product{1}:{2}.{3}:*:*:*:*:*:*:*".format(
+        i // 40, i // 8, i % 4, i % 8) for i in range(size)]
+    names.extend("cpe:2.3:a:vendor{0}:*:*:*:*:*:*:*:*:*".format(i)
+                 for i in range(0, size // 40, 10))
+
+    return CPECollection(names, validate=False).to_set()
+
+
+def new_inventory(size, products):
+    return [CPE("cpe:2.3:a:vendor{0}:product{1}:{2}.{3}:*:*:*:*:*:*:*".format(
+        p // 5, p, i % 3, i % 10))
+        for i, p in enumerate((i * 7919) % products for i in range(size))]
+
+
+def loop_match(s, inventory):
+    return [s.name_match(CPE2_3_WFN(c.as_wfn())) for c in inventory]
+
+
+def main(size, count):
+    s = new_set(size)
+    inventory = new_inventory(count, size // 8)
+
+    assert loop_match(s, inventory) == s.match_many(inventory)
+
+    print("{0} names, inventory of {1} names".format(size, count))
+    print("{0:<28}{1:>12}{2:>10}".format("match", "time (ms)", "speedup"))
+
+    before = timeit.timeit(lambda: loop_match(s, inventory), number=1)
+    print("{0:<28}{1:>12.1f}".format("name_match loop", before * 1e3))
+
+    for label, indices in (("match_many", False),
+                           ("match_many with indices", True)):
+        t = timeit.timeit(lambda: s.match_many(inventory, indices),
+                          number=1)
+
+        print("{0:<28}{1:>12.1f}{2:>9.1f}x".format(
+            label, t * 1e3, before / t))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20000)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the memory used by records of CPE Names.
+
+Parses a list of formatted strings of version 2.3 like the ones of a
+dictionary, and measures the memory allocated per name by the CPE
+objects and by their records, and the time of matching a name against
+a set of CPE objects and a set of records. Requires tracemalloc
+(Python 3).
+
+Usage: python benchmarks/bench_record_memory.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cperecord import CPERecord
+from cpe.cpeset2_3 import CPESet2_3
+
+#: Vendors and products of CPE Names
+PRODUCTS = (
+    ("microsoft", "windows"), ("microsoft", "office"),
+    ("mozilla", "firefox"), ("apache", "http_server"),
+    ("oracle", "database"), ("cisco", "ios"))
+
+
+def names(count):
+    """
+    Returns count formatted strings.
+    """
+
+    return ["cpe:2.3:a:{0}:{1}:{2}.{3}:*:*:en:*:*:*:*".format(
+        vendor, product, i // 100, i % 100)
+        for i in range(count // len(PRODUCTS))
+        for vendor, product in PRODUCTS]
+
+
+def measure(create, items):
+    """
+    Returns the objects created from items and the memory allocated
+    by them.
+    """
+
+    tracemalloc.start()
+    objs = [create(item) for item in items]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return objs, size
+
+
+def main(count):
+    cpe_strs = names(count)
+
+    cpes, cpe_size = measure(CPE2_3_FS, cpe_strs)
+    records, record_size = measure(CPERecord.from_cpe, cpes)
+
+    print("{0:<10}{1:>16}".format("type", "bytes per name"))
+    print("{0:<10}{1:>16.0f}".format("CPE", cpe_size / float(len(cpes))))
+    print("{0:<10}{1:>16.0f}".format("record", record_size / float(len(cpes))))
+
+    # Matching against a small set of names, converted to WFN
+    size = min(len(cpes), 200)
+    wfn = CPE2_3_WFN(cpes[-1].as_wfn())
+
+    s_cpe = CPESet2_3()
+    s_cpe.K = [CPE2_3_WFN(c.as_wfn()) for c in cpes[:size]]
+    s_record = CPESet2_3()
+    s_record.K = records[:size]
+
+    before = timeit.timeit(lambda: s_cpe.name_match(wfn), number=10)
+    after = timeit.timeit(lambda: s_record.name_match(wfn), number=10)
+
+    print()
+    print("{0:<10}{1:>16}".format("set", "matches/s"))
+    print("{0:<10}{1:>16.0f}".format("CPE", 10 / before))
+    print("{0:<10}{1:>16.0f}".format("record", 10 / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 12000)
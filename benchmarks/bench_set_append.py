@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the construction of a set of CPE Names of version 2.3.
+
+Adds to a set formatted strings, a tenth of them repeated, one at a time
+and in a only call of extend, and compares them with the linear search
+of each CPE Name in the members of set and the conversion of each CPE
+Name to WFN done before.
+
+Usage: python benchmarks/bench_set_append.py [names]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpeset2_3 import CPESet2_3
+
+
+def new_names(size):
+    names = []
+
+    for i in range(size):
+        if i % 10 == 9:
+            # The same CPE Name than some previous one
+            names.append(names[i // 2])
+        else:
+            names.append(CPE(
+                "cpe:2.3:a:vendor{0}:product{1}:{2}.0:*:*:*:*:*:*:*".format(
+                    i // 50, i // 5, i), validate=False))
+
+    return names
+
+
+def linear_set(names):
+    s = CPESet2_3()
+
+    for cpe in names:
+        cpe = CPE2_3_WFN(cpe.as_wfn())
+        cpe_str = CPESet2_3._get_name_str(cpe)
+
+        for k in s.K:
+            if cpe_str == CPESet2_3._get_name_str(k):
+                break
+        else:
+            s.K.append(cpe)
+
+    return s
+
+
+def append_set(names):
+    s = CPESet2_3()
+
+    for cpe in names:
+        s.append(cpe)
+
+    return s
+
+
+def extend_set(names):
+    s = CPESet2_3()
+    s.extend(names)
+
+    return s
+
+
+def main(size):
+    names = new_names(size)
+    assert len(linear_set(names)) == len(append_set(names)) == len(
+        extend_set(names))
+
+    print("{0} names".format(size))
+    print("{0:<16}{1:>12}{2:>10}".format("build", "time (ms)", "speedup"))
+
+    before = timeit.timeit(lambda: linear_set(names), number=1)
+    print("{0:<16}{1:>12.1f}".format("linear", before * 1e3))
+
+    for label, f in (("append", append_set), ("extend", extend_set)):
+        t = timeit.timeit(lambda: f(names), number=1)
+
+        print("{0:<16}{1:>12.1f}{2:>9.1f}x".format(
+            label, t * 1e3, before / t))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
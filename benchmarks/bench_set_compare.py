@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the comparison of CPE Names with the members of a set of
+CPE Names of version 2.3.
+
+Matches against a set CPE Names that the index of set can not restrict
+to few candidates, with wildcards in vendor and product, so most of the
+members are compared. The members are compared in the compared form
+stored in the index of set, and with cpe_superset, which finds the
+values of the attributes of each member again.
+
+Usage: python benchmarks/bench_set_compare.py [count] [names]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+from cpe.cpeset2_3 import CPESet2_3
+
+#: CPE Names to match
+NAMES = (
+    ("wildcards", 'wfn:[part="a", vendor="vendor*", '
+                  'product="product7*", version="9\\.9"]'),
+    ("any vendor", 'wfn:[part=ANY, vendor=ANY, product="prod*", '
+                   'update="beta"]'),
+)
+
+
+def new_set(size, records):
+    names = ["cpe:2.3:{0}:vendor{1}:product{2}:{3}.{4}:*:*:*:*:*:*:*".format(
+        "aoh"[i % 3], i // 30, i // 3, i % 7, i % 11) for i in range(size)]
+
+    if records:
+        return CPECollection(names, validate=False).to_set()
+
+    s = CPESet2_3()
+    s.extend(CPE2_3_WFN(CPE(n).as_wfn()) for n in names)
+
+    return s
+
+
+def superset_match(s, wfn):
+    for N in s.K:
+        if CPESet2_3.cpe_superset(wfn, N):
+            return True
+    return False
+
+
+def main(count, size):
+    print("{0} names".format(size))
+    print("{0:<28}{1:>18}{2:>14}{3:>10}".format(
+        "name_match", "cpe_superset (ms)", "forms (ms)", "speedup"))
+
+    for members, records in (("records", True), ("WFN", False)):
+        s = new_set(size, records)
+
+        for label, cpe_str in NAMES:
+            wfn = CPE2_3_WFN(cpe_str)
+            assert s.name_match(wfn) == superset_match(s, wfn)
+
+            before = timeit.timeit(lambda: superset_match(s, wfn),
+                                   number=count) / count
+            after = timeit.timeit(lambda: s.name_match(wfn),
+                                  number=count) / count
+
+            print("{0:<28}{1:>18.2f}{2:>14.2f}{3:>9.1f}x".format(
+                "{0}, {1}".format(label, members), before * 1e3, after * 1e3,
+                before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 5000)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the name matching against a set of CPE Names of version 2.3.
+
+Builds a set with the records of a collection of CPE Names and matches
+against it a CPE Name in the set, a CPE Name of a known vendor and
+unknown product, and a CPE Name with a wildcard in vendor, comparing
+the members found in the index of set with the linear scan of all the
+members done before.
+
+Usage: python benchmarks/bench_set_index.py [count] [names]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+from cpe.cpeset2_3 import CPESet2_3
+
+#: CPE Names to match
+NAMES = (
+    ("member", 'wfn:[part="a", vendor="vendor7", product="product71", '
+               'version="1\\.1", update=ANY]'),
+    ("unknown product", 'wfn:[part="a", vendor="vendor7", '
+                        'product="unknown"]'),
+    ("vendor wildcard", 'wfn:[part="a", vendor="vendor7*", '
+                        'product="product71"]'),
+)
+
+
+def new_set(size):
+    names = ["cpe:2.3:{0}:vendor{1}:product{2}:{3}.{4}:*:*:*:*:*:*:*".format(
+        "aoh"[i % 3], i // 30, i // 3, i % 7, i % 11) for i in range(size)]
+
+    return CPECollection(names, validate=False).to_set()
+
+
+def linear_match(s, wfn):
+    for N in s.K:
+        if CPESet2_3.cpe_superset(wfn, N):
+            return True
+    return False
+
+
+def main(count, size):
+    s = new_set(size)
+
+    print("{0} names".format(size))
+    print("{0:<20}{1:>16}{2:>16}{3:>10}".format(
+        "name_match", "linear (ms)", "indexed (ms)", "speedup"))
+
+    for label, cpe_str in NAMES:
+        wfn = CPE2_3_WFN(cpe_str)
+        assert s.name_match(wfn) == linear_match(s, wfn)
+
+        before = timeit.timeit(lambda: linear_match(s, wfn), number=1)
+        after = timeit.timeit(lambda: s.name_match(wfn),
+                              number=count) / count
+
+        print("{0:<20}{1:>16.3f}{2:>16.3f}{3:>9.1f}x".format(
+            label, before * 1e3, after * 1e3, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100,
+         int(sys.argv[2]) if len(sys.argv) > 2 else 20000)
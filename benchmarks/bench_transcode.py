@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the conversion of CPE Names between styles of version 2.3.
+
+Converts CPE Names between the styles FS, URI and WFN creating the CPE
+object of the input style and binding it, and with the transcoders of
+strings. The components are not shared between iterations.
+
+Usage: python benchmarks/bench_transcode.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpetranscoder import CPETranscoder
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+FS = "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*"
+URI = "cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~"
+WFN = ('wfn:[part="a", vendor="microsoft", product="internet_explorer", '
+       'version="8\\.0\\.6001", update="beta"]')
+
+#: Conversions: name, input string, class of input style, method of
+#: CPE object and transcoder
+CONVERSIONS = (
+    ("fs_to_uri", FS, CPE2_3_FS, "as_uri_2_3", CPETranscoder.fs_to_uri),
+    ("fs_to_wfn", FS, CPE2_3_FS, "as_wfn", CPETranscoder.fs_to_wfn),
+    ("uri_to_fs", URI, CPE2_3_URI, "as_fs", CPETranscoder.uri_to_fs),
+    ("uri_to_wfn", URI, CPE2_3_URI, "as_wfn", CPETranscoder.uri_to_wfn),
+    ("wfn_to_fs", WFN, CPE2_3_WFN, "as_fs", CPETranscoder.wfn_to_fs),
+    ("wfn_to_uri", WFN, CPE2_3_WFN, "as_uri_2_3", CPETranscoder.wfn_to_uri),
+)
+
+
+def convert_object(cls, method, cpe_str):
+    """
+    Converts the CPE Name creating the CPE object.
+    """
+
+    CPEComponentSimple._interned.clear()
+    return getattr(cls(cpe_str), method)()
+
+
+def main(count):
+    print("{0:<12}{1:>16}{2:>16}{3:>10}".format(
+        "conversion", "object (ops/s)", "string (ops/s)", "speedup"))
+
+    for label, cpe_str, cls, method, transcode in CONVERSIONS:
+        assert convert_object(cls, method, cpe_str) == transcode(cpe_str)
+
+        before = timeit.timeit(
+            lambda: convert_object(cls, method, cpe_str), number=count)
+        after = timeit.timeit(lambda: transcode(cpe_str), number=count)
+
+        print("{0:<12}{1:>16.0f}{2:>16.0f}{3:>9.1f}x".format(
+            label, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the parse of CPE Names from a trusted source.
+
+Parses CPE Names of every version and style with and without the
+validation of the values of components. The components are not shared
+between iterations, to measure their creation.
+
+Usage: python benchmarks/bench_trusted.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+#: CPE Names of every version and style, with their version
+NAMES = (
+    ("2.3 FS", "cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*", None),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta:~~pro~~x64~", CPE.VERSION_2_3),
+    ("2.3 WFN", 'wfn:[part="a", vendor="microsoft", product="internet_explorer", version="8\\.0\\.6001", update="beta", language="en\\-us"]', None),
+    ("2.2", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1:pro:en-us", CPE.VERSION_2_2),
+    ("1.1", "cpe://microsoft:windows:xp!vista", None),
+)
+
+
+def parse(cpe_str, version, validate):
+    """
+    Parses the CPE Name without shared components.
+    """
+
+    CPEComponentSimple._interned.clear()
+    CPE(cpe_str, version, validate)
+
+
+def main(count):
+    print("{0:<10}{1:>20}{2:>18}{3:>10}".format(
+        "name", "validated (ops/s)", "trusted (ops/s)", "speedup"))
+
+    for label, cpe_str, version in NAMES:
+        before = timeit.timeit(lambda: parse(cpe_str, version, True),
+                               number=count)
+        after = timeit.timeit(lambda: parse(cpe_str, version, False),
+                              number=count)
+
+        print("{0:<10}{1:>20.0f}{2:>18.0f}{3:>9.1f}x".format(
+            label, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the binding of the values of components to URI.
+
+Binds WFN values with several kinds of characters to URI, with the
+table-driven binding of components and with the scan of the value one
+character at a time that was used before, copied here.
+
+Usage: python benchmarks/bench_uri_binding.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+#: WFN values to bind
+VALUES = (
+    ("alphanum", "internet_explorer"),
+    ("version", "8\\.0\\.6001"),
+    ("wildcards", "8\\.*"),
+    ("quoted", "foo\\!bar\\@baz\\~qux"),
+)
+
+
+def bind_per_character(s):
+    """
+    Binds the WFN value to URI scanning it one character at a time.
+    """
+
+    result = []
+    idx = 0
+    while (idx < len(s)):
+        thischar = s[idx]
+
+        if (CPEComponentSimple._is_alphanum(thischar)):
+            result.append(thischar)
+            idx += 1
+            continue
+
+        if (thischar == "\\"):
+            idx += 1
+            nxtchar = s[idx]
+            if nxtchar in "-.":
+                result.append(nxtchar)
+            else:
+                result.append(CPEComponentSimple.spechar_to_pce[nxtchar])
+            idx += 1
+            continue
+
+        if (thischar == "?"):
+            result.append("%01")
+
+        if (thischar == "*"):
+            result.append("%02")
+
+        idx += 1
+
+    return "".join(result)
+
+
+def main(count):
+    print("{0:<12}{1:>18}{2:>18}{3:>10}".format(
+        "value", "per char (ops/s)", "table (ops/s)", "speedup"))
+
+    for label, value in VALUES:
+        comp = CPEComponent2_3_WFN('"{0}"'.format(value),
+                                   CPEComponent.ATT_VERSION)
+        assert comp.as_uri_2_3() == bind_per_character(value)
+
+        before = timeit.timeit(lambda: bind_per_character(value), number=count)
+        after = timeit.timeit(comp.as_uri_2_3, number=count)
+
+        print("{0:<12}{1:>18.0f}{2:>18.0f}{3:>9.1f}x".format(
+            label, count / before, count / after, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
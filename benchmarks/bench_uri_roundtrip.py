@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the round trip of CPE Names through URI of version 2.3.
+
+Binds to URI a formatted string with extended attributes, an URI with
+packed edition and an URI without it, and parses each URI without shared
+components to bind it back, with the eleven attributes bound in one pass
+from the flat view of the name and with the view disabled, as if the
+name had been modified, so the attributes are bound one at a time and
+the edition is packed apart.
+
+Usage: python benchmarks/bench_uri_roundtrip.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe import CPE
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+#: CPE Names to bind to URI
+NAMES = (
+    ("2.3 FS extended", "cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:-:*:en-us:online:win2003:x64:*"),
+    ("2.3 URI packed", "cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~:en-us"),
+    ("2.3 URI", "cpe:/a:microsoft:internet_explorer:8.0.6001:beta"),
+)
+
+
+def new_name(cpe_str, flat):
+    CPEComponentSimple._interned.clear()
+    c = CPE(cpe_str, CPE.VERSION_2_3, False)
+
+    if not flat:
+        c._flat_view.valid = False
+
+    return c
+
+
+def round_trip(uri, flat):
+    """
+    Parses the URI, trusted, and binds it back to URI.
+    """
+
+    CPEComponentSimple._interned.clear()
+    c = CPE2_3_URI(uri, validate=False)
+
+    if not flat:
+        c._flat_view.valid = False
+
+    return c._as_uri_2_3()
+
+
+def measure(label, f, count):
+    before = timeit.timeit(lambda: f(False), number=count)
+    after = timeit.timeit(lambda: f(True), number=count)
+
+    print("{0:<28}{1:>14.1f}{2:>14.1f}{3:>9.1f}x".format(
+        label, before * 1e6 / count, after * 1e6 / count, before / after))
+
+
+def main(count):
+    print("{0:<28}{1:>14}{2:>14}{3:>10}".format(
+        "operation", "loops (us)", "flat (us)", "speedup"))
+
+    for label, cpe_str in NAMES:
+        names = dict((flat, new_name(cpe_str, flat)) for flat in (False, True))
+        uri = names[True]._as_uri_2_3()
+        assert names[False]._as_uri_2_3() == uri
+        assert round_trip(uri, False) == round_trip(uri, True) == uri
+
+        measure("bind " + label,
+                lambda flat: names[flat]._as_uri_2_3(), count)
+        measure("round trip " + label,
+                lambda flat: round_trip(uri, flat), count)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
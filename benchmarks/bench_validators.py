@@ -0,0 +1,67 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmark of the validators of values of components.
+
+For each class of component and some attributes, compares the validators
+compiled once per class and attribute, used by validate(), with the
+validators built on each call, as the components did before: the
+patterns were joined and compiled (through the cache of module re) for
+each checked value.
+
+Usage: python benchmarks/bench_validators.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.comp.cpecomp1_1 import CPEComponent1_1
+from cpe.comp.cpecomp2_2 import CPEComponent2_2
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+from cpe.comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+
+#: Values to check by class of component and attribute
+VALUES = (
+    (CPEComponent1_1, "vendor", "microsoft"),
+    (CPEComponent1_1, "version", "xp!vista"),
+    (CPEComponent1_1, "language", "en-us"),
+    (CPEComponent2_2, "version", "8.0.6001"),
+    (CPEComponent2_2, "language", "en-us"),
+    (CPEComponent2_3_FS, "part", "a"),
+    (CPEComponent2_3_FS, "version", "8.0.6001"),
+    (CPEComponent2_3_FS, "language", "en-us"),
+    (CPEComponent2_3_URI, "version", "8.0.6001"),
+    (CPEComponent2_3_URI, "edition", "~~pro~~x64~"),
+    (CPEComponent2_3_URI, "language", "en-us"),
+    (CPEComponent2_3_WFN, "version", "8\\.0\\.6001"),
+    (CPEComponent2_3_WFN, "language", "en\\-us"),
+)
+
+
+def main(count):
+    print("{0:<22}{1:<10}{2:>16}{3:>16}{4:>10}".format(
+        "class", "attribute", "build (ops/s)", "registry (ops/s)",
+        "speedup"))
+
+    for cls, att, value in VALUES:
+        assert cls.validate(att, value)
+
+        before = timeit.timeit(
+            lambda: cls._compile_validator(att)(value), number=count)
+        after = timeit.timeit(
+            lambda: cls.validate(att, value), number=count)
+
+        print("{0:<22}{1:<10}{2:>16.0f}{3:>16.0f}{4:>9.1f}x".format(
+            cls.__name__, att, count / before, count / after,
+            before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark of the comparison of source string values with wildcards.
+
+Compares a source value beginning with "*" with target values made of
+the source value repeated, with quoted characters, so it is found many
+times in each target, and a source value with "?" wildcards with a
+short target value. Each comparison is done with the source string
+parsed again and the escape characters of target counted again for
+each position found, as it was done before, and with the matcher of
+source string compiled once.
+
+Usage: python benchmarks/bench_wildcards.py [count]
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from cpe.cpeset2_3 import CPESet2_3
+
+
+def compare_strings(source, target):
+    """
+    Compares a source string to a target string as CPESet2_3 did before
+    compiling the source strings.
+    """
+
+    start = 0
+    end = len(source)
+    begins = 0
+    ends = 0
+
+    if source.startswith("*"):
+        start = 1
+        begins = -1
+
+    if source.endswith("*") and CPESet2_3._is_even_wildcards(source, end - 1):
+        end -= 1
+        ends = -1
+    else:
+        while ((end > 0) and source.endswith("?", end - 1, end) and
+               CPESet2_3._is_even_wildcards(source, end - 1)):
+            end -= 1
+            ends += 1
+
+    source = source[start: end]
+    index = -1
+    leftover = len(target)
+
+    while (leftover > 0):
+        index = target.find(source, index + 1)
+        if (index == -1):
+            break
+        escapes = target.count("\\", 0, index)
+        if ((index > 0) and (begins != -1) and
+           (begins < (index - escapes))):
+            break
+
+        escapes = target.count("\\", index + 1)
+        source_escapes = source.count("\\", index + 1)
+        leftover = len(target) - index + source_escapes - escapes - len(source)
+        if ((leftover > 0) and ((ends != -1) and (leftover > ends))):
+            continue
+
+        return CPESet2_3.LOGICAL_VALUE_SUPERSET
+
+    return CPESet2_3.LOGICAL_VALUE_DISJOINT
+
+
+def main(count):
+    print("{0:<24}{1:>14}{2:>14}{3:>10}".format(
+        "compare", "before (us)", "now (us)", "speedup"))
+
+    cases = [("short", "microsoft\\-ie??", "microsoft\\-ie8")]
+    for size in (10, 100, 1000):
+        cases.append(("repeated x{0}".format(size), "*x\\-",
+                      "x\\-" * size + "y"))
+
+    for label, source, target in cases:
+        assert (compare_strings(source, target) ==
+                CPESet2_3._compare_strings(source, target))
+
+        number = max(1, count // len(target))
+        before = timeit.timeit(lambda: compare_strings(source, target),
+                               number=number) / number
+        after = timeit.timeit(
+            lambda: CPESet2_3._compare_strings(source, target),
+            number=number) / number
+
+        print("{0:<24}{1:>14.2f}{2:>14.2f}{3:>9.1f}x".format(
+            label, before * 1e6, after * 1e6, before / after))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -176,6 +176,16 @@ class CPEComponent(object):
                           9: ATT_TARGET_HW,
                           10: ATT_OTHER}
 
+    #: True if the value of component can not be modified
+    _frozen = False
+
+    #: Count of values set in component, to detect its modifications
+    _modifications = 0
+
+    #: Weak reference to the flat view of the CPE Name of component,
+    #: marked as not valid when the value of component is set
+    _view = None
+
     ###################
     #  CLASS METHODS  #
     ###################
@@ -236,6 +246,13 @@ class CPEComponent(object):
         :rtype: boolean
         """
 
+        from .cpecomp_logical import CPEComponentLogical
+
+        # A logical value is never equal to a string value:
+        # the values are not decoded to compare them
+        if isinstance(other, CPEComponentLogical):
+            return False
+
         len_self = len(self._standard_value)
         len_other = len(other._standard_value)
 
@@ -307,6 +324,40 @@ class CPEComponent(object):
 
         return "{0}()".format(self.__class__.__name__)
 
+    def _forget_view(self):
+        """
+        Marks the flat view of the CPE Name of component as not valid,
+        because it would not see the new value of component.
+
+        :returns: None
+        """
+
+        view = self._view()
+        if view is not None:
+            view.valid = False
+
+        self._view = None
+
+    def freeze(self):
+        """
+        Makes the component immutable, so it can be shared by several
+        CPE Names: any later change of its value raises an exception.
+
+        :returns: None
+        """
+
+        self._frozen = True
+
+    def is_frozen(self):
+        """
+        Returns True if the component can not be modified.
+
+        :returns: True if the component is immutable, False otherwise
+        :rtype: boolean
+        """
+
+        return self._frozen
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -71,6 +71,32 @@ class CPEComponent1_1(CPEComponentSimple):
     #: Logical value associated with a component without value set
     VALUE_EMPTY = ""
 
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Compilation of pattern used to check the value of component:
+    #: a negated value or a list of values
+    _value_pattern = "^((~[{0}]+)|([{0}]+(![{0}]+)*))$".format(_STRING)
+    _value_rxc = re.compile(_value_pattern)
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
+        """
+        Return True if the value of component in generic attribute is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        """
+
+        return CPEComponent1_1._value_rxc.match(comp_str) is not None
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -163,51 +189,14 @@ class CPEComponent1_1(CPEComponentSimple):
         dec_elements = []
 
         for elem in elements:
-            result = []
-            idx = 0
-            while (idx < len(elem)):
-                # Get the idx'th character of s
-                c = elem[idx]
-
-                if (c in CPEComponent1_1.NON_STANDARD_VALUES):
-                    # Escape character
-                    result.append("\\")
-                    result.append(c)
-                else:
-                    # Do nothing
-                    result.append(c)
-
-                idx += 1
-            dec_elements.append("".join(result))
-
-        self._standard_value = dec_elements
-
-    def _is_valid_value(self):
-        """
-        Return True if the value of component in generic attribute is valid,
-        and otherwise False.
+            # Escape the non-standard characters
+            for c in CPEComponent1_1.NON_STANDARD_VALUES:
+                if c in elem:
+                    elem = elem.replace(c, "\\" + c)
 
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
-        """
-
-        comp_str = self._encoded_value
-
-        value_pattern = []
-        value_pattern.append("^((")
-        value_pattern.append("~[")
-        value_pattern.append(CPEComponent1_1._STRING)
-        value_pattern.append("]+")
-        value_pattern.append(")|(")
-        value_pattern.append("[")
-        value_pattern.append(CPEComponent1_1._STRING)
-        value_pattern.append("]+(![")
-        value_pattern.append(CPEComponent1_1._STRING)
-        value_pattern.append("]+)*")
-        value_pattern.append("))$")
+            dec_elements.append(elem)
 
-        value_rxc = re.compile("".join(value_pattern))
-        return value_rxc.match(comp_str) is not None
+        self._standard_value = dec_elements
 
     def as_fs(self):
         r"""
@@ -228,34 +217,8 @@ class CPEComponent1_1(CPEComponentSimple):
         'xp\\!vista'
         """
 
-        result = []
-
-        for s in self._standard_value:
-            idx = 0
-            while (idx < len(s)):
-                c = s[idx]  # get the idx'th character of s
-                if c != "\\":
-                    # unquoted characters pass thru unharmed
-                    result.append(c)
-                else:
-                    # Escaped characters are examined
-                    nextchr = s[idx + 1]
-
-                    if ((nextchr == ".") or (nextchr == "-")
-                       or (nextchr == "_")):
-                        # the period, hyphen and underscore pass unharmed
-                        result.append(nextchr)
-                        idx += 1
-                    else:
-                        # all others retain escaping
-                        result.append("\\")
-                        result.append(nextchr)
-                        idx += 2
-                        continue
-                idx += 1
-            result.append(CPEComponent1_1._ESCAPE_SEPARATOR)
-
-        return "".join(result[0:-1])
+        return CPEComponent1_1._ESCAPE_SEPARATOR.join(
+            CPEComponentSimple._bind_to_fs(s) for s in self._standard_value)
 
     def as_uri_2_3(self):
         """
@@ -279,32 +242,10 @@ class CPEComponent1_1(CPEComponentSimple):
         """
 
         separator = CPEComponentSimple._pct_encode_uri("!")
-        result = []
-
-        for s in self._standard_value:
-            idx = 0
-            while (idx < len(s)):
-                thischar = s[idx]  # get the idx'th character of s
 
-                # alphanumerics (incl. underscore) pass untouched
-                if (CPEComponentSimple._is_alphanum(thischar)):
-                    result.append(thischar)
-                    idx += 1
-                    continue
-
-                # escape character
-                if (thischar == "\\"):
-                    idx += 1
-                    nxtchar = s[idx]
-                    result.append(CPEComponentSimple._pct_encode_uri(nxtchar))
-                    idx += 1
-                    continue
-
-                idx += 1
-
-            result.append(separator)
-
-        return "".join(result[0:-1])
+        # Version 1.1 has not unquoted special characters
+        return separator.join(CPEComponentSimple._bind_to_uri(s, {})
+                              for s in self._standard_value)
 
     def as_wfn(self):
         r"""
@@ -330,12 +271,13 @@ class CPEComponent1_1(CPEComponentSimple):
 
         return "".join(result[0:-1])
 
-    def set_value(self, comp_str, comp_att):
+    def set_value(self, comp_str, comp_att, validate=True):
         """
         Set the value of component. By default, the component has a simple
         value.
 
         :param string comp_att: attribute associated with value of component
+        :param boolean validate: False to not check the value of component
         :returns: None
         :exception: ValueError - incorrect value of component
 
@@ -350,7 +292,7 @@ class CPEComponent1_1(CPEComponentSimple):
         'sp2'
         """
 
-        super(CPEComponent1_1, self).set_value(comp_str, comp_att)
+        super(CPEComponent1_1, self).set_value(comp_str, comp_att, validate)
         self._is_negated = comp_str.startswith('~')
 
 if __name__ == "__main__":
@@ -73,6 +73,23 @@ class CPEComponent2_2(CPEComponentSimple):
     #: Compilation of pattern used to check the value of component
     _value_rxc = re.compile(_VALUE_PATTERN)
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
+        """
+        Return True if the value of component in generic attribute is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        """
+
+        return CPEComponent2_2._value_rxc.match(comp_str) is not None
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -112,17 +129,6 @@ class CPEComponent2_2(CPEComponentSimple):
 
         self._standard_value = "".join(result)
 
-    def _is_valid_value(self):
-        """
-        Return True if the value of component in generic attribute is valid,
-        and otherwise False.
-
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
-        """
-
-        comp_str = self._encoded_value
-        return CPEComponent2_2._value_rxc.match(comp_str) is not None
 
 if __name__ == "__main__":
     import doctest
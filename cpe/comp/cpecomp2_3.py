@@ -55,13 +55,30 @@ class CPEComponent2_3(CPEComponentSimple):
 
         return "{0}({1})".format(self.__class__.__name__, value)
 
-    def _is_valid_language(self):
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Compilation of pattern used to find the wildcards at the beginning
+    #: and the end of values of components, set by each style
+    _wildcards_rxc = None
+
+    #: Compilation of pattern used to find the characters of values of
+    #: components between the wildcards, set by each style
+    _chars_rxc = None
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _compile_language_validator(cls):
         """
-        Return True if the value of component in attribute "language" is valid,
-        and otherwise False.
+        Returns the validator of the values of attribute "language",
+        with the wildcards of this class of component.
 
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
+        :returns: validator of values
+        :rtype: function
 
         CASE 1: Language part with/without region part
         CASE 2: Language part without region part
@@ -69,201 +86,248 @@ class CPEComponent2_3(CPEComponentSimple):
         CASE 4: Region part without language part
         """
 
-        def check_generic_language(self, value):
-            """
-            Check possible values in language part
-            when region part exists or not in language value.
-
-            Possible values of language attribute: a=letter
-            | *a
-            | *aa
-            | aa
-            | aaa
-            | ?a
-            | ?aa
-            | ??
-            | ??a
-            | ???
-            """
-            lang_pattern = []
-            lang_pattern.append("^(\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("[a-z]{1,2}")
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("(([a-z][a-z]?)|(\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("(\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("|[a-z])?))")
-            lang_pattern.append("|([a-z]{2,3}))$")
-
-            lang_rxc = re.compile("".join(lang_pattern))
-
-            return lang_rxc.match(value)
-
-        def check_language_without_region(self, value):
-            """
-            Check possible values in language part
-            when region part not exist in language value.
-
-            Possible values of language attribute: a=letter
-            | a?
-            | aa?
-            | a??
-            | a*
-            | aa*
-            | aaa*
-            | *a*
-            | *a?
-            | ?a*
-            | ?a?
-            """
-            lang_pattern = []
-            lang_pattern.append("^([a-z]")
-            lang_pattern.append("([a-z](\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("|")
-            lang_pattern.append("([a-z]\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("))")
-            lang_pattern.append("|")
-            lang_pattern.append("\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("(\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append(")?")
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append(")|\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append("[a-z](\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append(")")
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("[a-z](\\")
-            lang_pattern.append(self.WILDCARD_MULTI)
-            lang_pattern.append("|\\")
-            lang_pattern.append(self.WILDCARD_ONE)
-            lang_pattern.append(")")
-            lang_pattern.append(")$")
-
-            lang_rxc = re.compile("".join(lang_pattern))
-
-            return lang_rxc.match(value)
-
-        def check_region_with_language(self, value):
-            """
-            Check possible values in region part when language part exists.
-
-            Possible values of language attribute: a=letter, 1=digit
-            | *
-            | a*
-            | a?
-            | aa
-            | ??
-            | 1*
-            | 1??
-            | 11*
-            | 11?
-            | 111
-            | ???
+        # Possible values in language part when region part exists or not
+        # in language value. Possible values of language attribute:
+        # a=letter
+        # | *a
+        # | *aa
+        # | aa
+        # | aaa
+        # | ?a
+        # | ?aa
+        # | ??
+        # | ??a
+        # | ???
+        lang_pattern = []
+        lang_pattern.append("^(\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("[a-z]{1,2}")
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("(([a-z][a-z]?)|(\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("(\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("|[a-z])?))")
+        lang_pattern.append("|([a-z]{2,3}))$")
+
+        generic_language_rxc = re.compile("".join(lang_pattern))
+
+        # Possible values in language part when region part not exist in
+        # language value. Possible values of language attribute: a=letter
+        # | a?
+        # | aa?
+        # | a??
+        # | a*
+        # | aa*
+        # | aaa*
+        # | *a*
+        # | *a?
+        # | ?a*
+        # | ?a?
+        lang_pattern = []
+        lang_pattern.append("^([a-z]")
+        lang_pattern.append("([a-z](\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("|")
+        lang_pattern.append("([a-z]\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("))")
+        lang_pattern.append("|")
+        lang_pattern.append("\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("(\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append(")?")
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append(")|\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append("[a-z](\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append(")")
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("[a-z](\\")
+        lang_pattern.append(cls.WILDCARD_MULTI)
+        lang_pattern.append("|\\")
+        lang_pattern.append(cls.WILDCARD_ONE)
+        lang_pattern.append(")")
+        lang_pattern.append(")$")
+
+        language_without_region_rxc = re.compile("".join(lang_pattern))
+
+        # Possible values in region part when language part exists.
+        # Possible values of language attribute: a=letter, 1=digit
+        # | *
+        # | a*
+        # | a?
+        # | aa
+        # | ??
+        # | 1*
+        # | 1??
+        # | 11*
+        # | 11?
+        # | 111
+        # | ???
+        region_pattern = []
+        region_pattern.append("^(")
+        region_pattern.append("(\\")
+        region_pattern.append(cls.WILDCARD_MULTI)
+        region_pattern.append(")|((\\")
+        region_pattern.append(cls.WILDCARD_ONE)
+        region_pattern.append("){2,3})|([a-z]([a-z]|\\")
+        region_pattern.append(cls.WILDCARD_MULTI)
+        region_pattern.append("|\\")
+        region_pattern.append(cls.WILDCARD_ONE)
+        region_pattern.append("))|([0-9](\\")
+        region_pattern.append(cls.WILDCARD_MULTI)
+        region_pattern.append("|\\")
+        region_pattern.append(cls.WILDCARD_ONE)
+        region_pattern.append("(\\")
+        region_pattern.append(cls.WILDCARD_ONE)
+        region_pattern.append(")?|[0-9][0-9\\")
+        region_pattern.append(cls.WILDCARD_MULTI)
+        region_pattern.append("\\")
+        region_pattern.append(cls.WILDCARD_ONE)
+        region_pattern.append("])))$")
+
+        region_with_language_rxc = re.compile("".join(region_pattern))
+
+        # Possible values in region part when language part not exist.
+        # Possible values of language attribute: 1=digit
+        # | *111
+        # | *11
+        # | *1
+        region_pattern = []
+        region_pattern.append("^(")
+        region_pattern.append("(\\")
+        region_pattern.append(cls.WILDCARD_MULTI)
+        region_pattern.append("[0-9])")
+        region_pattern.append("([0-9]([0-9])?)?")
+        region_pattern.append(")$")
+
+        region_without_language_rxc = re.compile("".join(region_pattern))
+
+        def is_valid_language(comp_str):
             """
-            region_pattern = []
-            region_pattern.append("^(")
-            region_pattern.append("(\\")
-            region_pattern.append(self.WILDCARD_MULTI)
-            region_pattern.append(")|((\\")
-            region_pattern.append(self.WILDCARD_ONE)
-            region_pattern.append("){2,3})|([a-z]([a-z]|\\")
-            region_pattern.append(self.WILDCARD_MULTI)
-            region_pattern.append("|\\")
-            region_pattern.append(self.WILDCARD_ONE)
-            region_pattern.append("))|([0-9](\\")
-            region_pattern.append(self.WILDCARD_MULTI)
-            region_pattern.append("|\\")
-            region_pattern.append(self.WILDCARD_ONE)
-            region_pattern.append("(\\")
-            region_pattern.append(self.WILDCARD_ONE)
-            region_pattern.append(")?|[0-9][0-9\\")
-            region_pattern.append(self.WILDCARD_MULTI)
-            region_pattern.append("\\")
-            region_pattern.append(self.WILDCARD_ONE)
-            region_pattern.append("])))$")
-
-            region_rxc = re.compile("".join(region_pattern))
-            return region_rxc.match(region)
-
-        def check_region_without_language(self, value):
+            Return True if the value of component in attribute "language"
+            is valid, and otherwise False.
             """
-            Check possible values in region part when language part not exist.
 
-            Possible values of language attribute: 1=digit
-            | *111
-            | *11
-            | *1
-            """
-            region_pattern = []
-            region_pattern.append("^(")
-            region_pattern.append("(\\")
-            region_pattern.append(self.WILDCARD_MULTI)
-            region_pattern.append("[0-9])")
-            region_pattern.append("([0-9]([0-9])?)?")
-            region_pattern.append(")$")
-
-            region_rxc = re.compile("".join(region_pattern))
-            return region_rxc.match(region)
-
-        comp_str = self._encoded_value.lower()
-
-        # Value with wildcards; separate language and region of value
-        parts = comp_str.split(self.SEPARATOR_LANG)
-        language = parts[0]
-        region_exists = len(parts) == 2
-
-        # Check the language part
-        if check_generic_language(self, language) is not None:
-            # Valid language, check region part
-            if region_exists:
-                # Region part exists; check it
-                region = parts[1]
-                return (check_region_with_language(self, region) is not None)
+            value = comp_str.lower()
+
+            # Value with wildcards; separate language and region of value
+            parts = value.split(cls.SEPARATOR_LANG)
+            language = parts[0]
+            region_exists = len(parts) == 2
+
+            # Check the language part
+            if generic_language_rxc.match(language) is not None:
+                # Valid language, check region part
+                if region_exists:
+                    # Region part exists; check it
+                    region = parts[1]
+                    return region_with_language_rxc.match(region) is not None
+                else:
+                    # Not region part
+                    return True
+            elif language_without_region_rxc.match(language) is not None:
+                # Language without region; region part should not exist
+                return not region_exists
             else:
-                # Not region part
-                return True
-        elif check_language_without_region(self, language) is not None:
-            # Language without region; region part should not exist
-            return not region_exists
-        else:
-            # Language part not exist; check region part
-            region = parts[0]
-            return check_region_without_language(self, region) is not None
+                # Language part not exist; check region part
+                region = parts[0]
+                return region_without_language_rxc.match(region) is not None
+
+        return is_valid_language
 
-    def _is_valid_part(self):
+    @classmethod
+    def _compile_part_validator(cls):
         """
-        Return True if the value of component in attribute "part" is valid,
-        and otherwise False.
+        Returns the validator of the values of attribute "part",
+        with the wildcards of this class of component.
 
-        :returns: True if value of component is valid, False otherwise
-        :rtype: boolean
+        :returns: validator of values
+        :rtype: function
         """
 
-        comp_str = self._encoded_value
+        # Compilation of regular expression associated with value of part
+        part_pattern = "^(\{0}|\{1})$".format(cls.WILDCARD_ONE,
+                                              cls.WILDCARD_MULTI)
+        part_rxc = re.compile(part_pattern)
 
-        # Check if value of component do not have wildcard
-        if ((comp_str.find(self.WILDCARD_ONE) == -1) and
-           (comp_str.find(self.WILDCARD_MULTI) == -1)):
+        def is_valid_part(comp_str):
+            """
+            Return True if the value of component in attribute "part" is
+            valid, and otherwise False.
+            """
 
-            return super(CPEComponent2_3, self)._is_valid_part()
+            # Check if value of component do not have wildcard
+            if ((comp_str.find(cls.WILDCARD_ONE) == -1) and
+               (comp_str.find(cls.WILDCARD_MULTI) == -1)):
 
-        # Compilation of regular expression associated with value of part
-        part_pattern = "^(\{0}|\{1})$".format(self.WILDCARD_ONE,
-                                              self.WILDCARD_MULTI)
-        part_rxc = re.compile(part_pattern)
+                return cls._is_valid_part(comp_str)
 
-        return part_rxc.match(comp_str) is not None
+            return part_rxc.match(comp_str) is not None
+
+        return is_valid_part
+
+    @classmethod
+    def _split_wildcards(cls, comp_str):
+        r"""
+        Splits the value of component in the wildcards at the beginning,
+        the characters between them and the wildcards at the end. The
+        value is scanned once from left to right, without backtracking:
+        the patterns of wildcards and characters do not share the first
+        character and they are matched only at the start of each piece.
+
+        :param string comp_str: value of component
+        :returns: the three pieces of the value, or None if the value has
+            other characters after the wildcards at the end
+        :rtype: tuple
+
+        TEST: wildcards of formatted string
+
+        >>> from .cpecomp2_3_fs import CPEComponent2_3_FS
+        >>> CPEComponent2_3_FS._split_wildcards('??8.0*')
+        ('??', '8.0', '*')
+        >>> CPEComponent2_3_FS._split_wildcards('8*0') is None
+        True
+        """
+
+        length = len(comp_str)
+
+        m = cls._wildcards_rxc.match(comp_str)
+        start = 0 if m is None else m.end()
+
+        end = cls._chars_rxc.match(comp_str, start).end()
+
+        if end != length:
+            m = cls._wildcards_rxc.match(comp_str, end)
+            if (m is None) or (m.end() != length):
+                return None
+
+        return (comp_str[:start], comp_str[start:end], comp_str[end:])
+
+    @classmethod
+    def _compile_validator(cls, comp_att):
+        """
+        Returns the validator of the values of this class of component in
+        input attribute: a function that returns True if a value is valid.
+
+        :param string comp_att: attribute associated with value of component
+        :returns: validator of values
+        :rtype: function
+        """
+
+        if comp_att == CPEComponentSimple.ATT_LANGUAGE:
+            return cls._compile_language_validator()
+        elif comp_att == CPEComponentSimple.ATT_PART:
+            return cls._compile_part_validator()
+        else:
+            return super(CPEComponent2_3, cls)._compile_validator(comp_att)
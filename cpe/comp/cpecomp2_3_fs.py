@@ -32,7 +32,6 @@ feedback about it, please contact:
 
 from .cpecomp2_3 import CPEComponent2_3
 from .cpecomp2_3_wfn import CPEComponent2_3_WFN
-from .cpecomp_simple import CPEComponentSimple
 
 import re
 
@@ -74,107 +73,192 @@ class CPEComponent2_3_FS(CPEComponent2_3):
     ###############
 
     # Compilation of regular expression associated with value of CPE part
-    _logical = "(\{0}|{1})".format(VALUE_ANY, VALUE_NA)
     _quest = "\{0}".format(WILDCARD_ONE)
     _asterisk = "\{0}".format(WILDCARD_MULTI)
     _special = "{0}|{1}".format(_quest, _asterisk)
     _spec_chrs = "{0}+|{1}".format(_quest, _asterisk)
     _quoted = r"\\(\\" + "|{0}|{1})".format(_special, _PUNC)
     _avstring = "{0}|{1}".format(_UNRESERVED, _quoted)
-    _value_string_pattern = "^(({0}+|{1}*({2})+|{3}({4})+)({5})?|{6})$".format(
-        _quest, _quest, _avstring, _asterisk, _avstring, _spec_chrs, _logical)
 
-    _part_value_rxc = re.compile(_value_string_pattern)
+    # Compilation of regular expressions associated with value of component:
+    # the wildcards at the beginning and the end of value, and the
+    # characters between them
+    _wildcards_rxc = re.compile(_spec_chrs)
+    _chars_rxc = re.compile("({0})*".format(_avstring))
 
-    ####################
-    #  OBJECT METHODS  #
-    ####################
+    # Compilation of regular expression associated with the sequences of
+    # characters decoded together: alphanumerics, a quoted character,
+    # a wildcard and the other characters, which must be quoted
+    _decode_rxc = re.compile(r"(\w+)|(\\.?)|([*?])|([^\w\\*?]+)", re.DOTALL)
 
-    def _decode(self):
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _compile_language_validator(cls):
+        """
+        Returns the validator of the values of attribute "language",
+        with the wildcards of this class of component. The values that
+        match the grammar of languages are also checked decoding them,
+        since the grammar accepts some wildcards in wrong positions.
+
+        :returns: validator of values
+        :rtype: function
+        """
+
+        matches_grammar = super(CPEComponent2_3_FS, cls)._compile_language_validator()
+
+        def is_valid_language(comp_str):
+            """
+            Return True if the value of component in attribute "language"
+            is valid, and otherwise False.
+            """
+
+            if not matches_grammar(comp_str):
+                return False
+
+            try:
+                CPEComponent2_3_FS._decode_value(comp_str)
+            except ValueError:
+                return False
+
+            return True
+
+        return is_valid_language
+
+    @classmethod
+    def _decode_value(cls, s):
         """
         Convert the characters of string s to standard value (WFN value).
         Inspect each character in value of component. Copy quoted characters,
         with their escaping, into the result. Look for unquoted non
         alphanumerics and if not "*" or "?", add escaping.
 
+        :param string s: encoded value of component
+        :returns: standard value of component
+        :rtype: string
         :exception: ValueError - invalid character in value of component
         """
 
         result = []
-        idx = 0
-        s = self._encoded_value
         embedded = False
+        last = len(s) - 1
 
-        errmsg = []
-        errmsg.append("Invalid character '")
+        for m in CPEComponent2_3_FS._decode_rxc.finditer(s):
+            chars, quoted, wildcard, others = m.groups()
 
-        while (idx < len(s)):
-            c = s[idx]  # get the idx'th character of s
-            errmsg.append(c)
-            errmsg.append("'")
-            errmsg_str = "".join(errmsg)
-
-            if (CPEComponentSimple._is_alphanum(c)):
+            if chars is not None:
                 # Alphanumeric characters pass untouched
-                result.append(c)
-                idx += 1
+                result.append(chars)
                 embedded = True
                 continue
 
-            if c == "\\":
+            if quoted is not None:
                 # Anything quoted in the bound string stays quoted
                 # in the unbound string.
-                result.append(s[idx: idx + 2])
-                idx += 2
+                result.append(quoted)
                 embedded = True
                 continue
 
-            if (c == CPEComponent2_3_FS.WILDCARD_MULTI):
+            if others is not None:
+                # all other characters must be quoted
+                result.append("\\")
+                result.append("\\".join(others))
+                embedded = True
+                continue
+
+            idx = m.start()
+
+            if (wildcard == CPEComponent2_3_FS.WILDCARD_MULTI):
                 # An unquoted asterisk must appear at the beginning or
                 # end of the string.
-                if (idx == 0) or (idx == (len(s) - 1)):
-                    result.append(c)
-                    idx += 1
+                if (idx == 0) or (idx == last):
+                    result.append(wildcard)
                     embedded = True
                     continue
-                else:
-                    raise ValueError(errmsg_str)
 
-            if (c == CPEComponent2_3_FS.WILDCARD_ONE):
+            elif (((idx == 0) or (idx == last)) or
+                  ((not embedded) and (s[idx - 1] == CPEComponent2_3_FS.WILDCARD_ONE)) or
+                  (embedded and (s[idx + 1] == CPEComponent2_3_FS.WILDCARD_ONE))):
                 # An unquoted question mark must appear at the beginning or
                 # end of the string, or in a leading or trailing sequence:
                 # - ? legal at beginning or end
                 # - embedded is false, so must be preceded by ?
                 # - embedded is true, so must be followed by ?
-                if (((idx == 0) or (idx == (len(s) - 1))) or
-                   ((not embedded) and (s[idx - 1] == CPEComponent2_3_FS.WILDCARD_ONE)) or
-                   (embedded and (s[idx + 1] == CPEComponent2_3_FS.WILDCARD_ONE))):
-                    result.append(c)
-                    idx += 1
-                    embedded = False
-                    continue
-                else:
-                    raise ValueError(errmsg_str)
+                result.append(wildcard)
+                embedded = False
+                continue
+
+            errmsg = "Invalid character '{0}' in position {1}: {2}".format(
+                wildcard, idx, s)
+            raise ValueError(errmsg)
 
-            # all other characters must be quoted
-            result.append("\\")
-            result.append(c)
-            idx += 1
-            embedded = True
+        return "".join(result)
 
-        self._standard_value = "".join(result)
+    @classmethod
+    def _is_valid_edition(cls, comp_str):
+        """
+        Return True if the value of component in attribute "edition" is
+        valid, and otherwise False. The value is checked decoding it.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        """
+
+        try:
+            CPEComponent2_3_FS._decode_value(comp_str)
+        except ValueError:
+            return False
 
-    def _is_valid_value(self):
+        return True
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
         """
         Return True if the value of component in generic attribute is valid,
-        and otherwise False.
+        and otherwise False. The value is checked in linear time.
 
+        :param string comp_str: value of component
         :returns: True if value is valid, False otherwise
         :rtype: boolean
+
+        TEST: an asterisk at the beginning needs other characters
+
+        >>> CPEComponent2_3_FS._is_valid_value('*8')
+        True
+        >>> CPEComponent2_3_FS._is_valid_value('*?')
+        False
+        """
+
+        if comp_str == CPEComponent2_3_FS.VALUE_ANY:
+            return True
+
+        pieces = CPEComponent2_3_FS._split_wildcards(comp_str)
+        if pieces is None:
+            return False
+
+        prefix, chars, suffix = pieces
+
+        # Question marks at the beginning do not need other characters
+        return ((chars != "") or
+                (prefix.startswith(CPEComponent2_3_FS.WILDCARD_ONE)))
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def _decode(self):
+        """
+        Convert the characters of value of component to standard value
+        (WFN value).
+
+        :exception: ValueError - invalid character in value of component
         """
 
-        comp_str = self._standard_value[0]
-        return CPEComponent2_3_FS._part_value_rxc.match(comp_str) is not None
+        self._standard_value = CPEComponent2_3_FS._decode_value(
+            self._encoded_value)
 
 if __name__ == "__main__":
     import doctest
@@ -82,15 +82,11 @@ class CPEComponent2_3_URI(CPEComponent2_3):
     #  VARIABLES  #
     ###############
 
-    # Variable used to check the value of component
-    _str_w_special = "({0}?({1}|{2})+{3}?)".format(_SPEC_CHRS, _UNRESERVED,
-                                                   _PCT_ENCODED, _SPEC_CHRS)
-    _str_wo_special = "({0}|{1})*".format(_UNRESERVED, _PCT_ENCODED)
-    _string = "({0}|{1})".format(_str_wo_special, _str_w_special)
-
-    # Compilation of regular expression associated with value of component
-    _value_pattern = "^{0}$".format(_string)
-    _value_rxc = re.compile(_value_pattern)
+    # Compilation of regular expressions associated with value of component:
+    # the wildcards at the beginning and the end of value, and the
+    # characters between them
+    _wildcards_rxc = re.compile(_SPEC_CHRS)
+    _chars_rxc = re.compile("({0}|{1})*".format(_UNRESERVED, _PCT_ENCODED))
 
     #: Characters to convert to percent-encoded characters
     char_to_pce = {
@@ -124,6 +120,9 @@ class CPEComponent2_3_URI(CPEComponent2_3):
         '}': "%7d",
         '~': "%7e"}
 
+    #: Characters quoted when the value of component is decoded
+    _CHARS_TO_QUOTE = (".", "-", "~")
+
     #: Percent-encoded characters to decode
     pce_char_to_decode = {
         "%21": '\\!',
@@ -156,131 +155,209 @@ class CPEComponent2_3_URI(CPEComponent2_3):
         "%7d": '\\}',
         "%7e": '\\~'}
 
-    ####################
-    #  OBJECT METHODS  #
-    ####################
+    ###################
+    #  CLASS METHODS  #
+    ###################
 
-    def _decode(self):
+    @classmethod
+    def _quote_chars(cls, s):
         """
-        Convert the characters of character in value of component to standard
-        value (WFN value).
+        Returns a copy of string s with dot, hyphen and tilde quoted.
+
+        :param string s: unreserved characters of value of component
+        :returns: characters with quoting
+        :rtype: string
+        """
+
+        for c in CPEComponent2_3_URI._CHARS_TO_QUOTE:
+            if c in s:
+                s = s.replace(c, "\\" + c)
+
+        return s
+
+    @classmethod
+    def _compile_language_validator(cls):
+        """
+        Returns the validator of the values of attribute "language",
+        with the wildcards of this class of component. The values that
+        match the grammar of languages are also checked decoding them,
+        since the grammar accepts some wildcards in wrong positions.
+
+        :returns: validator of values
+        :rtype: function
+        """
+
+        matches_grammar = super(CPEComponent2_3_URI, cls)._compile_language_validator()
+
+        def is_valid_language(comp_str):
+            """
+            Return True if the value of component in attribute "language"
+            is valid, and otherwise False.
+            """
+
+            if not matches_grammar(comp_str):
+                return False
+
+            try:
+                CPEComponent2_3_URI._decode_value(comp_str)
+            except ValueError:
+                return False
+
+            return True
+
+        return is_valid_language
+
+    @classmethod
+    def _decode_value(cls, s):
+        """
+        Convert the characters of string s to standard value (WFN value).
         This function scans the value of component and returns a copy
         with all percent-encoded characters decoded.
 
+        :param string s: encoded value of component
+        :returns: standard value of component
+        :rtype: string
         :exception: ValueError - invalid character in value of component
         """
 
         result = []
-        idx = 0
-        s = self._encoded_value
         embedded = False
 
-        errmsg = []
-        errmsg.append("Invalid value: ")
-
-        while (idx < len(s)):
-            errmsg.append(s)
-            errmsg_str = "".join(errmsg)
+        # The value is split by the percent signs: every piece but the first
+        # begins with the two digits of a percent-encoded character, and the
+        # rest of each piece is copied quoting dot, hyphen and tilde
+        pieces = s.split("%")
+        plain = pieces[0]
+        if plain:
+            result.append(CPEComponent2_3_URI._quote_chars(plain))
+            embedded = True  # a non-%01 encountered
 
-            # Get the idx'th character of s
-            c = s[idx]
-
-            # Deal with dot, hyphen and tilde: decode with quoting
-            if ((c == '.') or (c == '-') or (c == '~')):
-                result.append("\\")
-                result.append(c)
-                idx += 1
-                embedded = True  # a non-%01 encountered
-                continue
-
-            if (c != '%'):
-                result.append(c)
-                idx += 1
-                embedded = True  # a non-%01 encountered
-                continue
-
-            # we get here if we have a substring starting w/ '%'
-            form = s[idx: idx + 3]  # get the three-char sequence
+        idx = len(plain)
+        last = len(s) - 3
+        for piece in pieces[1:]:
+            form = "%" + piece[:2]  # get the three-char sequence
 
             if form == CPEComponent2_3_URI.WILDCARD_ONE:
                 # If %01 legal at beginning or end
                 # embedded is false, so must be preceded by %01
                 # embedded is true, so must be followed by %01
-                if (((idx == 0) or (idx == (len(s)-3))) or
+                if (((idx == 0) or (idx == last)) or
                     ((not embedded) and (s[idx - 3:idx] == CPEComponent2_3_URI.WILDCARD_ONE)) or
-                    (embedded and (len(s) >= idx + 6) and (s[idx + 3:idx + 6] == CPEComponent2_3_URI.WILDCARD_ONE))):
+                    (embedded and (s[idx + 3:idx + 6] == CPEComponent2_3_URI.WILDCARD_ONE))):
 
                     # A percent-encoded question mark is found
                     # at the beginning or the end of the string,
                     # or embedded in sequence as required.
                     # Decode to unquoted form.
                     result.append(CPEComponent2_3_WFN.WILDCARD_ONE)
-                    idx += 3
-                    continue
                 else:
-                    raise ValueError(errmsg_str)
+                    errmsg = "Invalid value: {0}".format(s)
+                    raise ValueError(errmsg)
 
             elif form == CPEComponent2_3_URI.WILDCARD_MULTI:
-                if ((idx == 0) or (idx == (len(s) - 3))):
+                if ((idx == 0) or (idx == last)):
                     # Percent-encoded asterisk is at the beginning
                     # or the end of the string, as required.
                     # Decode to unquoted form.
                     result.append(CPEComponent2_3_WFN.WILDCARD_MULTI)
+                    embedded = True  # a non-%01 encountered
                 else:
-                    raise ValueError(errmsg_str)
+                    errmsg = "Invalid value: {0}".format(s)
+                    raise ValueError(errmsg)
+
+            else:
+                value = CPEComponent2_3_URI.pce_char_to_decode.get(form)
+                if value is None:
+                    errmsg = "Invalid value: {0}. Invalid percent-encoded character: {1}".format(
+                        s, form)
+                    raise ValueError(errmsg)
 
-            elif form in CPEComponent2_3_URI.pce_char_to_decode.keys():
-                value = CPEComponent2_3_URI.pce_char_to_decode[form]
                 result.append(value)
+                embedded = True  # a non-%01 encountered
 
-            else:
-                errmsg.append("Invalid percent-encoded character: ")
-                errmsg.append(s)
-                raise ValueError("".join(errmsg))
+            plain = piece[2:]
+            if plain:
+                result.append(CPEComponent2_3_URI._quote_chars(plain))
+                embedded = True  # a non-%01 encountered
 
-            idx += 3
-            embedded = True  # a non-%01 encountered.
+            idx += len(piece) + 1
 
-        self._standard_value = "".join(result)
+        return "".join(result)
 
-    def _is_valid_edition(self):
+    @classmethod
+    def _is_valid_edition(cls, comp_str):
         """
         Return True if the input value of attribute "edition" is valid,
-        and otherwise False.
+        and otherwise False: a simple value or five packed values.
 
+        :param string comp_str: value of component
         :returns: True if value is valid, False otherwise
         :rtype: boolean
+
+        TEST: five packed values
+
+        >>> CPEComponent2_3_URI._is_valid_edition('~~pro~~x64~')
+        True
+        >>> CPEComponent2_3_URI._is_valid_edition('~~pro~~x64')
+        False
         """
 
-        comp_str = self._standard_value[0]
+        sep = CPEComponent2_3_URI.SEPARATOR_PACKED_EDITION
 
-        packed = []
-        packed.append("(")
-        packed.append(CPEComponent2_3_URI.SEPARATOR_PACKED_EDITION)
-        packed.append(CPEComponent2_3_URI._string)
-        packed.append("){5}")
+        if not comp_str.startswith(sep):
+            return CPEComponent2_3_URI._is_valid_value(comp_str)
 
-        value_pattern = []
-        value_pattern.append("^(")
-        value_pattern.append(CPEComponent2_3_URI._string)
-        value_pattern.append("|")
-        value_pattern.append("".join(packed))
-        value_pattern.append(")$")
+        # The separator is not a valid character of values
+        values = comp_str.split(sep)
+        if len(values) != 6:
+            return False
 
-        value_rxc = re.compile("".join(value_pattern))
-        return value_rxc.match(comp_str) is not None
+        for value in values[1:]:
+            if not CPEComponent2_3_URI._is_valid_value(value):
+                return False
 
-    def _is_valid_value(self):
+        return True
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
         """
         Return True if the input value CPE name attribute is valid,
-        and otherwise False.
+        and otherwise False. The value is checked in linear time.
 
+        :param string comp_str: value of component
         :returns: True if value is valid, False otherwise
         :rtype: boolean
+
+        TEST: the wildcards need characters between them
+
+        >>> CPEComponent2_3_URI._is_valid_value('%01%01foo%02')
+        True
+        >>> CPEComponent2_3_URI._is_valid_value('%01%02')
+        False
+        """
+
+        pieces = CPEComponent2_3_URI._split_wildcards(comp_str)
+        if pieces is None:
+            return False
+
+        prefix, chars, suffix = pieces
+
+        return (chars != "") or (prefix == "" and suffix == "")
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def _decode(self):
+        """
+        Convert the characters of character in value of component to standard
+        value (WFN value).
+
+        :exception: ValueError - invalid character in value of component
         """
 
-        comp_str = self._standard_value[0]
-        return CPEComponent2_3_URI._value_rxc.match(comp_str) is not None
+        self._standard_value = CPEComponent2_3_URI._decode_value(
+            self._encoded_value)
 
 if __name__ == "__main__":
     import doctest
@@ -46,47 +46,117 @@ class CPEComponent2_3_URI_edpacked(CPEComponent2_3_URI):
     #: Separator of components of an edition attribute packed
     SEPARATOR_COMP = "~"
 
-    ####################
-    #  OBJECT METHODS  #
-    ####################
+    #: Count of attributes packed in edition attribute: "edition",
+    #: "sw_edition", "target_sw", "target_hw" and "other"
+    PACKED_COUNT = 5
 
-    def __init__(self, comp_str):
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _pack_values(cls, values):
         """
-        Store the value of component.
+        Returns the values of the five attributes packed in edition
+        attribute, already bound to URI, as the value of edition: the
+        value of edition alone if the rest are blank, otherwise the five
+        values prefixed and delimited with tilde.
 
-        :param string comp_str: value of component value
-        :returns: None
-        :exception: ValueError - incorrect value of component
+        :param list values: values of the five attributes bound to URI
+        :returns: value of edition attribute
+        :rtype: string
+
+        TEST: extended attributes set
+
+        >>> CPEComponent2_3_URI_edpacked._pack_values(
+        ...     ['', 'online', 'win2003', 'x64', ''])
+        '~~online~win2003~x64~'
+
+        TEST: extended attributes blank
+
+        >>> CPEComponent2_3_URI_edpacked._pack_values(['sp2', '', '', '', ''])
+        'sp2'
         """
 
-        self.set_value(comp_str)
+        if not (values[1] or values[2] or values[3] or values[4]):
+            return values[0]
 
-    def _decode(self):
+        sep = CPEComponent2_3_URI_edpacked.SEPARATOR_COMP
+        return sep + sep.join(values)
+
+    @classmethod
+    def _unpack_value(cls, comp_str):
         """
-        The decoding of the value of this type of component is not necesaary.
+        Returns the values of the five attributes packed in the value of
+        edition attribute, splitting it once. The values after the fifth
+        one are ignored.
+
+        :param string comp_str: value of edition attribute, beginning with
+            tilde
+        :returns: values of the five attributes bound to URI
+        :rtype: list
+        :exception: ValueError - less than five values packed
+
+        TEST: extended attributes set
+
+        >>> CPEComponent2_3_URI_edpacked._unpack_value('~~online~win2003~x64~')
+        ['', 'online', 'win2003', 'x64', '']
         """
 
-        pass
+        count = CPEComponent2_3_URI_edpacked.PACKED_COUNT
+        values = comp_str.split(CPEComponent2_3_URI_edpacked.SEPARATOR_COMP)
+
+        if len(values) <= count:
+            errmsg = "Invalid packed edition '{0}'".format(comp_str)
+            raise ValueError(errmsg)
 
-    def _is_valid_edition(self):
+        return values[1:count + 1]
+
+    @classmethod
+    def _is_valid_edition(cls, comp_str):
         """
         This function is not necesaary in this component.
 
+        :param string comp_str: value of component
         :returns: True
         :rtype: boolean
         """
 
-        True
+        return True
 
-    def _is_valid_value(self):
+    @classmethod
+    def _is_valid_value(cls, comp_str):
         """
         This function is not necesaary in this component.
 
+        :param string comp_str: value of component
         :returns: True
         :rtype: boolean
         """
 
-        True
+        return True
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __init__(self, comp_str):
+        """
+        Store the value of component.
+
+        :param string comp_str: value of component value
+        :returns: None
+        :exception: ValueError - incorrect value of component
+        """
+
+        self.set_value(comp_str)
+
+    def _decode(self):
+        """
+        The decoding of the value of this type of component is not necesaary.
+        """
+
+        pass
 
     def set_value(self, comp_str):
         """
@@ -99,6 +169,11 @@ class CPEComponent2_3_URI_edpacked(CPEComponent2_3_URI):
 
         self._is_negated = False
         self._encoded_value = comp_str
+        self._modifications += 1
+
+        if self._view is not None:
+            self._forget_view()
+
         self._standard_value = super(
             CPEComponent2_3_URI_edpacked, self)._decode()
 
@@ -79,19 +79,49 @@ class CPEComponent2_3_WFN(CPEComponent2_3):
     _spec_chrs = "{0}+|{1}".format(_spec1, _spec2)
     _special = "{0}|{1}".format(_spec1, _spec2)
     _punc_w_dash = "{0}|-".format(_PUNC_NO_DASH)
-    _quoted1 = "{0}({1}|{2}|{3})".format(_ESCAPE, _ESCAPE, _special,
-                                         _PUNC_NO_DASH)
     _quoted2 = "{0}({1}|{2}|{3})".format(_ESCAPE, _ESCAPE,
                                          _special, _punc_w_dash)
-    _body1 = "\w|{0}".format(_quoted1)
-    _body2 = "\w|{0}".format(_quoted2)
-    _body = "(({0})({1})*)|{2}({3})+".format(_body1, _body2, _body2, _body2)
-    _avstring_pattern = "^((({0})|(({1})({2})*))({3})?)$".format(_body,
-                                                                 _spec_chrs,
-                                                                 _body2,
-                                                                 _spec_chrs)
 
-    _value_rxc = re.compile(_avstring_pattern)
+    # Compilation of regular expressions associated with value of component:
+    # the wildcards at the beginning and the end of value, and the
+    # characters between them
+    _wildcards_rxc = re.compile(_spec_chrs)
+    _chars_rxc = re.compile("(\w|{0})*".format(_quoted2))
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
+        r"""
+        Return True if the value of component in generic attribute is valid,
+        and otherwise False. The value is checked in linear time.
+
+        :param string comp_str: value of component, without double quotes
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+
+        TEST: a quoted hyphen needs other characters or wildcards
+
+        >>> CPEComponent2_3_WFN._is_valid_value('\\-')
+        False
+        >>> CPEComponent2_3_WFN._is_valid_value('?\\-')
+        True
+        """
+
+        pieces = CPEComponent2_3_WFN._split_wildcards(comp_str)
+        if pieces is None:
+            return False
+
+        prefix, chars, suffix = pieces
+
+        if prefix != "":
+            return True
+
+        # Without wildcards at the beginning, the value must have
+        # characters, and not only a quoted hyphen
+        return (chars != "") and (chars != "\\-")
 
     ####################
     #  OBJECT METHODS  #
@@ -104,19 +134,7 @@ class CPEComponent2_3_WFN(CPEComponent2_3):
         already.
         """
 
-        pass
-
-    def _is_valid_value(self):
-        """
-        Return True if the value of component in generic attribute is valid,
-        and otherwise False.
-
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
-        """
-
-        comp_str = self._standard_value
-        return CPEComponent2_3_WFN._value_rxc.match(comp_str) is not None
+        self._standard_value = self._encoded_value
 
     def get_value(self):
         """
@@ -129,22 +147,27 @@ class CPEComponent2_3_WFN(CPEComponent2_3):
         # Add double quotes
         return '"{0}"'.format(super(CPEComponent2_3_WFN, self).get_value())
 
-    def set_value(self, comp_str, comp_att):
+    def set_value(self, comp_str, comp_att, validate=True):
         """
         Set the value of component.
 
         :param string comp_str: value of component
         :param string comp_att: attribute associated with comp_str
+        :param boolean validate: False to not check the value of component
         :returns: None
         :exception: ValueError - incorrect value of component
+        :exception: TypeError - frozen component
         """
 
+        if self._frozen:
+            errmsg = "Frozen component can not be modified"
+            raise TypeError(errmsg)
+
         # Del double quotes of value
         str = comp_str[1:-1]
-        self._standard_value = str
 
         # Parse the value
-        super(CPEComponent2_3_WFN, self).set_value(str, comp_att)
+        super(CPEComponent2_3_WFN, self).set_value(str, comp_att, validate)
 
 if __name__ == "__main__":
     import doctest
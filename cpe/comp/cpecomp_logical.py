@@ -60,6 +60,13 @@ class CPEComponentLogical(CPEComponent):
     #: the CPE name cpe:/h:cisco:-:2345 of version 2.3 of CPE specification
     _VALUE_INT_NA = 2
 
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Logical components are immutable, they are shared by all CPE Names
+    _frozen = True
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -90,6 +97,23 @@ class CPEComponentLogical(CPEComponent):
         errmsg = "Class method not implemented. Use the method of some child class"
         raise NotImplementedError(errmsg)
 
+    def __new__(cls, *args, **kwargs):
+        """
+        Returns the only instance of the logical component class,
+        creating it if it does not exist.
+
+        :returns: instance of the class
+        :rtype: CPEComponentLogical
+        """
+
+        instance = cls.__dict__.get("_instance")
+
+        if instance is None:
+            instance = super(CPEComponentLogical, cls).__new__(cls)
+            cls._instance = instance
+
+        return instance
+
     def __str__(self):
         """
         Returns a human-readable representation of CPE component.
@@ -32,6 +32,7 @@ feedback about it, please contact:
 from .cpecomp import CPEComponent
 
 import re
+import weakref
 
 
 class CPEComponentSimple(CPEComponent):
@@ -90,6 +91,48 @@ class CPEComponentSimple(CPEComponent):
         '}': "%7d",
         '~': "%7e"}
 
+    #: Encoding in URI of the quoted characters of WFN values: the
+    #: percent-encoded characters, and period and hyphen without encoding
+    _uri_quoted = dict(("\\" + c, pce) for c, pce in spechar_to_pce.items())
+    _uri_quoted["\\-"] = "-"
+    _uri_quoted["\\."] = "."
+
+    #: Binding in URI of the unquoted special characters of WFN values
+    _uri_unquoted = {"?": "%01", "*": "%02"}
+
+    #: Compilation of pattern used to find the characters of WFN values
+    #: that are not bound untouched: quoted characters and
+    #: non-alphanumeric characters
+    _uri_token_rxc = re.compile(r"(\\.|\W)", re.DOTALL)
+
+    #: Compilation of pattern used to find the quoted characters of
+    #: WFN values
+    _quoted_rxc = re.compile(r"(\\.)", re.DOTALL)
+
+    #: Quoted characters of WFN values that are bound to formatted
+    #: string without quoting
+    _fs_unquoted = (r"\.", r"\-", r"\_")
+
+    #: Shared components by class, attribute and value, removed
+    #: when no CPE Name uses them
+    _interned = weakref.WeakValueDictionary()
+
+    #: Standard value of component (WFN value), None until it is decoded
+    _decoded_value = None
+
+    #: Compilation of pattern used to check if a character is alphanumeric
+    _alphanum_rxc = re.compile(_ALPHANUM_PATTERN)
+
+    #: Compilation of pattern used to check the value of language component
+    _langtag_rxc = re.compile(_LANGTAG_PATTERN)
+
+    #: Compilation of pattern used to check the value of part component
+    _part_rxc = re.compile(_PART_PATTERN)
+
+    #: Validators of values by component class and attribute,
+    #: compiled on first use
+    _validators = {}
+
     ###################
     #  CLASS METHODS  #
     ###################
@@ -111,8 +154,216 @@ class CPEComponentSimple(CPEComponent):
         False
         """
 
-        alphanum_rxc = re.compile(CPEComponentSimple._ALPHANUM_PATTERN)
-        return (alphanum_rxc.match(c) is not None)
+        return (CPEComponentSimple._alphanum_rxc.match(c) is not None)
+
+    @classmethod
+    def _compile_validator(cls, comp_att):
+        """
+        Returns the validator of the values of this class of component in
+        input attribute: a function that returns True if a value is valid.
+        The child classes with grammars that depend on the class compile
+        them here.
+
+        :param string comp_att: attribute associated with value of component
+        :returns: validator of values
+        :rtype: function
+        """
+
+        if comp_att == CPEComponentSimple.ATT_PART:
+            return cls._is_valid_part
+        elif comp_att == CPEComponentSimple.ATT_LANGUAGE:
+            return cls._is_valid_language
+        elif comp_att == CPEComponentSimple.ATT_EDITION:
+            return cls._is_valid_edition
+        else:
+            return cls._is_valid_value
+
+    @classmethod
+    def _is_valid_edition(cls, comp_str):
+        """
+        Return True if the value of component in attribute "edition" is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        """
+
+        return True
+
+    @classmethod
+    def _is_valid_language(cls, comp_str):
+        """
+        Return True if the value of component in attribute "language" is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        """
+
+        value = comp_str.lower()
+        return CPEComponentSimple._langtag_rxc.match(value) is not None
+
+    @classmethod
+    def _is_valid_part(cls, comp_str):
+        """
+        Return True if the value of component in attribute "part" is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value of component is valid, False otherwise
+        :rtype: boolean
+        """
+
+        value = comp_str.lower()
+        return CPEComponentSimple._part_rxc.match(value) is not None
+
+    @classmethod
+    def _is_valid_value(cls, comp_str):
+        """
+        Return True if the value of component in generic attribute is valid,
+        and otherwise False.
+
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        :exception: NotImplementedError - class method not implemented
+        """
+
+        errmsg = "Class method not implemented. Use the method of some child class"
+        raise NotImplementedError(errmsg)
+
+    @classmethod
+    def intern(cls, comp_str, comp_att, validate=True):
+        """
+        Returns the shared component of this class with input value and
+        attribute, creating it if it does not exist. The component is
+        frozen, because it can be used by several CPE Names.
+
+        The components created without validation are not shared with
+        the validated ones.
+
+        :param string comp_str: value of component
+        :param string comp_att: attribute associated with value of component
+        :param boolean validate: False to not check the value of component
+        :returns: frozen component
+        :rtype: CPEComponentSimple
+        :exception: ValueError - incorrect value of component
+
+        TEST: the same value of the same attribute
+
+        >>> from .cpecomp2_3_fs import CPEComponent2_3_FS
+        >>> att = CPEComponentSimple.ATT_VENDOR
+        >>> comp = CPEComponent2_3_FS.intern('microsoft', att)
+        >>> CPEComponent2_3_FS.intern('microsoft', att) is comp
+        True
+        >>> comp.is_frozen()
+        True
+        """
+
+        key = (cls, comp_att, comp_str, validate)
+        comp = CPEComponentSimple._interned.get(key)
+
+        if comp is None:
+            comp = cls(comp_str, comp_att, validate)
+            comp.freeze()
+            CPEComponentSimple._interned[key] = comp
+
+        return comp
+
+    @classmethod
+    def validate(cls, comp_att, comp_str):
+        """
+        Returns True if the input value is valid in the input attribute for
+        this class of component, otherwise False. The grammar of each
+        attribute is compiled once per class of component.
+
+        :param string comp_att: attribute associated with value of component
+        :param string comp_str: value of component
+        :returns: True if value is valid, False otherwise
+        :rtype: boolean
+        :exception: ValueError - invalid attribute
+
+        TEST: a value with wildcards
+
+        >>> from .cpecomp2_3_fs import CPEComponent2_3_FS
+        >>> att = CPEComponentSimple.ATT_VERSION
+        >>> CPEComponent2_3_FS.validate(att, '8.*')
+        True
+        >>> CPEComponent2_3_FS.validate(att, '8*0')
+        False
+        """
+
+        key = (cls, comp_att)
+        validator = CPEComponentSimple._validators.get(key)
+
+        if validator is None:
+            if not CPEComponent.is_valid_attribute(comp_att):
+                errmsg = "Invalid attribute '{0}'".format(comp_att)
+                raise ValueError(errmsg)
+
+            validator = cls._compile_validator(comp_att)
+            CPEComponentSimple._validators[key] = validator
+
+        return validator(comp_str)
+
+    @classmethod
+    def _bind_to_fs(cls, s):
+        r"""
+        Returns the WFN value s bound to formatted string. The period,
+        hyphen and underscore pass without quoting, the rest of quoted
+        characters retain it and the unquoted characters pass untouched.
+
+        :param string s: WFN value
+        :returns: formatted string
+        :rtype: string
+
+        TEST:
+
+        >>> CPEComponentSimple._bind_to_fs('8\\.0\\!\\\\.*')
+        '8.0\\!\\\\.*'
+        """
+
+        # The quoted characters are in the odd positions
+        parts = CPEComponentSimple._quoted_rxc.split(s)
+        parts[1::2] = [c[1] if c in CPEComponentSimple._fs_unquoted else c
+                       for c in parts[1::2]]
+
+        return "".join(parts)
+
+    @classmethod
+    def _bind_to_uri(cls, s, unquoted):
+        r"""
+        Returns the WFN value s bound to URI string. The alphanumeric
+        characters pass untouched, the quoted characters are
+        percent-encoded and the unquoted special characters are bound with
+        the input table; other unquoted characters are removed.
+
+        The characters are looked up in precomputed tables, which are
+        not modified, so it is safe to call it from several threads.
+
+        :param string s: WFN value
+        :param dict unquoted: binding of unquoted special characters
+        :returns: URI string
+        :rtype: string
+        :exception: KeyError - quoted character not valid in URI
+
+        TEST:
+
+        >>> s = 'foo\\@bar\\.*'
+        >>> CPEComponentSimple._bind_to_uri(s, CPEComponentSimple._uri_unquoted)
+        'foo%40bar.%02'
+        """
+
+        quoted = CPEComponentSimple._uri_quoted
+
+        # The characters to bind are in the odd positions
+        parts = CPEComponentSimple._uri_token_rxc.split(s)
+        parts[1::2] = [unquoted.get(c, "") if len(c) == 1 else quoted[c]
+                       for c in parts[1::2]]
+
+        return "".join(parts)
 
     @classmethod
     def _pct_encode_uri(cls, c):
@@ -137,28 +388,26 @@ class CPEComponentSimple(CPEComponent):
         '%40'
         """
 
-        CPEComponentSimple.spechar_to_pce['-'] = c  # bound without encoding
-        CPEComponentSimple.spechar_to_pce['.'] = c  # bound without encoding
-
-        return CPEComponentSimple.spechar_to_pce[c]
+        return CPEComponentSimple._uri_quoted["\\" + c]
 
     ####################
     #  OBJECT METHODS  #
     ####################
 
-    def __init__(self, comp_str, comp_att):
+    def __init__(self, comp_str, comp_att, validate=True):
         """
         Store the value of component.
 
         :param string comp_str: value of component value
         :param string comp_att: attribute associated with component value
+        :param boolean validate: False to not check the value of component
         :returns: None
         :exception: ValueError - incorrect value of component
         """
 
         super(CPEComponentSimple, self).__init__(comp_str)
         self._standard_value = self._standard_value
-        self.set_value(comp_str, comp_att)
+        self.set_value(comp_str, comp_att, validate)
 
     def __str__(self):
         """
@@ -170,55 +419,35 @@ class CPEComponentSimple(CPEComponent):
 
         return self.get_value()
 
-    def _is_valid_edition(self):
+    def _get_standard_value(self):
         """
-        Return True if the value of component in attribute "edition" is valid,
-        and otherwise False.
+        Returns the standard value of component (WFN value). The encoded
+        value is decoded on first access only.
 
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
-        """
-
-        return self._is_valid_value() is not None
-
-    def _is_valid_language(self):
-        """
-        Return True if the value of component in attribute "language" is valid,
-        and otherwise False.
-
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
+        :returns: standard value of component
+        :rtype: string
         """
 
-        comp_str = self._encoded_value.lower()
-        lang_rxc = re.compile(CPEComponentSimple._LANGTAG_PATTERN)
-        return lang_rxc.match(comp_str) is not None
+        value = self._decoded_value
+        if value is None:
+            self._decode()
+            value = self._decoded_value
 
-    def _is_valid_part(self):
-        """
-        Return True if the value of component in attribute "part" is valid,
-        and otherwise False.
+        return value
 
-        :returns: True if value of component is valid, False otherwise
-        :rtype: boolean
+    def _set_standard_value(self, value):
         """
+        Stores the standard value of component (WFN value).
 
-        comp_str = self._encoded_value.lower()
-        part_rxc = re.compile(CPEComponentSimple._PART_PATTERN)
-        return part_rxc.match(comp_str) is not None
-
-    def _is_valid_value(self):
+        :param string value: standard value of component, None to decode
+            the encoded value on next access
+        :returns: None
         """
-        Return True if the value of component in generic attribute is valid,
-        and otherwise False.
 
-        :returns: True if value is valid, False otherwise
-        :rtype: boolean
-        :exception: NotImplementedError - class method not implemented
-        """
+        self._decoded_value = value
 
-        errmsg = "Class method not implemented. Use the method of some child class"
-        raise NotImplementedError(errmsg)
+    #: Standard value of component (WFN value), decoded lazily
+    _standard_value = property(_get_standard_value, _set_standard_value)
 
     def _parse(self, comp_att):
         """
@@ -229,33 +458,11 @@ class CPEComponentSimple(CPEComponent):
         :exception: ValueError - incorrect value of component
         """
 
-        errmsg = "Invalid attribute '{0}'".format(comp_att)
-
-        if not CPEComponent.is_valid_attribute(comp_att):
-            raise ValueError(errmsg)
-
         comp_str = self._encoded_value
 
-        errmsg = "Invalid value of attribute '{0}': {1}".format(
-            comp_att, comp_str)
-
-        # Check part (system type) value
-        if comp_att == CPEComponentSimple.ATT_PART:
-            if not self._is_valid_part():
-                raise ValueError(errmsg)
-
-        # Check language value
-        elif comp_att == CPEComponentSimple.ATT_LANGUAGE:
-            if not self._is_valid_language():
-                raise ValueError(errmsg)
-
-        # Check edition value
-        elif comp_att == CPEComponentSimple.ATT_EDITION:
-            if not self._is_valid_edition():
-                raise ValueError(errmsg)
-
-        # Check other type of component value
-        elif not self._is_valid_value():
+        if not self.validate(comp_att, comp_str):
+            errmsg = "Invalid value of attribute '{0}': {1}".format(
+                comp_att, comp_str)
             raise ValueError(errmsg)
 
     def as_fs(self):
@@ -270,32 +477,7 @@ class CPEComponentSimple(CPEComponent):
         :rtype: string
         """
 
-        s = self._standard_value
-        result = []
-        idx = 0
-        while (idx < len(s)):
-
-            c = s[idx]  # get the idx'th character of s
-            if c != "\\":
-                # unquoted characters pass thru unharmed
-                result.append(c)
-            else:
-                # Escaped characters are examined
-                nextchr = s[idx + 1]
-
-                if (nextchr == ".") or (nextchr == "-") or (nextchr == "_"):
-                    # the period, hyphen and underscore pass unharmed
-                    result.append(nextchr)
-                    idx += 1
-                else:
-                    # all others retain escaping
-                    result.append("\\")
-                    result.append(nextchr)
-                    idx += 2
-                    continue
-            idx += 1
-
-        return "".join(result)
+        return CPEComponentSimple._bind_to_fs(self._standard_value)
 
     def as_uri_2_3(self):
         """
@@ -311,37 +493,8 @@ class CPEComponentSimple(CPEComponent):
         :rtype: string
         """
 
-        s = self._standard_value
-        result = []
-        idx = 0
-        while (idx < len(s)):
-            thischar = s[idx]  # get the idx'th character of s
-
-            # alphanumerics (incl. underscore) pass untouched
-            if (CPEComponentSimple._is_alphanum(thischar)):
-                result.append(thischar)
-                idx += 1
-                continue
-
-            # escape character
-            if (thischar == "\\"):
-                idx += 1
-                nxtchar = s[idx]
-                result.append(CPEComponentSimple._pct_encode_uri(nxtchar))
-                idx += 1
-                continue
-
-            # Bind the unquoted '?' special character to "%01".
-            if (thischar == "?"):
-                result.append("%01")
-
-            # Bind the unquoted '*' special character to "%02".
-            if (thischar == "*"):
-                result.append("%02")
-
-            idx += 1
-
-        return "".join(result)
+        return CPEComponentSimple._bind_to_uri(
+            self._standard_value, CPEComponentSimple._uri_unquoted)
 
     def as_wfn(self):
         """
@@ -364,19 +517,37 @@ class CPEComponentSimple(CPEComponent):
 
         return self._encoded_value
 
-    def set_value(self, comp_str, comp_att):
+    def set_value(self, comp_str, comp_att, validate=True):
         """
         Set the value of component. By default, the component has a simple
         value.
 
         :param string comp_str: new value of component
         :param string comp_att: attribute associated with value of component
+        :param boolean validate: False to not check the value of component,
+            if it comes from a trusted source
         :returns: None
         :exception: ValueError - incorrect value of component
+        :exception: TypeError - frozen component
         """
 
+        if self._frozen:
+            errmsg = "Frozen component can not be modified"
+            raise TypeError(errmsg)
+
         old_value = self._encoded_value
         self._encoded_value = comp_str
+        self._modifications += 1
+
+        if self._view is not None:
+            self._forget_view()
+
+        # The encoded value is converted to standard value (WFN) on first
+        # access to it: most of the times, only the encoded value is used
+        self._standard_value = None
+
+        if not validate:
+            return
 
         # Check the value of component
         try:
@@ -384,11 +555,9 @@ class CPEComponentSimple(CPEComponent):
         except ValueError:
             # Restore old value of component
             self._encoded_value = old_value
+            self._standard_value = None
             raise
 
-        # Convert encoding value to standard value (WFN)
-        self._decode()
-
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
@@ -0,0 +1,376 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module is used to convert streams of CPE Names of any version of
+Common Platform Enumeration (CPE) specification into a binding style of
+version 2.3, for example a whole dictionary file. It is also the command
+"cpe-convert".
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+import argparse
+import sys
+
+from .cpe import CPE
+from .cpetranscoder import CPETranscoder
+
+
+class CPEConverter(object):
+    """
+    Converts a stream of CPE Name strings of any version and style into
+    strings of a binding style of version 2.3: formatted string, URI or
+    WFN.
+
+    The names of version 2.3 are converted with CPETranscoder, without
+    creating CPE objects; the names of versions 2.2 and 1.1 are parsed.
+    The converted names are written to the output stream in input order,
+    a chunk of names in each write, and the invalid names to the error
+    stream, as lines with the line number, the input string and the
+    reason separated by tabs.
+
+    TEST: names of several versions and styles
+
+    >>> converter = CPEConverter(CPEConverter.BINDING_FS)
+    >>> list(converter.convert(['cpe:/a:microsoft:ie:8.0',
+    ...                         'wfn:[part="o", vendor="microsoft"]',
+    ...                         'cpe:/a:bad name',
+    ...                         'cpe:///microsoft:ie:8.0']))
+    ['cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*', 'cpe:2.3:o:microsoft:*:*:*:*:*:*:*:*:*', 'cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*']
+    >>> converter.errors
+    [(3, 'cpe:/a:bad name', 'Bad-formed CPE Name: it must not have whitespaces')]
+    """
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    # Binding styles of version 2.3 of output CPE Names
+
+    #: Formatted string
+    BINDING_FS = "fs"
+
+    #: URI
+    BINDING_URI = "uri"
+
+    #: Well-Formed Name
+    BINDING_WFN = "wfn"
+
+    #: List of binding styles of output CPE Names
+    BINDING_VALUES = (BINDING_FS, BINDING_URI, BINDING_WFN)
+
+    #: Default count of names of each chunk written
+    DEFAULT_CHUNK_SIZE = 1000
+
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Functions that bind the WFN values of a CPE Name, by binding style
+    _bind_values = {
+        BINDING_FS: CPETranscoder.bind_fs,
+        BINDING_URI: CPETranscoder.bind_uri,
+        BINDING_WFN: CPETranscoder.bind_wfn}
+
+    #: Methods of CPE objects that bind a CPE Name, by binding style
+    _bind_cpe = {
+        BINDING_FS: CPE.as_fs,
+        BINDING_URI: CPE.as_uri_2_3,
+        BINDING_WFN: CPE.as_wfn}
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __init__(self, binding, validate=True,
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Creates the converter of CPE Names.
+
+        :param string binding: binding style of output CPE Names
+        :param boolean validate: False to not check the values of
+            components, if the names come from a trusted source.
+            URIs are always validated, to detect their version
+        :param int chunk_size: count of names of each chunk written
+        :returns: None
+        :exception: ValueError - invalid binding style or chunk size
+        """
+
+        if binding not in CPEConverter.BINDING_VALUES:
+            errmsg = "Invalid binding style '{0}'".format(binding)
+            raise ValueError(errmsg)
+
+        if chunk_size < 1:
+            errmsg = "Invalid chunk size {0}".format(chunk_size)
+            raise ValueError(errmsg)
+
+        self.binding = binding
+        self.validate = validate
+        self.chunk_size = chunk_size
+
+        #: List of invalid names of convert: tuples (line number, input,
+        #: reason)
+        self.errors = []
+
+    def _bind(self, bindings, name):
+        """
+        Returns the CPE Name bound to the binding style.
+
+        :param dict bindings: functions that bind the CPE Name, by style
+        :param object name: WFN values of CPE Name or CPE object
+        :returns: CPE Name with the binding style
+        :rtype: string
+        :exception: ValueError - character not valid in binding style
+        """
+
+        try:
+            return bindings[self.binding](name)
+        except KeyError as e:
+            errmsg = "Character {0} can not be bound to {1}".format(
+                e, self.binding)
+            raise ValueError(errmsg)
+
+    def _chunks(self, iterable):
+        """
+        Generator of the chunks of the input strings converted: pairs of
+        list of converted names and list of invalid names, as tuples
+        (line number, input string, reason).
+
+        :param iterable iterable: strings to convert, as a list or a file.
+            Surrounding whitespaces are removed and blank strings skipped
+        :returns: generator of chunks
+        :rtype: generator
+        """
+
+        convert_name = self.convert_name
+        size = self.chunk_size
+        names = []
+        errors = []
+
+        for line, value in enumerate(iterable, 1):
+            cpe_str = value.strip()
+            if not cpe_str:
+                continue
+
+            try:
+                names.append(convert_name(cpe_str))
+            except (ValueError, NotImplementedError, TypeError) as e:
+                errors.append((line, cpe_str, str(e)))
+
+            if len(names) + len(errors) >= size:
+                yield names, errors
+                names = []
+                errors = []
+
+        if names or errors:
+            yield names, errors
+
+    def convert(self, iterable):
+        """
+        Generator of the input strings converted, in input order.
+        The invalid names are stored in the list "errors" as tuples
+        (line number, input string, reason).
+
+        :param iterable iterable: strings to convert, as a list or a file.
+            Surrounding whitespaces are removed and blank strings skipped
+        :returns: generator of converted names
+        :rtype: generator
+        """
+
+        for names, errors in self._chunks(iterable):
+            self.errors.extend(errors)
+            for cpe_str in names:
+                yield cpe_str
+
+    def convert_name(self, cpe_str):
+        """
+        Returns the input CPE Name converted to the binding style.
+
+        :param string cpe_str: CPE Name of any version and style
+        :returns: CPE Name with the binding style
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name, or with characters
+            not valid in the binding style
+        :exception: NotImplementedError - version of CPE not implemented
+        :exception: TypeError - incompatible version: CPE Name of
+            version 1.1 with two or more elements
+
+        TEST: an URI of version 2.2 with a value not valid in version 2.3
+
+        >>> converter = CPEConverter(CPEConverter.BINDING_WFN)
+        >>> converter.convert_name('cpe:/a:foo:bar:1.0%7e')
+        'wfn:[part="a", vendor="foo", product="bar", version="1\\\\.0\\\\~"]'
+        """
+
+        cpe_classes = CPE._sniff(cpe_str)
+
+        if not cpe_classes:
+            errmsg = 'Version of CPE not implemented'
+            raise NotImplementedError(errmsg)
+
+        style = getattr(cpe_classes[0], "STYLE", None)
+
+        # The version of an URI is detected validating it with each
+        # candidate class, even if it comes from a trusted source
+        check = self.validate or (len(cpe_classes) > 1)
+        error = None
+
+        if style is not None:
+            # Version 2.3 of CPE, converted without objects
+            unbind = getattr(CPETranscoder, "unbind_" + style.lower())
+
+            try:
+                values = unbind(cpe_str, check)
+            except ValueError as e:
+                error = e
+            else:
+                return self._bind(CPEConverter._bind_values, values)
+
+            cpe_classes = cpe_classes[1:]
+
+        for cpe_class in cpe_classes:
+            try:
+                c = cpe_class(cpe_str, validate=check)
+            except (ValueError, NotImplementedError) as e:
+                # Keep the error of the most likely version
+                if error is None:
+                    error = e
+            else:
+                return self._bind(CPEConverter._bind_cpe, c)
+
+        raise error
+
+    def write(self, iterable, output, errors=None):
+        """
+        Writes the input strings converted to the output stream, in input
+        order, and the invalid names to the error stream.
+
+        :param iterable iterable: strings to convert, as a list or a file.
+            Surrounding whitespaces are removed and blank strings skipped
+        :param file output: stream of converted names, one per line
+        :param file errors: stream of invalid names, one per line with
+            the line number, the input string and the reason separated
+            by tabs; the invalid names are skipped if it is None
+        :returns: count of names converted and count of invalid names
+        :rtype: tuple
+        """
+
+        count = 0
+        count_errors = 0
+
+        for names, chunk_errors in self._chunks(iterable):
+            if names:
+                count += len(names)
+                names.append("")
+                output.write("\n".join(names))
+
+            if chunk_errors:
+                count_errors += len(chunk_errors)
+                if errors is not None:
+                    errors.write("".join(["{0}\t{1}\t{2}\n".format(*e)
+                                          for e in chunk_errors]))
+
+        return count, count_errors
+
+
+def _open(path, mode, buffer_size, default):
+    """
+    Returns the file of input path, or the default stream if the path
+    is "-".
+    """
+
+    if path == "-":
+        return default
+
+    return open(path, mode, buffer_size)
+
+
+def main(argv=None):
+    """
+    Converts the CPE Names of a file, or of the standard input, into a
+    binding style of version 2.3. Entry point of command "cpe-convert".
+
+    :param list argv: arguments of command, by default sys.argv[1:]
+    :returns: exit status: 0 if all names were converted, 1 otherwise
+    :rtype: int
+    """
+
+    parser = argparse.ArgumentParser(
+        prog="cpe-convert",
+        description="Convert CPE Names of any version into a binding "
+                    "style of version 2.3, one name per line.")
+    parser.add_argument("input", nargs="?", default="-",
+                        help="file of CPE Names, standard input by default")
+    parser.add_argument("output", nargs="?", default="-",
+                        help="file of converted names, standard output by "
+                             "default")
+    parser.add_argument("-t", "--to", dest="binding",
+                        choices=CPEConverter.BINDING_VALUES,
+                        default=CPEConverter.BINDING_FS,
+                        help="binding style of converted names "
+                             "(default: %(default)s)")
+    parser.add_argument("-e", "--errors", default="-",
+                        help="file of invalid names, standard error by "
+                             "default")
+    parser.add_argument("-c", "--chunk-size", type=int,
+                        default=CPEConverter.DEFAULT_CHUNK_SIZE,
+                        help="count of names of each write "
+                             "(default: %(default)s)")
+    parser.add_argument("-b", "--buffer-size", type=int, default=-1,
+                        help="size in bytes of the buffers of files "
+                             "(default: system default)")
+    parser.add_argument("-m", "--max-length", type=int,
+                        default=CPE.DEFAULT_MAX_LENGTH,
+                        help="maximum length of the names, longer names "
+                             "are invalid (default: %(default)s)")
+    parser.add_argument("--trusted", action="store_true",
+                        help="do not check the values of the names, "
+                             "if they come from a trusted source")
+
+    args = parser.parse_args(argv)
+
+    try:
+        converter = CPEConverter(args.binding, not args.trusted,
+                                 args.chunk_size)
+        CPE.set_max_length(args.max_length)
+    except ValueError as e:
+        parser.error(str(e))
+
+    size = args.buffer_size
+    names = _open(args.input, "r", size, sys.stdin)
+    output = _open(args.output, "w", size, sys.stdout)
+    errors = _open(args.errors, "w", size, sys.stderr)
+
+    try:
+        count, count_errors = converter.write(names, output, errors)
+    finally:
+        for f in (names, output, errors):
+            if f not in (sys.stdin, sys.stdout, sys.stderr):
+                f.close()
+
+    return 1 if count_errors else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
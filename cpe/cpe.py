@@ -30,6 +30,9 @@ feedback about it, please contact:
 - Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
 """
 from collections import OrderedDict
+from operator import itemgetter
+import random
+import weakref
 
 from .comp.cpecomp import CPEComponent
 from .comp.cpecomp2_3_uri import CPEComponent2_3_URI
@@ -41,6 +44,113 @@ from .comp.cpecomp_empty import CPEComponentEmpty
 from .comp.cpecomp_anyvalue import CPEComponentAnyValue
 from .comp.cpecomp_undefined import CPEComponentUndefined
 from .comp.cpecomp_notapplicable import CPEComponentNotApplicable
+from .cpecache import CPECache
+
+
+class _FrozenElement(dict):
+    """
+    Represents an element of a frozen CPE Name: a dictionary of components
+    that can not be modified.
+    """
+
+    def _check_mutable(self, *args, **kwargs):
+        """
+        Raises an exception, the element is immutable.
+
+        :exception: TypeError - frozen element
+        """
+
+        errmsg = "Frozen CPE Name can not be modified"
+        raise TypeError(errmsg)
+
+    __setitem__ = __delitem__ = _check_mutable
+    clear = pop = popitem = setdefault = update = _check_mutable
+
+
+class _FlatView(object):
+    """
+    Represents the attributes of a parsed CPE Name with a only element,
+    stored flat in the order of CPEComponent.CPE_COMP_KEYS_EXTENDED:
+    the part of the element and, stored on first use, its components,
+    the tag of each component, the count of components set, the
+    values returned by get_attribute_values and the canonical key.
+
+    The view is not valid after the CPE Name is modified.
+    """
+
+    __slots__ = ("part", "components", "tags", "count", "values", "key",
+                 "valid", "__weakref__")
+
+    def __init__(self, part):
+        self.part = part
+        self.components = None
+        self.tags = None
+        self.count = None
+        self.values = None
+        self.key = None
+        self.valid = True
+
+
+def _forgetting(method):
+    """
+    Returns the method of container that marks the flat view of its
+    CPE Name as not valid before modifying the container.
+    """
+
+    def forget(self, *args, **kwargs):
+        view = getattr(self, "_view", None)
+        if view is not None:
+            view.valid = False
+
+        return method(self, *args, **kwargs)
+
+    return forget
+
+
+class _Element(dict):
+    """
+    Represents an element of a parsed CPE Name: a dictionary of components
+    that forgets the flat view of the CPE Name when it is modified.
+    """
+
+    __slots__ = ("_view",)
+
+    __setitem__ = _forgetting(dict.__setitem__)
+    __delitem__ = _forgetting(dict.__delitem__)
+    clear = _forgetting(dict.clear)
+    pop = _forgetting(dict.pop)
+    popitem = _forgetting(dict.popitem)
+    setdefault = _forgetting(dict.setdefault)
+    update = _forgetting(dict.update)
+
+
+class _Elements(list):
+    """
+    Represents the element list of a part of a parsed CPE Name that
+    forgets the flat view of the CPE Name when it is modified.
+    """
+
+    __slots__ = ("_view",)
+
+    __setitem__ = _forgetting(list.__setitem__)
+    __delitem__ = _forgetting(list.__delitem__)
+    __iadd__ = _forgetting(list.__iadd__)
+    __imul__ = _forgetting(list.__imul__)
+    append = _forgetting(list.append)
+    extend = _forgetting(list.extend)
+    insert = _forgetting(list.insert)
+    pop = _forgetting(list.pop)
+    remove = _forgetting(list.remove)
+    reverse = _forgetting(list.reverse)
+    sort = _forgetting(list.sort)
+
+    if hasattr(list, "clear"):
+        # Python 3
+        clear = _forgetting(list.clear)
+    else:
+        # Python 2
+        __setslice__ = _forgetting(list.__setslice__)
+        __delslice__ = _forgetting(list.__delslice__)
 
 
 class CPE(dict):
@@ -95,6 +205,50 @@ class CPE(dict):
     #: Version of CPE Name
     VERSION = VERSION_UNDEFINED
 
+    # Prefixes used to detect the version and style of a CPE Name
+
+    #: Prefix of CPE Names of version 2.3 with formatted string style
+    PREFIX_FS = "cpe:2.3:"
+
+    #: Prefix of CPE Names of version 2.3 with WFN style
+    PREFIX_WFN = "wfn:["
+
+    #: Prefix of CPE Names of versions 2.2 and 2.3 with URI style
+    PREFIX_URI = "cpe:/"
+
+    #: Prefix of CPE Names of version 1.1 with hardware part undefined
+    PREFIX_1_1 = "cpe://"
+
+    #: Default maximum length of CPE Names parsed
+    DEFAULT_MAX_LENGTH = 4096
+
+    # Tags of the components in the flat view of CPE Name
+
+    #: String value
+    _TAG_VALUE = 0
+    #: Logical value ANY
+    _TAG_ANY = 1
+    #: Logical value NA
+    _TAG_NA = 2
+    #: Undefined value
+    _TAG_UNDEFINED = 3
+    #: Empty value
+    _TAG_EMPTY = 4
+
+    # Keys of the logical components in the canonical key of CPE Name
+
+    #: Logical value ANY, and the undefined and empty values equal to it
+    _KEY_ANY = _TAG_ANY
+    #: Logical value NA
+    _KEY_NA = _TAG_NA
+
+    #: Mark of the key of a negated value of version 1.1
+    _KEY_NEGATED = "~"
+
+    #: Position of each attribute in the flat view of CPE Name
+    _ATT_IDX = dict((ck, i) for i, ck in enumerate(
+        CPEComponent.CPE_COMP_KEYS_EXTENDED))
+
     ###############
     #  VARIABLES  #
     ###############
@@ -107,10 +261,502 @@ class CPE(dict):
         (CPEComponent.VALUE_PART_APP, KEY_APP),
         (CPEComponent.VALUE_PART_UNDEFINED, KEY_UNDEFINED)))
 
+    #: Classes of CPE Names by version and style, resolved on first use
+    #: to avoid circular imports
+    _cpe_classes = None
+
+    #: Process-wide cache of parsed CPE Names, disabled if None
+    _cache = None
+
+    #: True if the CPE Name can not be modified
+    _frozen = False
+
+    #: Fraction of CPE Names parsed without validation that are checked
+    #: again with validation, to catch bad input in trusted sources
+    _trusted_check_rate = 0.0
+
+    #: Maximum length of CPE Names parsed, unlimited if None
+    _max_length = DEFAULT_MAX_LENGTH
+
+    #: Bound forms of CPE Name already computed, by binding
+    _bound_forms = None
+
+    #: Components of CPE Name when its bound forms were computed, and
+    #: their identities and counts of modifications: if they change, the
+    #: bound forms are computed again
+    _bound_components = None
+    _bound_stamp = None
+
+    #: Count of bound forms returned without computing them, and computed
+    _bound_hits = 0
+    _bound_misses = 0
+
+    #: Keys of bindings
+    _BINDING_FS = "fs"
+    _BINDING_URI = "uri"
+    _BINDING_WFN = "wfn"
+
+    #: Flat view of the attributes of CPE Name, built when it is parsed
+    _flat_view = None
+
+    #: Canonical key of frozen CPE Name, stored the first time
+    _key = None
+
+    #: Key of each tag of logical value in the canonical key
+    _keys_by_tag = {
+        _TAG_ANY: _KEY_ANY,
+        _TAG_NA: _KEY_NA,
+        _TAG_UNDEFINED: _KEY_ANY,
+        _TAG_EMPTY: _KEY_ANY}
+
+    #: Returns the components of an element, in the order of
+    #: CPEComponent.CPE_COMP_KEYS_EXTENDED
+    _get_components = staticmethod(itemgetter(
+        *CPEComponent.CPE_COMP_KEYS_EXTENDED))
+
+    #: Tag of each class of logical component in the flat view, the
+    #: other components have string values
+    _tags_by_class = {
+        CPEComponentAnyValue: _TAG_ANY,
+        CPEComponentNotApplicable: _TAG_NA,
+        CPEComponentUndefined: _TAG_UNDEFINED,
+        CPEComponentEmpty: _TAG_EMPTY}
+
+    #: Value returned by get_attribute_values for each tag of logical
+    #: value, to store the values in the flat view of CPE Name
+    _flat_logical_values = None
+
+    #: Value bound to URI for each tag of logical value: the undefined
+    #: and empty values are bound as logical value ANY
+    _uri_logical_values = {
+        _TAG_ANY: CPEComponent2_3_URI.VALUE_ANY,
+        _TAG_NA: CPEComponent2_3_URI.VALUE_NA,
+        _TAG_UNDEFINED: CPEComponent2_3_URI.VALUE_ANY,
+        _TAG_EMPTY: CPEComponent2_3_URI.VALUE_ANY}
+
     ###################
     #  CLASS METHODS  #
     ###################
 
+    @classmethod
+    def _check_length(cls, cpe_str):
+        """
+        Checks that the CPE Name is not longer than the maximum length
+        of CPE Names parsed.
+
+        :param string cpe_str: CPE Name string
+        :returns: None
+        :exception: ValueError - CPE Name too long
+        """
+
+        max_length = CPE._max_length
+        if (max_length is not None) and (len(cpe_str) > max_length):
+            errmsg = "Bad-formed CPE Name: longer than {0} characters".format(
+                max_length)
+            raise ValueError(errmsg)
+
+    @classmethod
+    def _create(cls, cpe_str, validate=True):
+        """
+        Returns a new CPE Name of this class, parsed without looking it up
+        in the cache of CPE Names.
+
+        :param string cpe_str: CPE Name string
+        :param boolean validate: False to not check the values of components
+        :returns: CPE object of this class
+        :rtype: CPE
+        :exception: ValueError - bad-formed CPE Name
+        """
+
+        c = dict.__new__(cls)
+        c.__init__(cpe_str, validate=validate)
+        return c
+
+    @classmethod
+    def _get_component_key(cls, comp, tag):
+        """
+        Returns the key of the component in the canonical key of CPE Name:
+        its value decoded, or the key of its tag if it is a logical value.
+        Equal components have the same key.
+
+        :param CPEComponent comp: component
+        :param int tag: tag of component
+        :returns: key of component
+        :rtype: string, tuple or int
+        """
+
+        if tag != CPE._TAG_VALUE:
+            return CPE._keys_by_tag[tag]
+
+        value = comp._standard_value
+
+        if isinstance(value, list):
+            # Version 1.1: a value with a only element is equal to the
+            # value of other versions
+            if len(value) == 1:
+                value = value[0]
+            else:
+                value = tuple(value)
+
+        if comp._is_negated:
+            # The elements of version 1.1 never are the mark of negation
+            return (CPE._KEY_NEGATED, value)
+
+        return value
+
+    @classmethod
+    def _new_component(cls, comp_class, comp_str, comp_att, validate=True):
+        """
+        Returns a component of a CPE Name being parsed. The CPE Names
+        stored in the cache of CPE Names are frozen, so they get the
+        shared components of comp_class; the rest of CPE Names get new
+        components, which can be modified.
+
+        :param class comp_class: class of component
+        :param string comp_str: value of component
+        :param string comp_att: attribute associated with value of component
+        :param boolean validate: False to not check the value of component
+        :returns: component
+        :rtype: CPEComponentSimple
+        :exception: ValueError - incorrect value of component
+        """
+
+        if validate and (CPE._cache is not None):
+            return comp_class.intern(comp_str, comp_att, validate)
+
+        return comp_class(comp_str, comp_att, validate)
+
+    @classmethod
+    def _new_or_cached(cls, cpe_str):
+        """
+        Returns the CPE Name of this class stored in the cache of CPE
+        Names with the input string, or a new empty object of this class.
+
+        :param string cpe_str: CPE Name string
+        :returns: CPE object of this class
+        :rtype: CPE
+        """
+
+        cache = CPE._cache
+        if cache is not None:
+            c = cache.get((cpe_str, cls))
+            if c is not None:
+                return c
+
+        return dict.__new__(cls)
+
+    @classmethod
+    def disable_cache(cls):
+        """
+        Disables the cache of CPE Names. The CPE Names previously returned
+        from cache remain frozen.
+
+        :returns: None
+        """
+
+        CPE._cache = None
+
+    @classmethod
+    def enable_cache(cls, maxsize=CPECache.DEFAULT_MAXSIZE):
+        """
+        Enables a process-wide cache of parsed CPE Names, keyed by the
+        CPE Name string and the requested version or class, with a maximum
+        size and least recently used eviction.
+
+        While the cache is enabled, the CPE Names created with CPE class
+        or any class of version or style are frozen, because they can be
+        returned again for the same string.
+
+        :param int maxsize: maximum count of CPE Names stored in cache
+        :returns: the cache of CPE Names, with counters of hits and misses
+        :rtype: CPECache
+        :exception: ValueError - invalid maximum size
+
+        TEST: the same string returns the same frozen CPE Name
+
+        >>> cache = CPE.enable_cache(100)
+        >>> c = CPE('cpe:/a:mozilla:firefox:2.0')
+        >>> CPE('cpe:/a:mozilla:firefox:2.0') is c
+        True
+        >>> c.is_frozen()
+        True
+        >>> (cache.hits, cache.misses)
+        (1, 1)
+        >>> CPE.disable_cache()
+        """
+
+        CPE._cache = CPECache(maxsize)
+        return CPE._cache
+
+    @classmethod
+    def check_trusted(cls, rate):
+        """
+        Sets the fraction of CPE Names parsed without validation that are
+        checked again with validation, as a debug option: an exception is
+        raised if the trusted source has a bad-formed CPE Name.
+
+        :param float rate: fraction of CPE Names to check, between 0 (none)
+            and 1 (all of them)
+        :returns: None
+        :exception: ValueError - invalid fraction of CPE Names
+
+        TEST: a bad-formed trusted CPE Name
+
+        >>> from .cpe2_3_fs import CPE2_3_FS
+        >>> cpe_str = 'cpe:2.3:a:micro$oft:windows:*:*:*:*:*:*:*:*'
+        >>> CPE.check_trusted(1)
+        >>> CPE2_3_FS(cpe_str, validate=False)
+        Traceback (most recent call last):
+        ValueError: Bad-formed trusted CPE Name 'cpe:2.3:a:micro$oft:windows:*:*:*:*:*:*:*:*'
+        >>> CPE.check_trusted(0)
+        >>> CPE2_3_FS(cpe_str, validate=False).get_vendor()
+        ['micro$oft']
+        """
+
+        if not (0 <= rate <= 1):
+            errmsg = "Invalid rate of checks '{0}'".format(rate)
+            raise ValueError(errmsg)
+
+        CPE._trusted_check_rate = rate
+
+    @classmethod
+    def get_bound_stats(cls):
+        """
+        Returns the count of bound forms of CPE Names (formatted strings,
+        URIs and WFNs) returned without computing them, because they were
+        computed before, and the count of bound forms computed.
+
+        :returns: hits and misses
+        :rtype: tuple
+
+        TEST: a CPE Name bound twice
+
+        >>> CPE.reset_bound_stats()
+        >>> c = CPE('cpe:/a:mozilla:firefox:2.0')
+        >>> c.as_fs() == c.as_fs()
+        True
+        >>> CPE.get_bound_stats()
+        (1, 1)
+        """
+
+        return (CPE._bound_hits, CPE._bound_misses)
+
+    @classmethod
+    def get_cache(cls):
+        """
+        Returns the cache of CPE Names, or None if it is disabled.
+
+        :returns: the cache of CPE Names
+        :rtype: CPECache
+        """
+
+        return CPE._cache
+
+    @classmethod
+    def _get_cpe_classes(cls):
+        """
+        Returns the classes of implemented versions and styles of CPE Names.
+
+        :returns: Dictionary with the relation between a version or a
+            version 2.3 style and its class
+        :rtype: dict
+        """
+
+        if CPE._cpe_classes is None:
+            from .cpe1_1 import CPE1_1
+            from .cpe2_2 import CPE2_2
+            from .cpe2_3 import CPE2_3
+            from .cpe2_3_fs import CPE2_3_FS
+            from .cpe2_3_uri import CPE2_3_URI
+            from .cpe2_3_wfn import CPE2_3_WFN
+
+            CPE._cpe_classes = {
+                CPE.VERSION_1_1: CPE1_1,
+                CPE.VERSION_2_2: CPE2_2,
+                CPE.VERSION_2_3: CPE2_3,
+                CPE2_3.STYLE_FS: CPE2_3_FS,
+                CPE2_3.STYLE_URI: CPE2_3_URI,
+                CPE2_3.STYLE_WFN: CPE2_3_WFN}
+
+        return CPE._cpe_classes
+
+    @classmethod
+    def _sniff(cls, cpe_str):
+        """
+        Returns the classes able to parse the input CPE Name, in the order
+        in which they must be tried, looking only at the prefix of the
+        string.
+
+        - "cpe:2.3:" is a formatted string of version 2.3.
+        - "wfn:[" is a WFN of version 2.3.
+        - "cpe://" (and "cpe:/" followed by a value that is not a
+          part of system) is a CPE Name of version 1.1.
+        - Any other "cpe:/" is an URI of version 2.3, an URI of version
+          2.2 (for values with characters that the 2.3 URI does not allow)
+          or a CPE Name of version 1.1, in this order.
+
+        :param string cpe_str: CPE Name string
+        :returns: candidate classes of CPE Name
+        :rtype: tuple
+
+        TEST: formatted string
+
+        >>> CPE._sniff('cpe:2.3:a:microsoft:windows:xp:*:*:*:*:*:*:*')
+        (<class 'cpe.cpe2_3_fs.CPE2_3_FS'>,)
+
+        TEST: version 1.1
+
+        >>> CPE._sniff('cpe://microsoft:windows:xp')
+        (<class 'cpe.cpe1_1.CPE1_1'>,)
+
+        TEST: unknown prefix
+
+        >>> CPE._sniff('foo')
+        ()
+        """
+
+        classes = CPE._get_cpe_classes()
+        styles = classes[CPE.VERSION_2_3]
+
+        # CPE Names are case-insensitive
+        head = cpe_str[0:len(CPE.PREFIX_FS)].lower()
+
+        if head.startswith(CPE.PREFIX_FS):
+            return (classes[styles.STYLE_FS],)
+
+        if head.startswith(CPE.PREFIX_WFN):
+            return (classes[styles.STYLE_WFN],)
+
+        if head.startswith(CPE.PREFIX_1_1):
+            return (classes[CPE.VERSION_1_1],)
+
+        if head.startswith(CPE.PREFIX_URI):
+            # The first value of an URI is the part attribute: empty or
+            # a type of system with a single letter
+            pos = len(CPE.PREFIX_URI)
+            part = head[pos:pos + 1]
+            if (part in ("", ":") or
+               (part in CPEComponent.SYSTEM_VALUES and
+                head[pos + 1:pos + 2] in ("", ":"))):
+
+                return (classes[styles.STYLE_URI],
+                        classes[CPE.VERSION_2_2],
+                        classes[CPE.VERSION_1_1])
+            else:
+                return (classes[CPE.VERSION_1_1],)
+
+        return ()
+
+    @classmethod
+    def reset_bound_stats(cls):
+        """
+        Sets to zero the counts of bound forms of CPE Names returned
+        without computing them and computed.
+
+        :returns: None
+        """
+
+        CPE._bound_hits = 0
+        CPE._bound_misses = 0
+
+    @classmethod
+    def set_max_length(cls, length):
+        """
+        Sets the maximum length of CPE Names parsed: the longer strings
+        are rejected before parsing them, because they can come from
+        untrusted clients.
+
+        :param int length: maximum count of characters of CPE Names,
+            or None to parse CPE Names of any length
+        :returns: None
+        :exception: ValueError - invalid maximum length
+
+        TEST: a CPE Name longer than the maximum length
+
+        >>> CPE.set_max_length(20)
+        >>> CPE('cpe:/a:microsoft:internet_explorer:8.0')
+        Traceback (most recent call last):
+        ValueError: Bad-formed CPE Name: longer than 20 characters
+        >>> CPE.set_max_length(CPE.DEFAULT_MAX_LENGTH)
+        """
+
+        if (length is not None) and (length < 1):
+            errmsg = "Invalid maximum length '{0}'".format(length)
+            raise ValueError(errmsg)
+
+        CPE._max_length = length
+
+    @classmethod
+    def try_parse(cls, cpe_str, version=None):
+        """
+        Returns the CPE Name object associated with the input string,
+        or None if the string is not a valid CPE Name.
+
+        :param string cpe_str: CPE Name string
+        :param string version: version of CPE specification of CPE Name,
+            used only by generic CPE class
+        :returns: CPE object or None
+        :rtype: CPE
+
+        TEST: valid CPE Name
+
+        >>> CPE.try_parse('cpe:/a:microsoft:windows:xp').VERSION
+        '2.3'
+
+        TEST: invalid CPE Name
+
+        >>> CPE.try_parse('cpe:2.3:a:microsoft') is None
+        True
+        """
+
+        try:
+            if cls is CPE:
+                return CPE(cpe_str, version)
+            else:
+                return cls(cpe_str)
+        except (ValueError, NotImplementedError):
+            return None
+
+    @classmethod
+    def parse_many(cls, iterable, version=None, on_error="collect",
+                   validate=True):
+        """
+        Parses a stream of strings, for example the lines of a dictionary
+        file, and returns an iterator of the valid CPE Names.
+
+        The invalid names are stored in the list "errors" of the iterator
+        as tuples (line number, input string, reason), instead of raising
+        an exception, unless on_error is "raise". If on_error is "ignore",
+        they are skipped silently.
+
+        :param iterable iterable: strings to parse
+        :param string version: version of CPE specification of CPE Names,
+            used only by generic CPE class
+        :param string on_error: action when a string is not a valid
+            CPE Name: "collect", "ignore" or "raise"
+        :param boolean validate: False to not check the values of
+            components, if the strings come from a trusted source
+        :returns: iterator of CPE Names
+        :rtype: CPEBatch
+
+        TEST: names of several versions with an invalid one
+
+        >>> names = CPE.parse_many(['cpe:/a:mozilla:firefox', 'foo',
+        ...                         'cpe://microsoft:windows:xp'])
+        >>> [c.VERSION for c in names]
+        ['2.3', '1.1']
+        >>> names.errors
+        [(2, 'foo', 'Version of CPE not implemented')]
+        """
+
+        from .cpebatch import CPEBatch
+
+        if cls is CPE:
+            return CPEBatch(iterable, version, on_error, validate)
+        else:
+            return CPEBatch(iterable, on_error=on_error, validate=validate,
+                            cpe_class=cls)
+
     @classmethod
     def _trim(cls, s):
         """
@@ -149,6 +795,18 @@ class CPE(dict):
     #  OBJECT METHODS  #
     ####################
 
+    def __delitem__(self, key):
+        """
+        Deletes a part of CPE Name.
+
+        :param string key: part of CPE Name
+        :returns: None
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        dict.__delitem__(self, key)
+
     def __eq__(self, other):
         """
         Returns True if other (first element of operation) and
@@ -160,6 +818,29 @@ class CPE(dict):
         :rtype: boolean
         """
 
+        if isinstance(other, CPE):
+            key = self._get_known_key()
+            if key is not None:
+                key_other = other._get_known_key()
+                if key_other is not None:
+                    # Equal CPE Names have the same canonical key
+                    return key == key_other
+
+        view = self._get_flat_view()
+        if (view is not None) and isinstance(other, CPE):
+            view_other = other._get_flat_view()
+            if view_other is not None:
+                if view.part != view_other.part:
+                    return False
+
+                for comp, comp_other in zip(view.components,
+                                            view_other.components):
+                    # The components are usually shared interned objects
+                    if (comp is not comp_other) and (comp != comp_other):
+                        return False
+
+                return True
+
         for part in CPE.CPE_PART_KEYS:
             elements_self = self.get(part)
             elements_other = other.get(part)
@@ -198,6 +879,14 @@ class CPE(dict):
         count = 0
         errmsg = "Component index of CPE Name out of range"
 
+        view = self._get_flat_view()
+        if (view is not None) and isinstance(i, int):
+            if ((0 <= i < len(view.tags)) and
+               (view.tags[i] != CPE._TAG_UNDEFINED)):
+                return view.components[i]
+            else:
+                raise IndexError(errmsg)
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
@@ -213,14 +902,52 @@ class CPE(dict):
 
         raise IndexError(errmsg)
 
+    def __hash__(self):
+        """
+        Returns the hash of the canonical key of CPE Name. Only frozen
+        CPE Names can be hashed, because the other ones can be modified.
+
+        :returns: hash of CPE Name
+        :rtype: int
+        :exception: TypeError - CPE Name not frozen
+
+        TEST: a frozen CPE Name
+
+        >>> c = CPE('cpe:/a:mozilla:firefox:2.0')
+        >>> c.freeze()
+        >>> hash(c) == hash(c.get_key())
+        True
+        """
+
+        if not self._frozen:
+            errmsg = "CPE Name not frozen can not be hashed"
+            raise TypeError(errmsg)
+
+        return hash(self.get_key())
+
     def __init__(self, cpe_str, *args, **kwargs):
         """
         Store the CPE Name.
 
+        The keyword argument "validate" set to False parses the CPE Name
+        from a trusted source, for example the official dictionary: the
+        CPE Name is split and its values are not checked, but the object
+        is the same than a validated one. These CPE Names are not stored
+        in the cache of CPE Names.
+
         :param string cpe_str: CPE Name
         :returns: None
+        :exception: ValueError - bad-formed CPE Name
         """
 
+        # The factory returns an object of a subclass already initialized
+        # with this CPE Name, then Python calls this method again:
+        # the CPE Name is not parsed twice
+        if self.__dict__.get("cpe_str") == cpe_str:
+            return
+
+        CPE._check_length(cpe_str)
+
         # The original CPE Name as string
         self.cpe_str = cpe_str
 
@@ -230,8 +957,23 @@ class CPE(dict):
         # all CPE Names should be written in lowercase.
         self._str = cpe_str.lower()
 
+        validate = kwargs.get("validate", True)
+
         # Check if CPE Name is correct
-        self._parse()
+        self._parse(validate)
+        self._create_flat_view()
+
+        if not validate:
+            rate = CPE._trusted_check_rate
+            if rate and random.random() < rate:
+                self._check_trusted()
+            return
+
+        cache = CPE._cache
+        if cache is not None:
+            # Cached CPE Names are shared, so they must be immutable
+            self.freeze()
+            cache.put((cpe_str, self.__class__), self)
 
     def __len__(self):
         """
@@ -249,6 +991,10 @@ class CPE(dict):
         6
         """
 
+        view = self._get_flat_view()
+        if view is not None:
+            return view.count
+
         count = 0
 
         for part in CPE.CPE_PART_KEYS:
@@ -261,43 +1007,56 @@ class CPE(dict):
 
         return count
 
-    def __new__(cls, cpe_str, version=None, *args, **kwargs):
+    def __new__(cls, cpe_str, version=None, validate=True, *args, **kwargs):
         """
         Generator of CPE Names.
 
         :param string cpe_str: CPE Name string
         :param string version: version of CPE specification of CPE Name
+        :param boolean validate: False to not check the values of
+            components, if the CPE Name comes from a trusted source.
+            URIs are always validated if the version is not set, to
+            detect it
         :returns: CPE object with version of CPE detected correctly
         :rtype: CPE
         :exception: NotImplementedError - incorrect CPE Name or
             version of CPE not implemented
+        :exception: ValueError - CPE Name longer than the maximum length
 
         This class implements the factory pattern, that is,
         this class centralizes the creation of objects of a particular
         CPE version, hiding the user the requested object instance.
         """
 
-        from .cpe1_1 import CPE1_1
-        from .cpe2_2 import CPE2_2
-        from .cpe2_3 import CPE2_3
-
         # List of implemented versions of CPE Names
-        #
-        # Note: Order matters here, because some regexp can parse
-        #       multiple versions at once.
-        _CPE_VERSIONS = OrderedDict((
-            (CPE.VERSION_2_3, CPE2_3),
-            (CPE.VERSION_2_2, CPE2_2),
-            (CPE.VERSION_1_1, CPE1_1),))
+        _CPE_VERSIONS = (CPE.VERSION_2_2, CPE.VERSION_1_1)
 
         errmsg = 'Version of CPE not implemented'
 
+        CPE._check_length(cpe_str)
+
+        cache = CPE._cache
+        if cache is not None:
+            key = (cpe_str, version)
+            c = cache.get(key)
+            if c is not None:
+                return c
+
         if version is None:
-            # Detect CPE version of input CPE Name
-            for v in _CPE_VERSIONS:
+            # Detect CPE version of input CPE Name by its prefix.
+            #
+            # Note: Order matters here, because some regexp can parse
+            #       multiple versions at once.
+            cpe_classes = CPE._sniff(cpe_str)
+
+            # The version of an URI is detected validating it with each
+            # candidate class, even if it comes from a trusted source
+            check = validate or (len(cpe_classes) > 1)
+
+            for cpe_class in cpe_classes:
                 try:
                     # Validate CPE Name
-                    c = _CPE_VERSIONS[v](cpe_str)
+                    c = cpe_class._create(cpe_str, check)
                 except ValueError:
                     # Test another version
                     continue
@@ -305,18 +1064,25 @@ class CPE(dict):
                     # Test another version
                     continue
                 else:
-                    # Version detected
-                    return c
-
-            raise NotImplementedError(errmsg)
+                    break
+            else:
+                raise NotImplementedError(errmsg)
 
+        elif version == CPE.VERSION_2_3:
+            # Detect CPE style of input CPE Name, validate CPE Name
+            c = CPE._get_cpe_classes()[version]._create_style(cpe_str, validate)
         elif version in _CPE_VERSIONS:
             # Correct input version, validate CPE Name
-            return _CPE_VERSIONS[version](cpe_str)
+            c = CPE._get_cpe_classes()[version]._create(cpe_str, validate)
         else:
             # Invalid CPE version
             raise NotImplementedError(errmsg)
 
+        if (cache is not None) and validate:
+            cache.put(key, c)
+
+        return c
+
     def __repr__(self):
         """
         Returns a unambiguous representation of CPE Name.
@@ -376,6 +1142,19 @@ class CPE(dict):
 
         return "\n".join(txtParts)
 
+    def __setitem__(self, key, value):
+        """
+        Stores a part of CPE Name.
+
+        :param string key: part of CPE Name
+        :param list value: elements of part
+        :returns: None
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        dict.__setitem__(self, key, value)
+
     def __str__(self):
         """
         Returns a human-readable representation of CPE Name.
@@ -386,6 +1165,44 @@ class CPE(dict):
 
         return "CPE v{0}: {1}".format(self.VERSION, self.cpe_str)
 
+    def _check_mutable(self):
+        """
+        Checks if the CPE Name can be modified, before modifying it:
+        the bound forms computed are forgotten.
+
+        :returns: None
+        :exception: TypeError - frozen CPE Name
+        """
+
+        if self._frozen:
+            errmsg = "Frozen CPE Name can not be modified"
+            raise TypeError(errmsg)
+
+        if self._bound_forms is not None:
+            self._bound_forms = None
+
+        if self._flat_view is not None:
+            self._flat_view.valid = False
+
+    def _check_trusted(self):
+        """
+        Checks the CPE Name parsed without validation parsing it again with
+        validation.
+
+        :returns: None
+        :exception: ValueError - bad-formed CPE Name
+        """
+
+        errmsg = "Bad-formed trusted CPE Name '{0}'".format(self.cpe_str)
+
+        try:
+            c = self.__class__._create(self.cpe_str)
+        except ValueError:
+            raise ValueError(errmsg)
+
+        if c != self:
+            raise ValueError(errmsg)
+
     def _create_cpe_parts(self, system, components):
         """
         Create the structure to store the input type of system associated
@@ -407,6 +1224,78 @@ class CPE(dict):
         pk = CPE._system_and_parts[system]
         self[pk] = elements
 
+    def _create_flat_view(self):
+        """
+        Creates the flat view of the attributes of the CPE Name just
+        parsed, if it has a only element: its parts and element are
+        replaced with containers that forget the view when they are
+        modified. The view is filled on first use.
+
+        :returns: None
+        """
+
+        part = None
+
+        for pk in CPE.CPE_PART_KEYS:
+            elements = dict.get(self, pk)
+            if elements:
+                if (part is not None) or (len(elements) > 1):
+                    return
+                part = pk
+
+        if part is None:
+            return
+
+        view = _FlatView(part)
+
+        elem = _Element(dict.get(self, part)[0])
+        elem._view = view
+
+        for pk in CPE.CPE_PART_KEYS:
+            if pk == part:
+                elements = _Elements((elem,))
+            else:
+                elements = _Elements()
+            elements._view = view
+            dict.__setitem__(self, pk, elements)
+
+        self._flat_view = view
+
+    def _fill_flat_view(self, view):
+        """
+        Stores the components of the only element of CPE Name in its flat
+        view, with their tags and the count of components set. The
+        components that can be modified keep a weak reference to the
+        view, to mark it as not valid when their values are set.
+
+        :param _FlatView view: flat view of CPE Name
+        :returns: None
+        """
+
+        elem = dict.get(self, view.part)[0]
+
+        try:
+            components = CPE._get_components(elem)
+        except KeyError:
+            view.valid = False
+            return
+
+        ref = None
+
+        for comp in components:
+            if not comp._frozen:
+                if ref is None:
+                    ref = weakref.ref(view)
+                comp._view = ref
+
+        tags_by_class = CPE._tags_by_class
+        tags = tuple([tags_by_class.get(comp.__class__, CPE._TAG_VALUE)
+                      for comp in components])
+
+        view.tags = tags
+        view.count = len(tags) - tags.count(CPE._TAG_UNDEFINED)
+        view.components = components
+
     def _get_attribute_components(self, att):
         """
         Returns the component list of input attribute.
@@ -423,6 +1312,11 @@ class CPE(dict):
             errmsg = "Invalid attribute name '{0}' is not exist".format(att)
             raise ValueError(errmsg)
 
+        view = self._get_flat_view()
+        if view is not None:
+            lc.append(view.components[CPE._ATT_IDX[att]])
+            return lc
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
@@ -430,6 +1324,140 @@ class CPE(dict):
 
         return lc
 
+    def _get_bound_form(self, binding, bind):
+        """
+        Returns the bound form of CPE Name, computing it only the first
+        time. The bound forms of a frozen CPE Name, or of a CPE Name not
+        modified after parsing it, do not change; in other case, they are
+        computed again if some component of CPE Name was replaced or
+        modified with set_value.
+
+        :param string binding: key of binding
+        :param function bind: function that computes the bound form
+        :returns: bound form of CPE Name
+        :rtype: string
+        :exception: TypeError - incompatible version
+        :exception: ValueError - CPE Name without elements
+        """
+
+        forms = self._bound_forms
+
+        if self._frozen or (self._get_flat_view() is not None):
+            stamp = None
+        else:
+            components = [comp for elements in dict.values(self)
+                          for elem in elements
+                          for comp in elem.values()]
+            stamp = [(id(comp), comp._modifications) for comp in components]
+
+            if stamp != self._bound_stamp:
+                forms = None
+
+        if forms is not None:
+            form = forms.get(binding)
+            if form is not None:
+                CPE._bound_hits += 1
+                return form
+        else:
+            forms = dict()
+
+        CPE._bound_misses += 1
+
+        if not any(dict.get(self, pk) for pk in CPE.CPE_PART_KEYS):
+            # CPE Name of version 1.1 without elements: no values to bind
+            errmsg = "CPE Name '{0}' without elements can not be bound".format(
+                self.cpe_str)
+            raise ValueError(errmsg)
+
+        form = bind()
+        forms[binding] = form
+
+        if stamp is not None:
+            # The components are kept, so their identities are not reused
+            self._bound_components = components
+            self._bound_stamp = stamp
+
+        self._bound_forms = forms
+
+        return form
+
+    def _get_known_key(self):
+        """
+        Returns the canonical key of CPE Name if it is frozen or its key
+        is stored in its flat view, without computing it in other case.
+
+        :returns: canonical key of CPE Name, or None if it is not known
+        :rtype: tuple
+        """
+
+        if self._frozen:
+            return self.get_key()
+
+        view = self._flat_view
+        if (view is not None) and view.valid:
+            return view.key
+
+        return None
+
+    def _get_flat_values(self):
+        """
+        Returns the values of the attributes of CPE Name returned by
+        get_attribute_values, stored in its flat view the first time.
+
+        :returns: values of attributes, or None if the CPE Name has not
+            flat view or some value is not known
+        :rtype: tuple
+        """
+
+        view = self._get_flat_view()
+        if view is None:
+            return None
+
+        values = view.values
+
+        if values is None:
+            # Empty if some value is not known
+            values = ()
+            logical_values = self._flat_logical_values
+
+            if logical_values is not None:
+                values = []
+                for comp, tag in zip(view.components, view.tags):
+                    if tag == CPE._TAG_VALUE:
+                        values.append(comp.get_value())
+                    elif tag in logical_values:
+                        values.append(logical_values[tag])
+                    else:
+                        values = ()
+                        break
+
+                values = tuple(values)
+
+            view.values = values
+
+        return values or None
+
+    def _get_flat_view(self):
+        """
+        Returns the flat view of the attributes of CPE Name, or None if
+        it does not exist or the CPE Name was modified after parsing it.
+
+        :returns: flat view of CPE Name
+        :rtype: _FlatView
+        """
+
+        view = self._flat_view
+
+        if (view is None) or (not view.valid):
+            return None
+
+        if view.components is None:
+            self._fill_flat_view(view)
+            if not view.valid:
+                return None
+
+        return view
+
     def _pack_edition(self):
         """
         Pack the values of the five arguments into the simple edition
@@ -447,10 +1475,7 @@ class CPE(dict):
                      CPEComponent.ATT_TARGET_HW,
                      CPEComponent.ATT_OTHER)
 
-        separator = CPEComponent2_3_URI_edpacked.SEPARATOR_COMP
-
-        packed_ed = []
-        packed_ed.append(separator)
+        values = []
 
         for ck in COMP_KEYS:
             lc = self._get_attribute_components(ck)
@@ -474,35 +1499,9 @@ class CPE(dict):
                 # in URI value
                 value = comp.as_uri_2_3()
 
-            # Save the value of edition attribute
-            if ck == CPEComponent.ATT_EDITION:
-                ed = value
-
-            # Packed the value of component
-            packed_ed.append(value)
-            packed_ed.append(separator)
+            values.append(value)
 
-        # Del the last separator
-        packed_ed_str = "".join(packed_ed[:-1])
-
-        only_ed = []
-        only_ed.append(separator)
-        only_ed.append(ed)
-        only_ed.append(separator)
-        only_ed.append(separator)
-        only_ed.append(separator)
-        only_ed.append(separator)
-
-        only_ed_str = "".join(only_ed)
-
-        if (packed_ed_str == only_ed_str):
-            # All the extended attributes are blank,
-            # so don't do any packing, just return ed
-            return ed
-        else:
-            # Otherwise, pack the five values into a simple string
-            # prefixed and internally delimited with the tilde
-            return packed_ed_str
+        return CPEComponent2_3_URI_edpacked._pack_values(values)
 
     def as_dict(self):
         """
@@ -521,7 +1520,24 @@ class CPE(dict):
         :returns: CPE Name as URI string of version 2.3
         :rtype: string
         :exception: TypeError - incompatible version
+        :exception: ValueError - CPE Name without elements
+        """
+
+        return self._get_bound_form(CPE._BINDING_URI, self._as_uri_2_3)
+
+    def _as_uri_2_3(self):
         """
+        Computes the CPE Name as URI string of version 2.3.
+
+        :returns: CPE Name as URI string of version 2.3
+        :rtype: string
+        :exception: TypeError - incompatible version
+        """
+
+        view = self._get_flat_view()
+        if view is not None:
+            # The eleven attributes are bound in one pass
+            return self._as_uri_2_3_flat(view)
 
         uri = []
         uri.append("cpe:/")
@@ -587,7 +1603,7 @@ class CPE(dict):
             if set_prev_comp:
                 # Set the previous attribute as logical value any
                 v = CPEComponent2_3_URI.VALUE_ANY
-                pos_ini = max(len(uri) - len(prev_comp_list) - 1, 1)
+                pos_ini = len(uri) - 2  # position of the value appended
                 increment = 2  # Count of inserted values
 
                 for p, val in enumerate(prev_comp_list):
@@ -601,10 +1617,54 @@ class CPE(dict):
         # Return the URI string, with trailing separator trimmed
         return CPE._trim("".join(uri[:-1]))
 
+    def _as_uri_2_3_flat(self, view):
+        """
+        Computes the CPE Name as URI string of version 2.3 from its flat
+        view, binding each attribute once and packing the five last ones
+        in the edition.
+
+        :param _FlatView view: flat view of CPE Name
+        :returns: CPE Name as URI string of version 2.3
+        :rtype: string
+        """
+
+        logical_values = CPE._uri_logical_values
+
+        values = [comp.as_uri_2_3() if tag == CPE._TAG_VALUE
+                  else logical_values[tag]
+                  for comp, tag in zip(view.components, view.tags)]
+
+        # The seven attributes of URI, with the edition packed
+        values[5] = CPEComponent2_3_URI_edpacked._pack_values(
+            values[5:6] + values[7:])
+        del values[7:]
+
+        if not values[5]:
+            tags = view.tags[:5] + view.tags[6:7]
+            if tags.count(CPE._TAG_UNDEFINED) == len(tags):
+                # No attribute defined: an empty string, as when the
+                # attributes are bound one at a time
+                return ""
+
+        sep = CPEComponent2_3_URI.SEPARATOR_COMP
+        return CPE._trim(CPE.PREFIX_URI + sep.join(values))
+
     def as_wfn(self):
         """
         Returns the CPE Name as Well-Formed Name string of version 2.3.
 
+        :return: CPE Name as WFN string
+        :rtype: string
+        :exception: TypeError - incompatible version
+        :exception: ValueError - CPE Name without elements
+        """
+
+        return self._get_bound_form(CPE._BINDING_WFN, self._as_wfn)
+
+    def _as_wfn(self):
+        """
+        Computes the CPE Name as Well-Formed Name string of version 2.3.
+
         :return: CPE Name as WFN string
         :rtype: string
         :exception: TypeError - incompatible version
@@ -657,8 +1717,9 @@ class CPE(dict):
                 wfn.append("".join(v))
                 wfn.append(CPEComponent2_3_WFN.SEPARATOR_COMP)
 
-        # Del the last separator
-        wfn = wfn[:-1]
+        # Del the last separator, if some attribute is set
+        if len(wfn) > 1:
+            wfn = wfn[:-1]
 
         # Return the WFN string
         wfn.append(CPE2_3_WFN.CPE_SUFFIX)
@@ -669,6 +1730,18 @@ class CPE(dict):
         """
         Returns the CPE Name as formatted string of version 2.3.
 
+        :returns: CPE Name as formatted string
+        :rtype: string
+        :exception: TypeError - incompatible version
+        :exception: ValueError - CPE Name without elements
+        """
+
+        return self._get_bound_form(CPE._BINDING_FS, self._as_fs)
+
+    def _as_fs(self):
+        """
+        Computes the CPE Name as formatted string of version 2.3.
+
         :returns: CPE Name as formatted string
         :rtype: string
         :exception: TypeError - incompatible version
@@ -713,6 +1786,53 @@ class CPE(dict):
         # Return the formatted string
         return CPE._trim("".join(fs[:-1]))
 
+    def clear(self):
+        """
+        Removes all the parts of CPE Name.
+
+        :returns: None
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        dict.clear(self)
+
+    def freeze(self):
+        """
+        Makes the CPE Name immutable, so it can be shared safely:
+        its parts, elements and components can not be modified after.
+
+        :returns: None
+
+        TEST: a frozen CPE Name
+
+        >>> c = CPE('cpe:/a:mozilla:firefox:2.0')
+        >>> c.freeze()
+        >>> c[CPE.KEY_APP] = []
+        Traceback (most recent call last):
+        TypeError: Frozen CPE Name can not be modified
+        """
+
+        if self._frozen:
+            return
+
+        # The bound forms of a frozen CPE Name are not checked again,
+        # so the ones computed before are forgotten
+        self._bound_forms = None
+        self._bound_components = None
+        self._bound_stamp = None
+
+        for pk, elements in list(self.items()):
+            frozen_elements = []
+            for elem in elements:
+                for comp in elem.values():
+                    comp.freeze()
+                frozen_elements.append(_FrozenElement(elem))
+
+            dict.__setitem__(self, pk, tuple(frozen_elements))
+
+        self._frozen = True
+
     def get_edition(self):
         """
         Returns the edition of product of CPE Name as a list.
@@ -725,6 +1845,59 @@ class CPE(dict):
 
         return self.get_attribute_values(CPEComponent.ATT_EDITION)
 
+    def get_key(self):
+        """
+        Returns the canonical key of CPE Name: equal CPE Names have the
+        same key, whatever their version, style or case. The key is a
+        tuple with a pair for each element of CPE Name: its part and the
+        keys of its components in the order of
+        CPEComponent.CPE_COMP_KEYS_EXTENDED, the values decoded and the
+        logical values, with undefined and empty values as value ANY.
+
+        :returns: canonical key of CPE Name
+        :rtype: tuple
+
+        TEST: the same CPE Name in several styles and versions
+
+        >>> fs = 'cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*'
+        >>> uri = 'cpe:/a:Microsoft:IE:8.0'
+        >>> CPE(fs).get_key() == CPE(uri, CPE.VERSION_2_2).get_key()
+        True
+        """
+
+        key = self._key
+        if key is not None:
+            return key
+
+        get_key = CPE._get_component_key
+
+        view = self._get_flat_view()
+        if view is not None:
+            key = view.key
+            if key is None:
+                comp_keys = [get_key(comp, tag) for comp, tag in
+                             zip(view.components, view.tags)]
+                key = ((view.part, tuple(comp_keys)),)
+                view.key = key
+        else:
+            tags_by_class = CPE._tags_by_class
+            elem_keys = []
+
+            for pk in CPE.CPE_PART_KEYS:
+                for elem in self.get(pk):
+                    comp_keys = [
+                        get_key(comp, tags_by_class.get(comp.__class__,
+                                                        CPE._TAG_VALUE))
+                        for comp in CPE._get_components(elem)]
+                    elem_keys.append((pk, tuple(comp_keys)))
+
+            key = tuple(elem_keys)
+
+        if self._frozen:
+            self._key = key
+
+        return key
+
     def get_language(self):
         """
         Returns the internationalization information of CPE Name as a list.
@@ -848,6 +2021,16 @@ class CPE(dict):
         elements = self.get(CPE.KEY_APP)
         return len(elements) > 0
 
+    def is_frozen(self):
+        """
+        Returns True if the CPE Name can not be modified.
+
+        :returns: True if CPE Name is immutable, False otherwise
+        :rtype: boolean
+        """
+
+        return self._frozen
+
     def is_hardware(self):
         """
         Returns True if CPE Name corresponds to hardware elem.
@@ -872,6 +2055,54 @@ class CPE(dict):
         elements = self.get(CPE.KEY_OS)
         return len(elements) > 0
 
+    def pop(self, *args):
+        """
+        Removes a part of CPE Name and returns its elements.
+
+        :returns: elements of part
+        :rtype: list
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        """
+        Removes a part of CPE Name and returns it with its elements.
+
+        :returns: part and elements of part
+        :rtype: tuple
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        return dict.popitem(self)
+
+    def setdefault(self, *args):
+        """
+        Returns the elements of a part of CPE Name, storing them if the
+        part does not exist.
+
+        :returns: elements of part
+        :rtype: list
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        return dict.setdefault(self, *args)
+
+    def update(self, *args, **kwargs):
+        """
+        Stores several parts of CPE Name.
+
+        :returns: None
+        :exception: TypeError - frozen CPE Name
+        """
+
+        self._check_mutable()
+        dict.update(self, *args, **kwargs)
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
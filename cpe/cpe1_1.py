@@ -168,12 +168,13 @@ class CPE1_1(CPE):
         :rtype: CPE1_1
         """
 
-        return dict.__new__(cls)
+        return cls._new_or_cached(cpe_str)
 
-    def _parse(self):
+    def _parse(self, validate=True):
         """
         Checks if the CPE Name is valid.
 
+        :param boolean validate: False to not check the values of components
         :returns: None
         :exception: ValueError - bad-formed CPE Name
         """
@@ -219,14 +220,21 @@ class CPE1_1(CPE):
                     components = dict()
 
                     # colon (:) is used to separate the element components
-                    for elem_comp in part_elem.split(CPEComponent1_1.SEPARATOR_COMP):
+                    elem_comps = part_elem.split(CPEComponent1_1.SEPARATOR_COMP)
+                    if len(elem_comps) >= len(CPEComponent.ordered_comp_parts):
+                        errmsg = "Bad-formed CPE Name: too many components"
+                        raise ValueError(errmsg)
+
+                    for elem_comp in elem_comps:
                         comp_att = CPEComponent.ordered_comp_parts[j]
 
                         if elem_comp == CPEComponent1_1.VALUE_EMPTY:
                             comp = CPEComponentEmpty()
                         else:
                             try:
-                                comp = CPEComponent1_1(elem_comp, comp_att)
+                                comp = CPE._new_component(
+                                    CPEComponent1_1, elem_comp, comp_att,
+                                    validate)
                             except ValueError:
                                 errmsg = "Bad-formed CPE Name: not correct value: {0}".format(
                                     elem_comp)
@@ -246,14 +254,17 @@ class CPE1_1(CPE):
                     # Get the type of system associated with CPE Name and
                     # store it in element as component
                     if (pk == CPE.KEY_HW):
-                        components[CPEComponent.ATT_PART] = CPEComponent1_1(
-                            CPEComponent.VALUE_PART_HW, CPEComponent.ATT_PART)
+                        components[CPEComponent.ATT_PART] = CPE._new_component(
+                            CPEComponent1_1, CPEComponent.VALUE_PART_HW,
+                            CPEComponent.ATT_PART, validate)
                     elif (pk == CPE.KEY_OS):
-                        components[CPEComponent.ATT_PART] = CPEComponent1_1(
-                            CPEComponent.VALUE_PART_OS, CPEComponent.ATT_PART)
+                        components[CPEComponent.ATT_PART] = CPE._new_component(
+                            CPEComponent1_1, CPEComponent.VALUE_PART_OS,
+                            CPEComponent.ATT_PART, validate)
                     elif (pk == CPE.KEY_APP):
-                        components[CPEComponent.ATT_PART] = CPEComponent1_1(
-                            CPEComponent.VALUE_PART_APP, CPEComponent.ATT_PART)
+                        components[CPEComponent.ATT_PART] = CPE._new_component(
+                            CPEComponent1_1, CPEComponent.VALUE_PART_APP,
+                            CPEComponent.ATT_PART, validate)
 
                     # Store the element identified
                     elements.append(components)
@@ -263,9 +274,9 @@ class CPE1_1(CPE):
 
         self[CPE.KEY_UNDEFINED] = []
 
-    def as_wfn(self):
+    def _as_wfn(self):
         """
-        Returns the CPE Name as Well-Formed Name string of version 2.3.
+        Computes the CPE Name as Well-Formed Name string of version 2.3.
 
         :return: CPE Name as WFN string
         :rtype: string
@@ -307,8 +318,9 @@ class CPE1_1(CPE):
                     wfn.append("".join(v))
                     wfn.append(CPEComponent2_3_WFN.SEPARATOR_COMP)
 
-        # Del the last separator
-        wfn = wfn[:-1]
+        # Del the last separator, if some attribute is set
+        if len(wfn) > 1:
+            wfn = wfn[:-1]
 
         # Return the WFN string
         wfn.append(CPE2_3_WFN.CPE_SUFFIX)
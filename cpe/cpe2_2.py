@@ -73,10 +73,19 @@ class CPE2_2(CPE):
     #: Version of CPE Name
     VERSION = CPE.VERSION_2_2
 
+    #: Maximum count of colons of CPE Name: the colon of prefix and the
+    #: separators of seven components
+    _MAX_COLONS = 7
+
     ###############
     #  VARIABLES  #
     ###############
 
+    #: Value returned by get_attribute_values for each tag of logical value
+    _flat_logical_values = {
+        CPE._TAG_EMPTY: CPEComponent2_2.VALUE_EMPTY,
+        CPE._TAG_UNDEFINED: CPEComponent2_2.VALUE_EMPTY}
+
     # Compilation of regular expression associated with components
     # of CPE Name
     _part = "?P<{0}>(h|o|a)".format(CPEComponent.ATT_PART)
@@ -91,6 +100,28 @@ class CPE2_2(CPE):
         _part, _vendor, _product, _version, _update, _edition, _language)
     _parts_rxc = re.compile(_parts_pattern)
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _match_parts(cls, s):
+        """
+        Returns the match of the parts of CPE Name, or None if it is
+        not valid. The CPE Names with more components than the allowed
+        ones are rejected before matching them, because the pattern of
+        parts would try every way of splitting them.
+
+        :param string s: CPE Name in lower-case letters
+        :returns: match of the parts of CPE Name
+        :rtype: match
+        """
+
+        if s.count(CPEComponent2_2.SEPARATOR_COMP) > CPE2_2._MAX_COLONS:
+            return None
+
+        return CPE2_2._parts_rxc.match(s)
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -122,12 +153,13 @@ class CPE2_2(CPE):
         :rtype: CPE2_2
         """
 
-        return dict.__new__(cls)
+        return cls._new_or_cached(cpe_str)
 
-    def _parse(self):
+    def _parse(self, validate=True):
         """
         Checks if CPE Name is valid.
 
+        :param boolean validate: False to not check the values of components
         :returns: None
         :exception: ValueError - bad-formed CPE Name
         """
@@ -138,7 +170,7 @@ class CPE2_2(CPE):
             raise ValueError(msg)
 
         # Partitioning of CPE Name
-        parts_match = CPE2_2._parts_rxc.match(self._str)
+        parts_match = CPE2_2._match_parts(self._str)
 
         # Validation of CPE Name parts
         if (parts_match is None):
@@ -158,7 +190,8 @@ class CPE2_2(CPE):
                     comp = CPEComponentEmpty()
                 else:
                     try:
-                        comp = CPEComponent2_2(value, ck)
+                        comp = CPE._new_component(CPEComponent2_2, value, ck,
+                                                  validate)
                     except ValueError:
                         errmsg = "Bad-formed CPE Name: not correct value: {0}".format(
                             value)
@@ -192,9 +225,9 @@ class CPE2_2(CPE):
                 pk = CPE._system_and_parts[sys]
                 self[pk] = []
 
-    def as_wfn(self):
+    def _as_wfn(self):
         """
-        Returns the CPE Name as WFN string of version 2.3.
+        Computes the CPE Name as WFN string of version 2.3.
         Only shows the first seven components.
 
         :return: CPE Name as WFN string
@@ -229,8 +262,9 @@ class CPE2_2(CPE):
                 wfn.append("".join(v))
                 wfn.append(CPEComponent2_3_WFN.SEPARATOR_COMP)
 
-        # Del the last separator
-        wfn = wfn[:-1]
+        # Del the last separator, if some attribute is set
+        if len(wfn) > 1:
+            wfn = wfn[:-1]
 
         # Return the WFN string
         wfn.append(CPE2_3_WFN.CPE_SUFFIX)
@@ -254,6 +288,11 @@ class CPE2_2(CPE):
             errmsg = "Invalid attribute name: {0}".format(att_name)
             raise ValueError(errmsg)
 
+        values = self._get_flat_values()
+        if values is not None:
+            lc.append(values[CPE._ATT_IDX[att_name]])
+            return lc
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
@@ -65,6 +65,47 @@ class CPE2_3(CPE):
     #: Style of CPE name
     STYLE = STYLE_UNDEFINED
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _create_style(cls, cpe_str, validate=True):
+        """
+        Returns a new CPE Name of version 2.3, with the style detected by
+        the prefix of the CPE Name string.
+
+        :param string cpe_str: CPE Name string
+        :param boolean validate: False to not check the values of components
+        :returns: CPE object of version 2.3 with style
+            detected correctly
+        :rtype: CPE2_3
+        :exception: NotImplementedError - incorrect CPE Name or
+            style of CPE not implemented
+        """
+
+        errmsg = 'Style of version 2.3 of CPE not implemented'
+
+        # Detect CPE style of input CPE name by its prefix
+        head = cpe_str[0:len(CPE.PREFIX_FS)].lower()
+
+        if head.startswith(CPE.PREFIX_FS):
+            style = CPE2_3.STYLE_FS
+        elif head.startswith(CPE.PREFIX_WFN):
+            style = CPE2_3.STYLE_WFN
+        elif head.startswith(CPE.PREFIX_URI):
+            style = CPE2_3.STYLE_URI
+        else:
+            raise NotImplementedError(errmsg)
+
+        cpe_class = CPE._get_cpe_classes()[style]
+
+        try:
+            # Validate CPE name
+            return cpe_class._create(cpe_str, validate)
+        except ValueError:
+            raise NotImplementedError(errmsg)
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -86,31 +127,9 @@ class CPE2_3(CPE):
         object instance.
         """
 
-        from .cpe2_3_fs import CPE2_3_FS
-        from .cpe2_3_uri import CPE2_3_URI
-        from .cpe2_3_wfn import CPE2_3_WFN
-
-        # List of implemented styles of version 2.3 of CPE names
-        _CPE_STYLES = {
-            CPE2_3.STYLE_FS: CPE2_3_FS,
-            CPE2_3.STYLE_URI: CPE2_3_URI,
-            CPE2_3.STYLE_WFN: CPE2_3_WFN}
-
-        errmsg = 'Style of version 2.3 of CPE not implemented'
+        validate = kwargs.get("validate", True)
 
-        # Detect CPE version of input CPE name
-        for s in _CPE_STYLES:
-            try:
-                # Validate CPE name
-                c = _CPE_STYLES[s](cpe_str)
-            except ValueError:
-                # Test another style
-                continue
-            else:
-                # Style detected
-                return c
-
-        raise NotImplementedError(errmsg)
+        return CPE.__new__(CPE, cpe_str, CPE.VERSION_2_3, validate)
 
     def __str__(self):
         """
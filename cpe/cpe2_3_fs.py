@@ -73,32 +73,76 @@ class CPE2_3_FS(CPE2_3):
     #: Style of CPE Name
     STYLE = CPE2_3.STYLE_FS
 
+    #: Number of components of CPE Name
+    _COMP_COUNT = 11
+
+    #: Valid values of part component of CPE Name
+    _PART_VALUES = (CPEComponent.VALUE_PART_HW,
+                    CPEComponent.VALUE_PART_OS,
+                    CPEComponent.VALUE_PART_APP,
+                    CPEComponent2_3_FS.VALUE_ANY,
+                    CPEComponent2_3_FS.VALUE_NA)
+
     ###############
     #  VARIABLES  #
     ###############
-    COMP_RE = "(?P<{0}>.*?)(?<!\\\\)"
-
-    # Compilation of regular expression associated with parts of CPE Name
-    _logical = "\\{0}|\\{1}".format(
-        CPEComponent2_3_FS.VALUE_ANY, CPEComponent2_3_FS.VALUE_NA)
-    _typesys = "(?P<{0}>(h|o|a|{1}))".format(
-        CPEComponent.ATT_PART, _logical)
-    _vendor = COMP_RE.format(CPEComponent.ATT_VENDOR)
-    _product = COMP_RE.format(CPEComponent.ATT_PRODUCT)
-    _version = COMP_RE.format(CPEComponent.ATT_VERSION)
-    _update = COMP_RE.format(CPEComponent.ATT_UPDATE)
-    _edition = COMP_RE.format(CPEComponent.ATT_EDITION)
-    _language = COMP_RE.format(CPEComponent.ATT_LANGUAGE)
-    _sw_edition = COMP_RE.format(CPEComponent.ATT_SW_EDITION)
-    _target_sw = COMP_RE.format(CPEComponent.ATT_TARGET_SW)
-    _target_hw = COMP_RE.format(CPEComponent.ATT_TARGET_HW)
-    _other = COMP_RE.format(CPEComponent.ATT_OTHER)
-
-    _parts_pattern = "^cpe:2.3:{0}\:{1}\:{2}\:{3}\:{4}\:{5}\:{6}\:{7}\:{8}\:{9}\:{10}$".format(
-        _typesys, _vendor, _product, _version, _update, _edition,
-        _language, _sw_edition, _target_sw, _target_hw, _other)
-
-    _parts_rxc = re.compile(_parts_pattern, re.IGNORECASE)
+
+    #: Value returned by get_attribute_values for each tag of logical value
+    _flat_logical_values = {
+        CPE._TAG_ANY: CPEComponent2_3_FS.VALUE_ANY,
+        CPE._TAG_NA: CPEComponent2_3_FS.VALUE_NA}
+
+    # Compilation of regular expression associated with a value of CPE Name:
+    # characters except colon and backslash, and quoted characters.
+    # Each character can be read only in one way, so the matching never
+    # backtracks
+    _value_rxc = re.compile(r"[^\\:]*(?:\\.[^\\:]*)*\\?", re.DOTALL)
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _split(cls, s):
+        r"""
+        Splits the input string in values separated by unquoted colons.
+        A colon is quoted when it is preceded by an odd number of
+        backslashes.
+
+        :param string s: values of CPE Name separated by colons
+        :returns: List of values, with their quoting
+        :rtype: list
+
+        TEST: quoted colon
+
+        >>> CPE2_3_FS._split(r'a:b\:c:d')
+        ['a', 'b\\:c', 'd']
+
+        TEST: quoted backslash before a colon
+
+        >>> CPE2_3_FS._split(r'a:b\\:c')
+        ['a', 'b\\\\', 'c']
+        """
+
+        sep = CPEComponent2_3_FS.SEPARATOR_COMP
+
+        # Without quoted colons every colon is a separator
+        if s.find("\\" + sep) == -1:
+            return s.split(sep)
+
+        values = []
+        pos = 0
+        end_str = len(s)
+
+        while True:
+            # Each value ends in the next unquoted colon
+            end = CPE2_3_FS._value_rxc.match(s, pos).end()
+            values.append(s[pos:end])
+
+            if end == end_str:
+                return values
+
+            pos = end + 1
 
     ####################
     #  OBJECT METHODS  #
@@ -125,12 +169,13 @@ class CPE2_3_FS(CPE2_3):
         :rtype: CPE2_3_FS
         """
 
-        return dict.__new__(cls)
+        return cls._new_or_cached(cpe_str)
 
-    def _parse(self):
+    def _parse(self, validate=True):
         """
         Checks if the CPE Name is valid.
 
+        :param boolean validate: False to not check the values of components
         :returns: None
         :exception: ValueError - bad-formed CPE Name
         """
@@ -141,34 +186,34 @@ class CPE2_3_FS(CPE2_3):
             raise ValueError(msg)
 
         # Partitioning of CPE Name
-        parts_match = CPE2_3_FS._parts_rxc.match(self._str)
+        if not self._str.startswith(CPE.PREFIX_FS):
+            msg = "Bad-formed CPE Name: validation of parts failed"
+            raise ValueError(msg)
+
+        values = CPE2_3_FS._split(self._str[len(CPE.PREFIX_FS):])
 
         # Validation of CPE Name parts
-        if (parts_match is None):
+        if ((len(values) != CPE2_3_FS._COMP_COUNT) or
+           (values[0] not in CPE2_3_FS._PART_VALUES)):
+
             msg = "Bad-formed CPE Name: validation of parts failed"
             raise ValueError(msg)
 
         components = dict()
-        parts_match_dict = parts_match.groupdict()
-
-        for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED:
-            if ck in parts_match_dict:
-                value = parts_match.group(ck)
 
-                if (value == CPEComponent2_3_FS.VALUE_ANY):
-                    comp = CPEComponentAnyValue()
-                elif (value == CPEComponent2_3_FS.VALUE_NA):
-                    comp = CPEComponentNotApplicable()
-                else:
-                    try:
-                        comp = CPEComponent2_3_FS(value, ck)
-                    except ValueError:
-                        errmsg = "Bad-formed CPE Name: not correct value: {0}".format(
-                            value)
-                        raise ValueError(errmsg)
+        for ck, value in zip(CPEComponent.CPE_COMP_KEYS_EXTENDED, values):
+            if (value == CPEComponent2_3_FS.VALUE_ANY):
+                comp = CPEComponentAnyValue()
+            elif (value == CPEComponent2_3_FS.VALUE_NA):
+                comp = CPEComponentNotApplicable()
             else:
-                errmsg = "Component {0} should be specified".format(ck)
-                raise ValueError(ck)
+                try:
+                    comp = CPE._new_component(CPEComponent2_3_FS, value, ck,
+                                              validate)
+                except ValueError:
+                    errmsg = "Bad-formed CPE Name: not correct value: {0}".format(
+                        value)
+                    raise ValueError(errmsg)
 
             components[ck] = comp
 
@@ -185,7 +230,7 @@ class CPE2_3_FS(CPE2_3):
             # Create internal structure of CPE Name in parts:
             # one of them is filled with identified components,
             # the rest are empty
-            system = parts_match.group(CPEComponent.ATT_PART)
+            system = values[0]
             if system in CPEComponent.SYSTEM_VALUES:
                 self._create_cpe_parts(system, components)
             else:
@@ -215,6 +260,11 @@ class CPE2_3_FS(CPE2_3):
             errmsg = "Invalid attribute name: {0}".format(att_name)
             raise ValueError(errmsg)
 
+        values = self._get_flat_values()
+        if values is not None:
+            lc.append(values[CPE._ATT_IDX[att_name]])
+            return lc
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
@@ -78,10 +78,27 @@ class CPE2_3_URI(CPE2_3):
     #: Style of CPE Name
     STYLE = CPE2_3.STYLE_URI
 
+    #: Maximum count of colons of CPE Name: the colon of prefix and the
+    #: separators of seven components
+    _MAX_COLONS = 7
+
+    #: Attributes packed in edition attribute, in order
+    _PACKED_KEYS = (CPEComponent.ATT_EDITION,
+                    CPEComponent.ATT_SW_EDITION,
+                    CPEComponent.ATT_TARGET_SW,
+                    CPEComponent.ATT_TARGET_HW,
+                    CPEComponent.ATT_OTHER)
+
     ###############
     #  VARIABLES  #
     ###############
 
+    #: Value returned by get_attribute_values for each tag of logical value
+    _flat_logical_values = {
+        CPE._TAG_ANY: CPEComponent2_3_URI.VALUE_ANY,
+        CPE._TAG_UNDEFINED: CPEComponent2_3_URI.VALUE_ANY,
+        CPE._TAG_NA: CPEComponent2_3_URI.VALUE_NA}
+
     # Compilation of regular expression associated with parts of CPE Name
     _typesys = "?P<{0}>(h|o|a)".format(CPEComponent.ATT_PART)
     _vendor = "?P<{0}>[^:]+".format(CPEComponent.ATT_VENDOR)
@@ -101,12 +118,31 @@ class CPE2_3_URI(CPE2_3):
     ###################
 
     @classmethod
-    def _create_component(cls, att, value):
+    def _match_parts(cls, s):
+        """
+        Returns the match of the parts of CPE Name, or None if it is
+        not valid. The CPE Names with more components than the allowed
+        ones are rejected before matching them, because the pattern of
+        parts would try every way of splitting them.
+
+        :param string s: CPE Name in lower-case letters
+        :returns: match of the parts of CPE Name
+        :rtype: match
+        """
+
+        if s.count(CPEComponent2_3_URI.SEPARATOR_COMP) > CPE2_3_URI._MAX_COLONS:
+            return None
+
+        return CPE2_3_URI._parts_rxc.match(s)
+
+    @classmethod
+    def _create_component(cls, att, value, validate=True):
         """
         Returns a component with value "value".
 
         :param string att: Attribute name
         :param string value: Attribute value
+        :param boolean validate: False to not check the value
         :returns: Component object created
         :rtype: CPEComponent
         :exception: ValueError - invalid value of attribute
@@ -120,9 +156,9 @@ class CPE2_3_URI(CPE2_3):
         elif (value == CPEComponent2_3_URI.VALUE_NA):
             comp = CPEComponentNotApplicable()
         else:
-            comp = CPEComponentNotApplicable()
             try:
-                comp = CPEComponent2_3_URI(value, att)
+                comp = CPE._new_component(CPEComponent2_3_URI, value, att,
+                                          validate)
             except ValueError:
                 errmsg = "Invalid value of attribute '{0}': {1} ".format(att,
                                                                          value)
@@ -131,7 +167,7 @@ class CPE2_3_URI(CPE2_3):
         return comp
 
     @classmethod
-    def _unpack_edition(cls, value):
+    def _unpack_edition(cls, value, validate=True):
         """
         Unpack its elements and set the attributes in wfn accordingly.
         Parse out the five elements:
@@ -139,29 +175,18 @@ class CPE2_3_URI(CPE2_3):
         ~ edition ~ software edition ~ target sw ~ target hw ~ other
 
         :param string value: Value of edition attribute
+        :param boolean validate: False to not check the values
         :returns: Dictionary with parts of edition attribute
-        :exception: ValueError - invalid value of edition attribute
+        :exception: ValueError - invalid value of edition attribute or less
+            than five values packed
         """
 
-        components = value.split(CPEComponent2_3_URI.SEPARATOR_PACKED_EDITION)
+        # The five values are split once; the values after them are ignored
+        values = CPEComponent2_3_URI_edpacked._unpack_value(value)
         d = dict()
 
-        ed = components[1]
-        sw_ed = components[2]
-        t_sw = components[3]
-        t_hw = components[4]
-        oth = components[5]
-
-        ck = CPEComponent.ATT_EDITION
-        d[ck] = CPE2_3_URI._create_component(ck, ed)
-        ck = CPEComponent.ATT_SW_EDITION
-        d[ck] = CPE2_3_URI._create_component(ck, sw_ed)
-        ck = CPEComponent.ATT_TARGET_SW
-        d[ck] = CPE2_3_URI._create_component(ck, t_sw)
-        ck = CPEComponent.ATT_TARGET_HW
-        d[ck] = CPE2_3_URI._create_component(ck, t_hw)
-        ck = CPEComponent.ATT_OTHER
-        d[ck] = CPE2_3_URI._create_component(ck, oth)
+        for ck, v in zip(CPE2_3_URI._PACKED_KEYS, values):
+            d[ck] = CPE2_3_URI._create_component(ck, v, validate)
 
         return d
 
@@ -249,12 +274,13 @@ class CPE2_3_URI(CPE2_3):
         :rtype: CPE2_3_URI
         """
 
-        return dict.__new__(cls)
+        return cls._new_or_cached(cpe_str)
 
-    def _parse(self):
+    def _parse(self, validate=True):
         """
         Checks if the CPE Name is valid.
 
+        :param boolean validate: False to not check the values of components
         :returns: None
         :exception: ValueError - bad-formed CPE Name
         """
@@ -265,7 +291,7 @@ class CPE2_3_URI(CPE2_3):
             raise ValueError(msg)
 
         # Partitioning of CPE Name
-        parts_match = CPE2_3_URI._parts_rxc.match(self._str)
+        parts_match = CPE2_3_URI._match_parts(self._str)
 
         # Validation of CPE Name parts
         if (parts_match is None):
@@ -282,11 +308,12 @@ class CPE2_3_URI(CPE2_3):
                 if (ck == CPEComponent.ATT_EDITION and value is not None):
                     if value[0] == CPEComponent2_3_URI.SEPARATOR_PACKED_EDITION:
                         # Unpack the edition part
-                        edition_parts = CPE2_3_URI._unpack_edition(value)
+                        edition_parts = CPE2_3_URI._unpack_edition(value,
+                                                                 validate)
                     else:
-                        comp = CPE2_3_URI._create_component(ck, value)
+                        comp = CPE2_3_URI._create_component(ck, value, validate)
                 else:
-                    comp = CPE2_3_URI._create_component(ck, value)
+                    comp = CPE2_3_URI._create_component(ck, value, validate)
             except ValueError:
                 errmsg = "Bad-formed CPE Name: not correct value '{0}'".format(
                     value)
@@ -342,9 +369,9 @@ class CPE2_3_URI(CPE2_3):
                 # Empty part
                 self[pk] = []
 
-    def as_wfn(self):
+    def _as_wfn(self):
         """
-        Returns the CPE Name as Well-Formed Name string of version 2.3.
+        Computes the CPE Name as Well-Formed Name string of version 2.3.
         If edition component is not packed, only shows the first seven
         components, otherwise shows all.
 
@@ -402,8 +429,9 @@ class CPE2_3_URI(CPE2_3):
                     wfn.append("".join(v))
                     wfn.append(CPEComponent2_3_WFN.SEPARATOR_COMP)
 
-            # Del the last separator
-            wfn = wfn[:-1]
+            # Del the last separator, if some attribute is set
+            if len(wfn) > 1:
+                wfn = wfn[:-1]
 
             # Return the WFN string
             wfn.append(CPE2_3_WFN.CPE_SUFFIX)
@@ -412,7 +440,7 @@ class CPE2_3_URI(CPE2_3):
 
         else:
             # Shows all components
-            return super(CPE2_3_URI, self).as_wfn()
+            return super(CPE2_3_URI, self)._as_wfn()
 
     def get_attribute_values(self, att_name):
         """
@@ -431,6 +459,11 @@ class CPE2_3_URI(CPE2_3):
             errmsg = "Invalid attribute name '{0}'".format(att_name)
             raise ValueError(errmsg)
 
+        values = self._get_flat_values()
+        if values is not None:
+            lc.append(values[CPE._ATT_IDX[att_name]])
+            return lc
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
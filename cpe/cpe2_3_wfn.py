@@ -91,6 +91,16 @@ class CPE2_3_WFN(CPE2_3):
     #: Suffix of CPE Name with WFN style
     CPE_SUFFIX = "]"
 
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Value returned by get_attribute_values for each tag of logical value
+    _flat_logical_values = {
+        CPE._TAG_ANY: CPEComponent2_3_WFN.VALUE_ANY,
+        CPE._TAG_UNDEFINED: CPEComponent2_3_WFN.VALUE_ANY,
+        CPE._TAG_NA: CPEComponent2_3_WFN.VALUE_NA}
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -105,12 +115,13 @@ class CPE2_3_WFN(CPE2_3):
         :rtype: CPE2_3_WFN
         """
 
-        return dict.__new__(cls)
+        return cls._new_or_cached(cpe_str)
 
-    def _parse(self):
+    def _parse(self, validate=True):
         """
         Checks if the CPE Name is valid.
 
+        :param boolean validate: False to not check the values of components
         :returns: None
         :exception: ValueError - bad-formed CPE Name
         """
@@ -143,6 +154,10 @@ class CPE2_3_WFN(CPE2_3):
 
                 # Split pair attribute-value
                 pair = e.split(CPEComponent2_3_WFN.SEPARATOR_PAIR)
+                if len(pair) < 2:
+                    msg = "Bad-formed CPE Name: invalid value '{0}'".format(e)
+                    raise ValueError(msg)
+
                 att_name = pair[0]
                 att_value = pair[1]
 
@@ -173,7 +188,8 @@ class CPE2_3_WFN(CPE2_3):
 
                 elif att_value.startswith('"') and att_value.endswith('"'):
                     # String value
-                    comp = CPEComponent2_3_WFN(att_value, att_name)
+                    comp = CPE._new_component(CPEComponent2_3_WFN, att_value,
+                                              att_name, validate)
 
                 else:
                     # Bad value
@@ -209,6 +225,15 @@ class CPE2_3_WFN(CPE2_3):
                 else:
                     self._create_cpe_parts(CPEComponent.VALUE_PART_UNDEFINED,
                                            components)
+        else:
+            # Empty WFN: all the attributes are undefined, as in an empty
+            # URI
+            components = dict()
+            for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+                components[ck] = CPEComponentUndefined()
+
+            self._create_cpe_parts(CPEComponent.VALUE_PART_UNDEFINED,
+                                   components)
 
         # Fills the empty parts of internal structure of CPE Name
         for pk in CPE.CPE_PART_KEYS:
@@ -232,6 +257,11 @@ class CPE2_3_WFN(CPE2_3):
             errmsg = "Invalid attribute name '{0}'".format(att_name)
             raise ValueError(errmsg)
 
+        values = self._get_flat_values()
+        if values is not None:
+            lc.append(values[CPE._ATT_IDX[att_name]])
+            return lc
+
         for pk in CPE.CPE_PART_KEYS:
             elements = self.get(pk)
             for elem in elements:
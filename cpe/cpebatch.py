@@ -0,0 +1,198 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module is used to parse a stream of strings into CPE Names of any
+version of Common Platform Enumeration (CPE) specification, collecting
+the invalid names instead of raising exceptions.
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+from .cpe import CPE
+
+
+class CPEBatch(object):
+    """
+    Represents a stream of CPE Names parsed from a stream of strings,
+    for example the lines of a dictionary file.
+
+    It is an iterator of CPE objects. The invalid names are stored in
+    the list "errors" as tuples (line number, input string, reason),
+    while the iteration goes on.
+    """
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    # Possible actions when a string is not a valid CPE Name
+
+    #: Store the invalid name in errors list and continue
+    ON_ERROR_COLLECT = "collect"
+
+    #: Skip the invalid name silently
+    ON_ERROR_IGNORE = "ignore"
+
+    #: Raise the exception of the invalid name
+    ON_ERROR_RAISE = "raise"
+
+    #: List of possible actions when a string is not a valid CPE Name
+    ON_ERROR_VALUES = (ON_ERROR_COLLECT, ON_ERROR_IGNORE, ON_ERROR_RAISE)
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __init__(self, iterable, version=None, on_error=ON_ERROR_COLLECT,
+                 validate=True, cpe_class=None):
+        """
+        Creates the stream of CPE Names.
+
+        :param iterable iterable: strings to parse, as a list or a file.
+            Surrounding whitespaces are removed and blank strings skipped
+        :param string version: version of CPE specification of all CPE
+            Names, detected for each name if it is not set
+        :param string on_error: action when a string is not a valid CPE Name
+        :param boolean validate: False to not check the values of
+            components, if the strings come from a trusted source
+        :param class cpe_class: class of all CPE Names, used instead of
+            version if it is set
+        :returns: None
+        :exception: ValueError - invalid action
+        :exception: NotImplementedError - version of CPE not implemented
+        """
+
+        if on_error not in CPEBatch.ON_ERROR_VALUES:
+            errmsg = "Invalid action on error '{0}'".format(on_error)
+            raise ValueError(errmsg)
+
+        if ((version is not None) and
+           (version not in (CPE.VERSION_1_1, CPE.VERSION_2_2,
+                            CPE.VERSION_2_3))):
+
+            errmsg = 'Version of CPE not implemented'
+            raise NotImplementedError(errmsg)
+
+        #: List of invalid names: tuples (line number, input, reason)
+        self.errors = []
+
+        self._names = self._parse(iterable, version, on_error, validate,
+                                  cpe_class)
+
+    def __iter__(self):
+        """
+        Returns the iterator of CPE Names.
+
+        :returns: self
+        :rtype: CPEBatch
+        """
+
+        return self
+
+    def __next__(self):
+        """
+        Returns the next valid CPE Name of the stream.
+
+        :returns: CPE Name
+        :rtype: CPE
+        :exception: StopIteration - end of stream
+        """
+
+        return next(self._names)
+
+    # Python 2 iterator protocol
+    next = __next__
+
+    def _parse(self, iterable, version, on_error, validate, cpe_class):
+        """
+        Generator of CPE Names of the input strings.
+
+        The classes of CPE Names are resolved once for the whole stream.
+
+        :param iterable iterable: strings to parse
+        :param string version: version of CPE specification of CPE Names
+        :param string on_error: action when a string is not a valid CPE Name
+        :param boolean validate: False to not check the values of components
+        :param class cpe_class: class of all CPE Names
+        :returns: generator of CPE Names
+        :rtype: generator
+        """
+
+        errmsg = 'Version of CPE not implemented'
+
+        # Detect CPE version of each input CPE Name by its prefix
+        sniff = (version is None) and (cpe_class is None)
+
+        if sniff:
+            get_classes = CPE._sniff
+        else:
+            if cpe_class is None:
+                cpe_class = CPE._get_cpe_classes()[version]
+            only_class = (cpe_class,)
+
+            def get_classes(cpe_str):
+                return only_class
+
+        errors = self.errors
+        collect = on_error == CPEBatch.ON_ERROR_COLLECT
+        raises = on_error == CPEBatch.ON_ERROR_RAISE
+
+        for line, value in enumerate(iterable, 1):
+            cpe_str = value.strip()
+            if not cpe_str:
+                continue
+
+            c = None
+            error = None
+
+            cpe_classes = get_classes(cpe_str)
+
+            # The version of an URI is detected validating it with each
+            # candidate class, even if it comes from a trusted source
+            check = validate or (len(cpe_classes) > 1)
+
+            for cpe_class in cpe_classes:
+                try:
+                    c = cpe_class(cpe_str, validate=check)
+                except (ValueError, NotImplementedError) as e:
+                    # Keep the error of the most likely version
+                    if error is None:
+                        error = e
+                else:
+                    break
+
+            if c is not None:
+                yield c
+            elif raises:
+                if sniff or (error is None):
+                    raise NotImplementedError(errmsg)
+                raise error
+            elif collect:
+                reason = errmsg if error is None else str(error)
+                errors.append((line, cpe_str, reason))
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,180 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module contains a bounded cache of parsed CPE Names, shared by all
+the versions of Common Platform Enumeration (CPE) specification.
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+from collections import OrderedDict
+import threading
+
+
+class CPECache(object):
+    """
+    Represents a cache of parsed CPE Names with a maximum size.
+    When the cache is full, the least recently used CPE Name is removed.
+
+    The keys are pairs (CPE Name string, requested version or class),
+    the values are frozen CPE Names, so they can be shared safely.
+    The cache can be used from several threads at once.
+    """
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    #: Default maximum count of CPE Names stored in cache
+    DEFAULT_MAXSIZE = 65536
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        Creates an empty cache.
+
+        :param int maxsize: maximum count of CPE Names stored in cache
+        :returns: None
+        :exception: ValueError - invalid maximum size
+        """
+
+        if maxsize < 1:
+            errmsg = "Invalid maximum size of cache: {0}".format(maxsize)
+            raise ValueError(errmsg)
+
+        #: Maximum count of CPE Names stored in cache
+        self.maxsize = maxsize
+
+        #: Count of CPE Names found in cache
+        self.hits = 0
+
+        #: Count of CPE Names not found in cache
+        self.misses = 0
+
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Returns the count of CPE Names stored in cache.
+
+        :returns: count of CPE Names stored in cache
+        :rtype: int
+
+        TEST: empty cache
+
+        >>> len(CPECache())
+        0
+        """
+
+        return len(self._data)
+
+    def __str__(self):
+        """
+        Returns a human-readable representation of cache.
+
+        :returns: Representation of cache as string
+        :rtype: string
+        """
+
+        return "CPE cache: {0}/{1} names, {2} hits, {3} misses".format(
+            len(self), self.maxsize, self.hits, self.misses)
+
+    def clear(self):
+        """
+        Removes all the CPE Names of cache and resets the counters.
+
+        :returns: None
+        """
+
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key):
+        """
+        Returns the CPE Name stored in cache with input key and marks it
+        as the most recently used, or None if it is not stored.
+
+        :param tuple key: CPE Name string and requested version or class
+        :returns: CPE Name stored or None
+        :rtype: CPE
+
+        TEST: a CPE Name not stored
+
+        >>> cache = CPECache()
+        >>> cache.get(('cpe:/a:mozilla:firefox', None)) is None
+        True
+        >>> cache.misses
+        1
+        """
+
+        with self._lock:
+            value = self._data.pop(key, None)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._data[key] = value
+
+        return value
+
+    def put(self, key, value):
+        """
+        Stores a CPE Name in cache as the most recently used,
+        removing the least recently used one if cache is full.
+
+        :param tuple key: CPE Name string and requested version or class
+        :param CPE value: frozen CPE Name
+        :returns: None
+
+        TEST: least recently used CPE Name removed
+
+        >>> cache = CPECache(2)
+        >>> cache.put(('a', None), 1)
+        >>> cache.put(('b', None), 2)
+        >>> cache.get(('a', None))
+        1
+        >>> cache.put(('c', None), 3)
+        >>> cache.get(('b', None)) is None
+        True
+        >>> len(cache)
+        2
+        """
+
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,613 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module contains a compact collection of many CPE Names of version 2.3
+of Common Platform Enumeration (CPE) specification, stored by columns.
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+from array import array
+import mmap
+import struct
+import sys
+import zlib
+
+from .cpe import CPE
+from .cpe2_3 import CPE2_3
+from .cperecord import CPERecord
+from .cpeset2_3 import CPESet2_3
+from .comp.cpecomp import CPEComponent
+from .comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+
+
+class CPECollection(object):
+    """
+    Represents a large collection of CPE Names of version 2.3, stored as
+    eleven columns of integers, one per attribute. Each integer is the
+    code of the value of attribute in a table of strings shared by all
+    the columns, so each distinct value is stored once.
+
+    The values are WFN values, as in the records of CPE Names: the string
+    values with double quotes, "ANY", "NA" and None (undefined value).
+    The logical values have reserved codes.
+
+    The rows are converted into CPE Names of version 2.3 with WFN style
+    only when they are read.
+
+    TEST: distinct vendors
+
+    >>> names = CPECollection(['cpe:/a:microsoft:ie:8.0',
+    ...                        'cpe:/o:microsoft:windows_xp',
+    ...                        'cpe:2.3:a:mozilla:firefox:*:*:*:*:*:*:*:*'])
+    >>> names.distinct(CPEComponent.ATT_VENDOR)
+    ['"microsoft"', '"mozilla"']
+    >>> names[1].as_fs()
+    'cpe:2.3:o:microsoft:windows_xp:*:*:*:*:*:*:*:*'
+    """
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    #: Code of logical value ANY
+    CODE_ANY = 0
+
+    #: Code of logical value NA
+    CODE_NA = 1
+
+    #: Code of undefined value
+    CODE_UNDEFINED = 2
+
+    #: Type of the items of columns: unsigned integers
+    _TYPECODE = "I"
+
+    #: Count of codes reserved for the logical values
+    _RESERVED_CODES = 3
+
+    # Binary format of collections (see dump)
+
+    #: Version of binary format
+    FORMAT_VERSION = 1
+
+    #: Magic number at the beginning of the binary format
+    _FORMAT_MAGIC = b"CPEC"
+
+    #: Header of binary format, little-endian: magic number, version of
+    #: format, count of attributes, count of rows, count of strings,
+    #: length of strings in bytes and checksum of the rest of data
+    _FORMAT_HEADER = struct.Struct("<4sHHIIII")
+
+    #: Type of the offsets of strings and the codes of values in binary
+    #: format: unsigned integers of four bytes
+    _FORMAT_TYPECODE = "I" if array("I").itemsize == 4 else "L"
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _array_from_bytes(cls, data):
+        """
+        Returns the array of unsigned integers of four bytes stored in
+        data, little-endian.
+
+        :param bytes data: integers stored
+        :returns: array of integers
+        :rtype: array
+        """
+
+        a = array(CPECollection._FORMAT_TYPECODE)
+
+        if hasattr(a, "frombytes"):
+            a.frombytes(data)
+        else:
+            # Python 2
+            a.fromstring(data)
+
+        if sys.byteorder == "big":
+            a.byteswap()
+
+        return a
+
+    @classmethod
+    def _array_to_bytes(cls, a):
+        """
+        Returns the integers of array stored as unsigned integers of four
+        bytes, little-endian.
+
+        :param array a: array of integers
+        :returns: integers stored
+        :rtype: bytes
+        """
+
+        a = array(CPECollection._FORMAT_TYPECODE, a)
+
+        if sys.byteorder == "big":
+            a.byteswap()
+
+        if hasattr(a, "tobytes"):
+            return a.tobytes()
+
+        # Python 2
+        return a.tostring()
+
+    @classmethod
+    def _padding(cls, size):
+        """
+        Returns the bytes needed to align data of input size to four bytes.
+
+        :param int size: length of data
+        :returns: bytes of padding
+        :rtype: bytes
+        """
+
+        return b"\0" * (-size % 4)
+
+    @classmethod
+    def load(cls, f):
+        """
+        Returns the collection of CPE Names stored in a file with the
+        binary format written by dump. The file is memory-mapped if it
+        is possible, and the values are not parsed nor checked again.
+
+        :param file f: file opened in binary mode
+        :returns: collection of CPE Names
+        :rtype: CPECollection
+        :exception: ValueError - bad-formed data, incompatible version of
+            format or wrong checksum
+
+        TEST: a collection stored in memory
+
+        >>> from io import BytesIO
+        >>> f = BytesIO()
+        >>> CPECollection(['cpe:/a:microsoft:ie:8.0']).dump(f)
+        >>> names = CPECollection.load(BytesIO(f.getvalue()))
+        >>> names.get_record(0).as_uri_2_3()
+        'cpe:/a:microsoft:ie:8.0'
+        """
+
+        try:
+            m = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, EnvironmentError, ValueError):
+            # Not a file on disk, or empty
+            data = f.read()
+        else:
+            try:
+                data = m[:]
+            finally:
+                m.close()
+
+        header = CPECollection._FORMAT_HEADER
+
+        if len(data) < header.size:
+            errmsg = "Bad-formed collection: truncated header"
+            raise ValueError(errmsg)
+
+        (magic, version, att_count, row_count, str_count, str_len,
+         checksum) = header.unpack(data[:header.size])
+
+        if magic != CPECollection._FORMAT_MAGIC:
+            errmsg = "Bad-formed collection: wrong magic number"
+            raise ValueError(errmsg)
+
+        if version != CPECollection.FORMAT_VERSION:
+            errmsg = "Version {0} of collection format not implemented".format(
+                version)
+            raise ValueError(errmsg)
+
+        keys = CPEComponent.CPE_COMP_KEYS_EXTENDED
+        if att_count != len(keys):
+            errmsg = "Bad-formed collection: {0} attributes".format(att_count)
+            raise ValueError(errmsg)
+
+        payload = data[header.size:]
+        if zlib.crc32(payload) & 0xffffffff != checksum:
+            errmsg = "Bad-formed collection: wrong checksum"
+            raise ValueError(errmsg)
+
+        # Offsets of strings, strings and codes, aligned to four bytes
+        pos = (str_count + 1) * 4
+        offsets = CPECollection._array_from_bytes(payload[:pos])
+        blob = payload[pos:pos + str_len]
+        pos += str_len + len(CPECollection._padding(str_len))
+
+        if (len(payload) != pos + row_count * len(keys) * 4 or
+           len(blob) != str_len):
+            errmsg = "Bad-formed collection: truncated data"
+            raise ValueError(errmsg)
+
+        bounds = zip(offsets, offsets[1:])
+        text = blob.decode("utf-8")
+        if len(text) == len(blob):
+            # ASCII strings: the offsets of bytes are offsets of characters
+            strings = [text[start:end] for start, end in bounds]
+        else:
+            strings = [blob[start:end].decode("utf-8")
+                       for start, end in bounds]
+
+        c = CPECollection()
+        c._values.extend(strings)
+
+        # The codes of values are only needed to add or find values
+        c._codes = None
+
+        # The codes are not checked: the checksum verifies the data written
+        size = row_count * 4
+        for ck in keys:
+            column = CPECollection._array_from_bytes(payload[pos:pos + size])
+            if column.typecode != CPECollection._TYPECODE:
+                column = array(CPECollection._TYPECODE, column)
+
+            c._columns[ck] = column
+            pos += size
+
+        return c
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __getitem__(self, i):
+        """
+        Returns the i'th CPE Name of collection, or a new collection with
+        the CPE Names of a slice.
+
+        :param int i: CPE Name index or slice
+        :returns: CPE Name found or collection
+        :rtype: CPE2_3_WFN or CPECollection
+        :exception: IndexError - index out of range
+        """
+
+        if isinstance(i, slice):
+            c = self._new_with_table()
+            for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+                c._columns[ck] = self._columns[ck][i]
+
+            return c
+
+        return self.get_record(i).to_cpe(CPE2_3.STYLE_WFN)
+
+    def __init__(self, names=None, validate=True):
+        """
+        Creates a collection of CPE Names.
+
+        :param iterable names: CPE Names to add, optional
+        :param boolean validate: False to not check the values of
+            components of the CPE Name strings
+        :returns: None
+        :exception: ValueError - invalid version of CPE Name
+        """
+
+        #: Table of strings: the value of each code
+        self._values = [CPEComponent2_3_WFN.VALUE_ANY,
+                        CPEComponent2_3_WFN.VALUE_NA,
+                        CPERecord.VALUE_UNDEFINED]
+
+        #: Code of each value in table of strings, None if it is not
+        #: computed yet
+        self._codes = dict((v, code) for code, v in enumerate(self._values))
+
+        #: Columns of codes of values by attribute
+        self._columns = dict((ck, array(CPECollection._TYPECODE))
+                             for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED)
+
+        if names is not None:
+            self.extend(names, validate)
+
+    def __iter__(self):
+        """
+        Returns an iterator of the CPE Names of collection.
+
+        :returns: generator of CPE Names with WFN style
+        :rtype: generator
+        """
+
+        for i in range(len(self)):
+            yield self[i]
+
+    def __len__(self):
+        """
+        Returns the count of CPE Names of collection.
+
+        :returns: count of CPE Names
+        :rtype: int
+        """
+
+        return len(self._columns[CPEComponent.ATT_PART])
+
+    def _get_code(self, value):
+        """
+        Returns the code of input value, adding it to the table of strings
+        if it does not exist.
+
+        :param string value: WFN value
+        :returns: code of value
+        :rtype: int
+        """
+
+        codes = self._get_codes()
+        code = codes.get(value)
+
+        if code is None:
+            code = len(self._values)
+            self._values.append(value)
+            codes[value] = code
+
+        return code
+
+    def _get_codes(self):
+        """
+        Returns the code of each value in table of strings, computing it
+        the first time.
+
+        :returns: dictionary of codes of values
+        :rtype: dict
+        """
+
+        codes = self._codes
+
+        if codes is None:
+            values = self._values
+            codes = dict(zip(values, range(len(values))))
+            self._codes = codes
+
+        return codes
+
+    def _new_with_table(self):
+        """
+        Returns a new empty collection sharing the table of strings of
+        this collection: the table only grows, so the codes are valid in
+        both collections.
+
+        :returns: empty collection
+        :rtype: CPECollection
+        """
+
+        c = CPECollection()
+        c._values = self._values
+        c._codes = self._get_codes()
+
+        return c
+
+    def dump(self, f):
+        """
+        Writes the collection to a file with a binary format, versioned,
+        that is loaded again with load without parsing the CPE Names.
+
+        The format is little-endian, and begins with a header: the magic
+        number "CPEC", the version of format and the count of attributes
+        (two bytes each), the count of rows, the count of strings, the
+        length of strings in bytes and the CRC-32 checksum of the rest
+        of data (four bytes each). Then, the table of strings: the
+        offsets of the strings, one more than the count, and the strings
+        encoded in UTF-8, padded to four bytes. Finally, the codes of
+        values of the rows, four bytes each, stored by attributes as the
+        columns of collection: the code of the j'th attribute of the i'th
+        row is at a fixed position, so it can be read directly from a
+        memory-mapped file. The codes of logical values are reserved,
+        and the code of each string is its index in the table plus the
+        count of reserved codes.
+
+        :param file f: file opened in binary mode
+        :returns: None
+        """
+
+        keys = CPEComponent.CPE_COMP_KEYS_EXTENDED
+
+        strings = [v.encode("utf-8")
+                   for v in self._values[CPECollection._RESERVED_CODES:]]
+
+        offsets = [0]
+        for v in strings:
+            offsets.append(offsets[-1] + len(v))
+
+        blob = b"".join(strings)
+
+        payload = b"".join([
+            CPECollection._array_to_bytes(offsets),
+            blob,
+            CPECollection._padding(len(blob))] + [
+            CPECollection._array_to_bytes(self._columns[ck]) for ck in keys])
+
+        f.write(CPECollection._FORMAT_HEADER.pack(
+            CPECollection._FORMAT_MAGIC, CPECollection.FORMAT_VERSION,
+            len(keys), len(self), len(strings), len(blob),
+            zlib.crc32(payload) & 0xffffffff))
+        f.write(payload)
+
+    def append(self, cpe, validate=True):
+        """
+        Adds a CPE Name to collection.
+
+        :param CPE cpe: CPE Name of version 2.3, its record or its string
+        :param boolean validate: False to not check the values of
+            components of a CPE Name string
+        :returns: None
+        :exception: ValueError - invalid version of CPE Name
+        """
+
+        if not isinstance(cpe, (CPE, CPERecord)):
+            cpe = CPE(cpe, validate=validate)
+
+        if cpe.VERSION != CPE.VERSION_2_3:
+            errmsg = "CPE Name version {0} not valid, version 2.3 expected".format(
+                cpe.VERSION)
+            raise ValueError(errmsg)
+
+        if isinstance(cpe, CPE):
+            cpe = CPERecord.from_cpe(cpe)
+
+        values = cpe.get_values()
+
+        for ck, value in zip(CPEComponent.CPE_COMP_KEYS_EXTENDED, values):
+            self._columns[ck].append(self._get_code(value))
+
+    def column(self, att):
+        """
+        Returns the values of input attribute of all the CPE Names
+        of collection.
+
+        :param string att: attribute name
+        :returns: list of WFN values
+        :rtype: list
+        :exception: KeyError - invalid attribute name
+        """
+
+        values = self._values
+        return [values[code] for code in self._columns[att]]
+
+    def distinct(self, att):
+        """
+        Returns the distinct string values of input attribute in
+        collection, sorted.
+
+        :param string att: attribute name
+        :returns: sorted list of WFN string values
+        :rtype: list
+        :exception: KeyError - invalid attribute name
+        """
+
+        values = self._values
+        codes = set(self._columns[att])
+
+        return sorted(values[code] for code in codes
+                      if code > CPECollection.CODE_UNDEFINED)
+
+    def extend(self, names, validate=True):
+        """
+        Adds several CPE Names to collection.
+
+        :param iterable names: CPE Names of version 2.3, their records
+            or their strings
+        :param boolean validate: False to not check the values of
+            components of the CPE Name strings
+        :returns: None
+        :exception: ValueError - invalid version of CPE Name
+        """
+
+        for cpe in names:
+            self.append(cpe, validate)
+
+    def filter(self, att, code):
+        """
+        Returns a new collection with the CPE Names of this collection
+        whose value of input attribute has the input code.
+
+        :param string att: attribute name
+        :param int code: code of value, from get_code
+        :returns: collection of CPE Names
+        :rtype: CPECollection
+        :exception: KeyError - invalid attribute name
+
+        TEST: CPE Names of a vendor
+
+        >>> names = CPECollection(['cpe:/a:microsoft:ie:8.0',
+        ...                        'cpe:/a:mozilla:firefox:3.0',
+        ...                        'cpe:/o:microsoft:windows_xp'])
+        >>> att = CPEComponent.ATT_VENDOR
+        >>> ms = names.filter(att, names.get_code('"microsoft"'))
+        >>> ms.column(CPEComponent.ATT_PRODUCT)
+        ['"ie"', '"windows_xp"']
+        """
+
+        c = self._new_with_table()
+        column = self._columns[att]
+        rows = [i for i in range(len(column)) if column[i] == code]
+
+        for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+            src = self._columns[ck]
+            c._columns[ck] = array(CPECollection._TYPECODE,
+                                   [src[i] for i in rows])
+
+        return c
+
+    def get_code(self, value):
+        """
+        Returns the code of input WFN value in collection, or None if no
+        CPE Name of collection has it.
+
+        :param string value: WFN value: string value with double quotes,
+            "ANY", "NA" or None (undefined value)
+        :returns: code of value
+        :rtype: int
+        """
+
+        return self._get_codes().get(value)
+
+    def get_record(self, i):
+        """
+        Returns the record of the i'th CPE Name of collection.
+
+        :param int i: CPE Name index to find
+        :returns: record of CPE Name with WFN style
+        :rtype: CPERecord
+        :exception: IndexError - index out of range
+        """
+
+        values = self._values
+        row = [values[self._columns[ck][i]]
+               for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED]
+
+        return CPERecord.from_values(CPE.VERSION_2_3, CPE2_3.STYLE_WFN, row)
+
+    def to_set(self):
+        """
+        Returns a set with the records of the CPE Names of collection.
+        The rows with the same values are added once.
+
+        :returns: set of CPE Names
+        :rtype: CPESet2_3
+
+        TEST: a CPE Name repeated
+
+        >>> names = CPECollection(['cpe:/a:microsoft:ie:8.0',
+        ...                        'cpe:/a:mozilla:firefox:2.0',
+        ...                        'cpe:/a:microsoft:ie:8.0'])
+        >>> len(names.to_set())
+        2
+        """
+
+        s = CPESet2_3()
+        rows = set()
+        records = []
+
+        columns = [self._columns[ck]
+                   for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED]
+
+        for i, row in enumerate(zip(*columns)):
+            if row not in rows:
+                rows.add(row)
+                records.append(self.get_record(i))
+
+        # The rows are already unique: the strings of members are found
+        # when some CPE Name is added to set
+        s.K.extend(records)
+
+        return s
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
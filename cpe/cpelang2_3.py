@@ -33,8 +33,7 @@ feedback about it, please contact:
 from .cpeset2_3 import CPESet2_3
 from .cpelang import CPELanguage
 from .cpe2_3_wfn import CPE2_3_WFN
-from .cpe2_3_uri import CPE2_3_URI
-from .cpe2_3_fs import CPE2_3_FS
+from .cpetranscoder import CPETranscoder
 
 
 class CPELanguage2_3(CPELanguage):
@@ -151,19 +150,19 @@ class CPELanguage2_3(CPELanguage):
         :rtype: CPE2_3_WFN
         """
 
+        # The bound form is converted to WFN string without creating the
+        # CPE Name of its style
         try:
-            fs = CPE2_3_FS(boundname)
+            wfn = CPETranscoder.fs_to_wfn(boundname)
         except:
             # CPE name is not formatted string
             try:
-                uri = CPE2_3_URI(boundname)
+                wfn = CPETranscoder.uri_to_wfn(boundname)
             except:
                 # CPE name is not URI but WFN
-                return CPE2_3_WFN(boundname)
-            else:
-                return CPE2_3_WFN(uri.as_wfn())
-        else:
-            return CPE2_3_WFN(fs.as_wfn())
+                wfn = boundname
+
+        return CPE2_3_WFN(wfn)
 
     ####################
     #  OBJECT METHODS  #
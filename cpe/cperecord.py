@@ -0,0 +1,374 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module contains a compact and immutable representation of a CPE Name
+of any version of Common Platform Enumeration (CPE) specification.
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+from .cpe import CPE
+from .comp.cpecomp import CPEComponent
+from .cpetranscoder import CPETranscoder
+from .comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+from .comp.cpecomp_anyvalue import CPEComponentAnyValue
+from .comp.cpecomp_empty import CPEComponentEmpty
+from .comp.cpecomp_notapplicable import CPEComponentNotApplicable
+from .comp.cpecomp_undefined import CPEComponentUndefined
+
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: intern is a builtin function
+    pass
+
+
+class CPERecord(tuple):
+    """
+    Represents a CPE Name as an immutable and hashable tuple with its
+    version, its style and the values of its eleven attributes, instead
+    of the dictionary of elements of components of CPE class.
+
+    Each value is stored as WFN value: the string values with double
+    quotes, and the logical values as "ANY" or "NA". Besides, None is an
+    undefined value and the empty string is an empty value (version 1.1).
+    The string values are interned, so they are shared by all the records.
+
+    The records allow matching with CPESet2_3 and binding to the styles of
+    version 2.3, as CPE objects do, using about a hundred bytes per name.
+
+    TEST: a formatted string
+
+    >>> r = CPERecord.parse('cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*')
+    >>> r.get_attribute_values(CPEComponent.ATT_VERSION)
+    ['"8\\\\.0"']
+    >>> r.as_uri_2_3()
+    'cpe:/a:microsoft:ie:8.0'
+    """
+
+    __slots__ = ()
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    #: Position of version of CPE Name in record
+    _VERSION_IDX = 0
+
+    #: Position of style of CPE Name in record
+    _STYLE_IDX = 1
+
+    #: Position of value of each attribute in record
+    _ATT_IDX = dict((ck, i + 2) for i, ck in enumerate(
+        CPEComponent.CPE_COMP_KEYS_EXTENDED))
+
+    #: Undefined value of attribute
+    VALUE_UNDEFINED = None
+
+    #: Empty value of attribute (version 1.1 of CPE specification)
+    VALUE_EMPTY = ""
+
+    #: Value of attribute for each tag of logical value in the flat view
+    #: of CPE Name
+    _values_by_tag = {
+        CPE._TAG_ANY: CPEComponent2_3_WFN.VALUE_ANY,
+        CPE._TAG_NA: CPEComponent2_3_WFN.VALUE_NA,
+        CPE._TAG_UNDEFINED: VALUE_UNDEFINED,
+        CPE._TAG_EMPTY: VALUE_EMPTY}
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def from_cpe(cls, cpe):
+        """
+        Returns the record of input CPE Name of any version and style.
+
+        CPE Names are case-insensitive: the values of CPE Names of version
+        1.1, which keep the case of the input string, are stored in
+        lower-case letters, as the ones parsed in the other versions.
+
+        :param CPE cpe: CPE Name
+        :returns: record of CPE Name
+        :rtype: CPERecord
+        :exception: TypeError - incompatible version: CPE Name of
+            version 1.1 with two or more elements
+        :exception: ValueError - CPE Name of version 1.1 without elements
+
+        TEST: a CPE Name of version 1.1 with an empty value
+
+        >>> r = CPERecord.from_cpe(CPE('cpe:///microsoft::xp'))
+        >>> r.VERSION
+        '1.1'
+        >>> r.as_fs()
+        'cpe:2.3:a:microsoft:*:xp:*:*:*:*:*:*:*'
+        """
+
+        values = [cpe.VERSION, getattr(cpe, "STYLE", None)]
+        lower = cpe.VERSION == CPE.VERSION_1_1
+
+        view = cpe._get_flat_view()
+        if view is not None:
+            # The components of the only element of CPE Name, with tags
+            for comp, tag in zip(view.components, view.tags):
+                if tag == CPE._TAG_VALUE:
+                    value = CPERecord._get_string_value(comp, lower)
+                else:
+                    value = CPERecord._values_by_tag[tag]
+
+                values.append(value)
+
+            return tuple.__new__(cls, values)
+
+        for ck in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+            lc = cpe._get_attribute_components(ck)
+
+            if len(lc) > 1:
+                # Incompatible version 1.1, there are two or more elements
+                # in CPE Name
+                errmsg = "Incompatible version {0} with record".format(
+                    cpe.VERSION)
+                raise TypeError(errmsg)
+
+            if not lc:
+                errmsg = "CPE Name '{0}' without elements".format(cpe.cpe_str)
+                raise ValueError(errmsg)
+
+            comp = lc[0]
+
+            if isinstance(comp, CPEComponentUndefined):
+                value = CPERecord.VALUE_UNDEFINED
+            elif isinstance(comp, CPEComponentEmpty):
+                value = CPERecord.VALUE_EMPTY
+            elif isinstance(comp, CPEComponentAnyValue):
+                value = CPEComponent2_3_WFN.VALUE_ANY
+            elif isinstance(comp, CPEComponentNotApplicable):
+                value = CPEComponent2_3_WFN.VALUE_NA
+            else:
+                value = CPERecord._get_string_value(comp, lower)
+
+            values.append(value)
+
+        return tuple.__new__(cls, values)
+
+    @classmethod
+    def from_values(cls, version, style, values):
+        """
+        Returns the record with input version, style and WFN values.
+
+        :param string version: version of CPE specification of CPE Name
+        :param string style: style of CPE Name of version 2.3
+        :param list values: WFN values of the attributes, in the order of
+            CPEComponent.CPE_COMP_KEYS_EXTENDED
+        :returns: record of CPE Name
+        :rtype: CPERecord
+        :exception: ValueError - incorrect count of values
+        """
+
+        if len(values) != len(CPEComponent.CPE_COMP_KEYS_EXTENDED):
+            errmsg = "Incorrect count of values: {0}".format(len(values))
+            raise ValueError(errmsg)
+
+        return tuple.__new__(cls, [version, style] + list(values))
+
+    @classmethod
+    def _get_string_value(cls, comp, lower=False):
+        """
+        Returns the value of component with string value as stored in
+        record: its WFN value with double quotes, interned.
+
+        :param CPEComponentSimple comp: component with string value
+        :param boolean lower: True to store the value in lower-case letters
+        :returns: value of component
+        :rtype: string
+        """
+
+        value = comp.as_wfn()
+        if lower:
+            value = value.lower()
+
+        return intern('"{0}"'.format(value))
+
+    @classmethod
+    def parse(cls, cpe_str, version=None, validate=True):
+        """
+        Returns the record of input CPE Name string.
+
+        :param string cpe_str: CPE Name string
+        :param string version: version of CPE specification of CPE Name
+        :param boolean validate: False to not check the values of components
+        :returns: record of CPE Name
+        :rtype: CPERecord
+        :exception: NotImplementedError - incorrect CPE Name or
+            version of CPE not implemented
+        :exception: TypeError - incompatible version
+        :exception: ValueError - CPE Name of version 1.1 without elements
+        """
+
+        return cls.from_cpe(CPE(cpe_str, version, validate))
+
+    ####################
+    #  OBJECT METHODS  #
+    ####################
+
+    def __repr__(self):
+        """
+        Returns a unambiguous representation of record.
+
+        :returns: Representation of record as string
+        :rtype: string
+        """
+
+        return "{0}({1})".format(self.__class__.__name__, self.as_wfn())
+
+    def __str__(self):
+        """
+        Returns a human-readable representation of record.
+
+        :returns: Representation of record as string
+        :rtype: string
+        """
+
+        return self.as_wfn()
+
+    def as_fs(self):
+        """
+        Returns the CPE Name as formatted string of version 2.3.
+
+        :returns: CPE Name as formatted string
+        :rtype: string
+        """
+
+        return CPETranscoder.bind_fs(self.get_values())
+
+    def as_uri_2_3(self):
+        """
+        Returns the CPE Name as URI string of version 2.3.
+
+        :returns: CPE Name as URI string of version 2.3
+        :rtype: string
+        """
+
+        return CPETranscoder.bind_uri(self.get_values())
+
+    def as_wfn(self):
+        """
+        Returns the CPE Name as Well-Formed Name string of version 2.3.
+
+        :returns: CPE Name as WFN string
+        :rtype: string
+        """
+
+        return CPETranscoder.bind_wfn(self.get_values())
+
+    def get_attribute_values(self, att_name):
+        """
+        Returns the values of attribute "att_name" of CPE Name, as WFN
+        values: a list with a only value.
+
+        :param string att_name: Attribute name to get
+        :returns: List of attribute values
+        :rtype: list
+        :exception: ValueError - invalid attribute name
+        """
+
+        if not CPEComponent.is_valid_attribute(att_name):
+            errmsg = "Invalid attribute name '{0}'".format(att_name)
+            raise ValueError(errmsg)
+
+        value = self[CPERecord._ATT_IDX[att_name]]
+
+        if ((value is CPERecord.VALUE_UNDEFINED) or
+           (value == CPERecord.VALUE_EMPTY)):
+            value = CPEComponent2_3_WFN.VALUE_ANY
+
+        return [value]
+
+    def get_values(self):
+        """
+        Returns the WFN values of the attributes of CPE Name, in the order
+        of CPEComponent.CPE_COMP_KEYS_EXTENDED: the string values with
+        double quotes, "ANY", "NA", None (undefined value) or the empty
+        string (empty value).
+
+        :returns: values of attributes
+        :rtype: tuple
+        """
+
+        return self[CPERecord._ATT_IDX[CPEComponent.ATT_PART]:]
+
+    def to_cpe(self, style=None):
+        """
+        Returns the CPE Name of version 2.3 of the record, with the input
+        style. By default, the style of the record; the records of
+        versions 1.1 and 2.2 are converted to WFN style, which keeps
+        all their values.
+
+        :param string style: style of version 2.3 of CPE Name
+        :returns: CPE Name of version 2.3
+        :rtype: CPE2_3
+        :exception: NotImplementedError - style not implemented
+
+        TEST: conversion to WFN
+
+        >>> r = CPERecord.parse('cpe:/a:microsoft:ie:8.0')
+        >>> r.to_cpe().cpe_str
+        'cpe:/a:microsoft:ie:8.0'
+        >>> r.to_cpe('WFN').get_version()
+        ['"8\\\\.0"']
+        """
+
+        from .cpe2_3 import CPE2_3
+
+        if style is None:
+            if self.VERSION == CPE.VERSION_2_3:
+                style = self.STYLE
+            else:
+                style = CPE2_3.STYLE_WFN
+
+        if style == CPE2_3.STYLE_FS:
+            cpe_str = self.as_fs()
+        elif style == CPE2_3.STYLE_URI:
+            cpe_str = self.as_uri_2_3()
+        elif style == CPE2_3.STYLE_WFN:
+            cpe_str = self.as_wfn()
+        else:
+            errmsg = "Style '{0}' of version 2.3 of CPE not implemented".format(
+                style)
+            raise NotImplementedError(errmsg)
+
+        # The values come from a parsed CPE Name: they are not checked again
+        return CPE._get_cpe_classes()[style](cpe_str, validate=False)
+
+    #: Version of CPE specification of CPE Name
+    VERSION = property(lambda self: self[CPERecord._VERSION_IDX])
+
+    #: Style of CPE Name of version 2.3, None in other versions
+    STYLE = property(lambda self: self[CPERecord._STYLE_IDX])
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
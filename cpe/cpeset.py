@@ -34,6 +34,65 @@ from .cpe import CPE
 from .comp.cpecomp import CPEComponent
 
 
+def _changing(method):
+    """
+    Returns the method of list that counts the modification of the list
+    before doing it.
+    """
+
+    def change(self, *args, **kwargs):
+        self._changes += 1
+
+        return method(self, *args, **kwargs)
+
+    return change
+
+
+class _Members(list):
+    """
+    Represents the members of a set of CPE Names: a list that counts its
+    modifications other than adding members at the end, so the strings
+    and the index of the members of set are built again after them.
+    """
+
+    #: Count of modifications other than adding members at the end
+    _changes = 0
+
+    __setitem__ = _changing(list.__setitem__)
+    __delitem__ = _changing(list.__delitem__)
+    __imul__ = _changing(list.__imul__)
+    insert = _changing(list.insert)
+    pop = _changing(list.pop)
+    remove = _changing(list.remove)
+    reverse = _changing(list.reverse)
+    sort = _changing(list.sort)
+
+    if hasattr(list, "clear"):
+        # Python 3
+        clear = _changing(list.clear)
+    else:
+        # Python 2
+        __setslice__ = _changing(list.__setslice__)
+        __delslice__ = _changing(list.__delslice__)
+
+
+class _MembersNames(object):
+    """
+    Represents the strings of the members of a set of CPE Names, to find
+    in constant time if a CPE Name is already in set. It stores the list
+    of members, its count of modifications and the count of members
+    added, to update it when the list changes.
+    """
+
+    __slots__ = ("members", "changes", "count", "strs")
+
+    def __init__(self, members):
+        self.members = members
+        self.changes = members._changes
+        self.count = 0
+        self.strs = set()
+
+
 class CPESet(object):
     """
     Represents a set of CPE Names.
@@ -44,6 +103,36 @@ class CPESet(object):
         - match a CPE Name against a set of CPE Names.
     """
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _get_member(cls, cpe):
+        """
+        Returns the CPE Name as it is stored in set.
+
+        :param CPE cpe: CPE Name to store in set
+        :returns: CPE Name to store in set
+        :rtype: CPE
+        :exception: NotImplementedError - Method not implemented
+        """
+
+        errmsg = "Method not implemented. Use the method of some child class"
+        raise NotImplementedError(errmsg)
+
+    @classmethod
+    def _get_name_str(cls, cpe):
+        """
+        Returns the string of CPE Name stored in set, to find it in set.
+
+        :param CPE cpe: CPE Name stored in set
+        :returns: CPE Name string
+        :rtype: string
+        """
+
+        return cpe.cpe_str
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -66,7 +155,10 @@ class CPESet(object):
 
         :returns: None
         """
-        self.K = []
+        self.K = _Members()
+
+        #: Strings of members, to find the CPE Names added to set
+        self._names = None
 
     def __len__(self):
         """
@@ -106,6 +198,37 @@ class CPESet(object):
 
         return "\n".join(str)
 
+    def _update_names(self):
+        """
+        Returns the strings of the members of set, adding the members
+        appended since the last time, or finding them again if the
+        members were modified in other way.
+
+        :returns: strings of members, or None if the members are not
+            stored in a list of members of set
+        :rtype: _MembersNames
+        """
+
+        members = self.K
+        if not isinstance(members, _Members):
+            return None
+
+        names = self._names
+
+        if ((names is None) or (names.members is not members) or
+           (names.changes != members._changes) or
+           (names.count > len(members))):
+
+            names = _MembersNames(members)
+            self._names = names
+
+        if names.count < len(members):
+            names.strs.update(self._get_name_str(k)
+                              for k in members[names.count:])
+            names.count = len(members)
+
+        return names
+
     def append(self, cpe):
         """
         Adds a CPE Name to the set if not already.
@@ -118,6 +241,50 @@ class CPESet(object):
         errmsg = "Method not implemented. Use the method of some child class"
         raise NotImplementedError(errmsg)
 
+    def extend(self, cpes):
+        """
+        Adds the CPE Names to the set if not already. All the CPE Names
+        are checked before adding any of them, and the CPE Names repeated
+        are added once.
+
+        :param iterable cpes: CPE Names to store in set
+        :returns: None
+        :exception: ValueError - invalid version of CPE Name
+
+        TEST: CPE Names repeated
+
+        >>> from .cpeset2_2 import CPESet2_2
+        >>> from .cpe2_2 import CPE2_2
+        >>> s = CPESet2_2()
+        >>> s.append(CPE2_2('cpe:/h:hp'))
+        >>> s.extend([CPE2_2('cpe:/h:hp'), CPE2_2('cpe:/a:hp:insight'),
+        ...           CPE2_2('cpe:/a:hp:insight')])
+        >>> len(s)
+        2
+        """
+
+        members = [self._get_member(cpe) for cpe in cpes]
+
+        names = self._update_names()
+        if names is None:
+            # Members not stored in a list of members of set
+            strs = set(self._get_name_str(k) for k in self.K)
+        else:
+            strs = names.strs
+
+        added = []
+        for cpe in members:
+            cpe_str = self._get_name_str(cpe)
+
+            if cpe_str not in strs:
+                strs.add(cpe_str)
+                added.append(cpe)
+
+        self.K.extend(added)
+
+        if names is not None:
+            names.count = len(self.K)
+
     def name_match(self, cpe):
         """
         Accepts a set of known instances of CPE Names and a candidate CPE Name,
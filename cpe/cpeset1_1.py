@@ -49,6 +49,28 @@ class CPESet1_1(CPESet):
     #: Version of CPE set
     VERSION = "1.1"
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _get_member(cls, cpe):
+        """
+        Returns the CPE Name as it is stored in set: the same CPE Name.
+
+        :param CPE cpe: CPE Name to store in set
+        :returns: CPE Name to store in set
+        :rtype: CPE
+        :exception: ValueError - invalid version of CPE Name
+        """
+
+        if cpe.VERSION != CPE.VERSION_1_1:
+            msg = "CPE Name version {0} not valid, version 1.1 expected".format(
+                cpe.VERSION)
+            raise ValueError(msg)
+
+        return cpe
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -71,16 +93,7 @@ class CPESet1_1(CPESet):
         >>> s.append(c1)
         """
 
-        if cpe.VERSION != CPE.VERSION_1_1:
-            msg = "CPE Name version {0} not valid, version 1.1 expected".format(
-                cpe.VERSION)
-            raise ValueError(msg)
-
-        for k in self.K:
-            if cpe.cpe_str == k.cpe_str:
-                return None
-
-        self.K.append(cpe)
+        self.extend([cpe])
 
     def name_match(self, cpe):
         """
@@ -51,6 +51,28 @@ class CPESet2_2(CPESet):
     #: Version of CPE set
     VERSION = "2.2"
 
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _get_member(cls, cpe):
+        """
+        Returns the CPE Name as it is stored in set: the same CPE Name.
+
+        :param CPE cpe: CPE Name to store in set
+        :returns: CPE Name to store in set
+        :rtype: CPE
+        :exception: ValueError - invalid version of CPE Name
+        """
+
+        if cpe.VERSION != CPE.VERSION_2_2:
+            errmsg = "CPE Name version {0} not valid, version 2.2 expected".format(
+                cpe.VERSION)
+            raise ValueError(errmsg)
+
+        return cpe
+
     ####################
     #  OBJECT METHODS  #
     ####################
@@ -74,16 +96,7 @@ class CPESet2_2(CPESet):
         >>> s.append(c1)
         """
 
-        if cpe.VERSION != CPE.VERSION_2_2:
-            errmsg = "CPE Name version {0} not valid, version 2.2 expected".format(
-                cpe.VERSION)
-            raise ValueError(errmsg)
-
-        for k in self.K:
-            if cpe.cpe_str == k.cpe_str:
-                return None
-
-        self.K.append(cpe)
+        self.extend([cpe])
 
     def name_match(self, cpe):
         """
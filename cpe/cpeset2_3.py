@@ -32,9 +32,141 @@ feedback about it, please contact:
 
 from .cpe2_3 import CPE2_3
 from .cpe2_3_wfn import CPE2_3_WFN
+from .cpecache import CPECache
+from .cperecord import CPERecord
 from .comp.cpecomp import CPEComponent
 from .comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
-from .cpeset import CPESet
+from .cpeset import CPESet, _Members
+
+
+class _MembersIndex(object):
+    """
+    Represents the index of the members of a set of CPE Names of version
+    2.3 by the values of its indexed attributes: the compared forms of
+    the members and, for each attribute, the positions of members by key
+    of value and the positions of members whose value has not key. The
+    index stores the list of members, its count of modifications and
+    the count of members indexed, to update it when the list changes.
+    """
+
+    __slots__ = ("members", "changes", "count", "forms", "buckets", "others")
+
+    def __init__(self, members, atts):
+        self.members = members
+        self.changes = members._changes
+        self.count = 0
+        self.forms = []
+        self.buckets = dict((att, dict()) for att in atts)
+        self.others = dict((att, []) for att in atts)
+
+
+class _StringMatcher(object):
+    """
+    Represents a source string value of an attribute compiled to compare
+    it with target string values: the source string without its initial
+    "*" and its final wildcards, -1 if it begins with "*" or 0 otherwise,
+    the count of final "?" wildcards or -1 if it ends with "*", and the
+    count of escape characters from each position of the source string
+    without wildcards.
+    """
+
+    __slots__ = ("core", "begins", "ends", "escapes")
+
+    def __init__(self, source):
+        start = 0
+        end = len(source)
+        begins = 0
+        ends = 0
+
+        # Reading of initial wildcard in source
+        if source.startswith(CPEComponent2_3_WFN.WILDCARD_MULTI):
+            # Source starts with "*"
+            start = 1
+            begins = -1
+
+        # Reading of final wildcard in source
+        if (source.endswith(CPEComponent2_3_WFN.WILDCARD_MULTI) and
+           CPESet2_3._is_even_wildcards(source, end - 1)):
+
+            # Source ends in "*"
+            end -= 1
+            ends = -1
+        else:
+            while ((end > 0) and
+                   source.endswith(CPEComponent2_3_WFN.WILDCARD_ONE, end - 1, end) and
+                   CPESet2_3._is_even_wildcards(source, end - 1)):
+
+                # Source ends in "?"
+                end -= 1
+                ends += 1
+
+        core = source[start: end]
+
+        escapes = [0] * (len(core) + 1)
+        for i in range(len(core) - 1, -1, -1):
+            escapes[i] = escapes[i + 1] + (core[i] == "\\")
+
+        self.core = core
+        self.begins = begins
+        self.ends = ends
+        self.escapes = escapes
+
+    def is_superset(self, target):
+        """
+        Returns True if the source string is SUPERSET of the target
+        string, and False if they are DISJOINT.
+
+        The escape characters of target are counted once, in linear time,
+        as the source string without wildcards is found in it.
+
+        :param string target: target string value
+        :returns: True if the source string is SUPERSET of target string
+        :rtype: boolean
+        """
+
+        core = self.core
+        escapes = self.escapes
+
+        if len(target) == 0:
+            return False
+
+        # Count of escape characters of target before index and in target
+        before = 0
+        total = None
+        last = 0
+
+        index = target.find(core)
+        while index != -1:
+            before += target.count("\\", last, index)
+            last = index
+
+            if ((index > 0) and (self.begins != -1) and
+               (self.begins < (index - before))):
+
+                break
+
+            if total is None:
+                total = target.count("\\")
+
+            after = total - before
+            if (index < len(target)) and (target[index] == "\\"):
+                after -= 1
+
+            if index < len(core):
+                source_escapes = escapes[index + 1]
+            else:
+                source_escapes = 0
+
+            leftover = len(target) - index + source_escapes - after - len(core)
+            if ((leftover > 0) and ((self.ends != -1) and
+               (leftover > self.ends))):
+
+                index = target.find(core, index + 1)
+                continue
+
+            return True
+
+        return False
 
 
 class CPESet2_3(CPESet):
@@ -66,6 +198,31 @@ class CPESet2_3(CPESet):
     # Version of CPE set
     VERSION = "2.3"
 
+    #: Attributes indexed to find the candidate members matching a name
+    _INDEXED_ATTS = (CPEComponent.ATT_PART,
+                     CPEComponent.ATT_VENDOR,
+                     CPEComponent.ATT_PRODUCT)
+
+    #: Position of the indexed attributes in the compared forms
+    _INDEXED_IDXS = tuple(CPEComponent.CPE_COMP_KEYS_EXTENDED.index(att)
+                          for att in _INDEXED_ATTS)
+
+    #: Position of the attributes not indexed in the compared forms
+    _OTHER_IDXS = tuple(sorted(
+        set(range(len(CPEComponent.CPE_COMP_KEYS_EXTENDED))) -
+        set(_INDEXED_IDXS)))
+
+    #: Maximum count of source strings compiled into matchers
+    _MATCHERS_MAXSIZE = 4096
+
+    ###############
+    #  VARIABLES  #
+    ###############
+
+    #: Matchers of source strings by source string, the least recently
+    #: used ones are removed when the maximum count is reached
+    _matchers = CPECache(_MATCHERS_MAXSIZE)
+
     ###################
     #  CLASS METHODS  #
     ###################
@@ -120,6 +277,41 @@ class CPESet2_3(CPESet):
         # If we get to this point, we are comparing two strings
         return CPESet2_3._compare_strings(source, target)
 
+    @classmethod
+    def _compare_items(cls, source, target):
+        """
+        Compares two values associated with a attribute of two WFNs, in
+        compared form, as _compare does with the values.
+
+        :param tuple source: First attribute value in compared form
+        :param tuple target: Second attribute value in compared form
+        :returns: The attribute comparison relation.
+        :rtype: int
+        """
+
+        # Unquoted wildcard characters in the target yield an undefined
+        # result
+        if target[2]:
+            return CPESet2_3.LOGICAL_VALUE_UNDEFINED
+
+        source = source[0]
+        target = target[0]
+
+        if (source == target):
+            return CPESet2_3.LOGICAL_VALUE_EQUAL
+
+        if (source == CPEComponent2_3_WFN.VALUE_ANY):
+            return CPESet2_3.LOGICAL_VALUE_SUPERSET
+
+        if (target == CPEComponent2_3_WFN.VALUE_ANY):
+            return CPESet2_3.LOGICAL_VALUE_SUBSET
+
+        if ((source == CPEComponent2_3_WFN.VALUE_NA) or
+           (target == CPEComponent2_3_WFN.VALUE_NA)):
+            return CPESet2_3.LOGICAL_VALUE_DISJOINT
+
+        return CPESet2_3._compare_strings(source, target)
+
     @classmethod
     def _compare_strings(cls, source, target):
         """
@@ -134,66 +326,24 @@ class CPESet2_3(CPESet):
         It also properly differentiates between unquoted and quoted
         special characters.
 
+        The source string is compiled once into a matcher, stored in the
+        matchers of class to compare it with other target strings. The
+        least recently used matchers are removed when they are too many.
+
         :param string source: First string value
         :param string target: Second string value
         :returns: The comparison relation among input strings.
         :rtype: int
         """
 
-        start = 0
-        end = len(source)
-        begins = 0
-        ends = 0
-
-        # Reading of initial wildcard in source
-        if source.startswith(CPEComponent2_3_WFN.WILDCARD_MULTI):
-            # Source starts with "*"
-            start = 1
-            begins = -1
-        else:
-            while ((start < len(source)) and
-                   source.startswith(CPEComponent2_3_WFN.WILDCARD_ONE,
-                                     start, start)):
-                # Source starts with one or more "?"
-                start += 1
-                begins += 1
-
-        # Reading of final wildcard in source
-        if (source.endswith(CPEComponent2_3_WFN.WILDCARD_MULTI) and
-           CPESet2_3._is_even_wildcards(source, end - 1)):
-
-            # Source ends in "*"
-            end -= 1
-            ends = -1
-        else:
-            while ((end > 0) and
-                   source.endswith(CPEComponent2_3_WFN.WILDCARD_ONE, end - 1, end) and
-                   CPESet2_3._is_even_wildcards(source, end - 1)):
-
-                # Source ends in "?"
-                end -= 1
-                ends += 1
-
-        source = source[start: end]
-        index = -1
-        leftover = len(target)
+        matchers = CPESet2_3._matchers
+        matcher = matchers.get(source)
 
-        while (leftover > 0):
-            index = target.find(source, index + 1)
-            if (index == -1):
-                break
-            escapes = target.count("\\", 0, index)
-            if ((index > 0) and (begins != -1) and
-               (begins < (index - escapes))):
-
-                break
-
-            escapes = target.count("\\", index + 1)
-            source_escapes = source.count("\\", index + 1)
-            leftover = len(target) - index + source_escapes - escapes - len(source)
-            if ((leftover > 0) and ((ends != -1) and (leftover > ends))):
-                continue
+        if matcher is None:
+            matcher = _StringMatcher(source)
+            matchers.put(source, matcher)
 
+        if matcher.is_superset(target):
             return CPESet2_3.LOGICAL_VALUE_SUPERSET
 
         return CPESet2_3.LOGICAL_VALUE_DISJOINT
@@ -235,6 +385,149 @@ class CPESet2_3(CPESet):
                     return True
         return False
 
+    @classmethod
+    def _get_index_key(cls, item):
+        """
+        Returns the key of the value of an attribute of a member of set
+        in the index of set, or None if the value is not indexed.
+
+        The string value of a member only can be matched by a string
+        value without wildcards equal to it, or to it with some final
+        backslashes more or less, if it does not begin with backslash:
+        so the key of a string value is itself without final backslashes.
+        The key of a logical value is itself.
+
+        :param tuple item: value in compared form
+        :returns: key of value
+        :rtype: string
+        """
+
+        value, is_string, has_wildcards = item
+
+        if not is_string:
+            return value
+
+        if (value == "") or value.startswith("\\"):
+            return None
+
+        return value.rstrip("\\")
+
+    @classmethod
+    def _get_compared_form(cls, cpe, items=None):
+        """
+        Returns the values of all the attributes of CPE Name in compared
+        form, in the order of CPEComponent.CPE_COMP_KEYS_EXTENDED.
+
+        :param CPE2_3_WFN cpe: WFN CPE Name or record of CPE Name
+        :param dict items: values in compared form by value, to find
+            the compared form of each value once
+        :returns: values of attributes in compared form
+        :rtype: tuple
+        """
+
+        if items is None:
+            return tuple(CPESet2_3._get_compared_item(cpe, att)
+                         for att in CPEComponent.CPE_COMP_KEYS_EXTENDED)
+
+        if isinstance(cpe, CPERecord):
+            # The undefined and empty values are compared as value ANY
+            values = [value or CPEComponent2_3_WFN.VALUE_ANY
+                      for value in cpe.get_values()]
+        else:
+            values = [cpe.get_attribute_values(att)[0]
+                      for att in CPEComponent.CPE_COMP_KEYS_EXTENDED]
+
+        form = []
+        for value in values:
+            item = items.get(value)
+            if item is None:
+                item = CPESet2_3._get_value_item(value)
+                items[value] = item
+
+            form.append(item)
+
+        return tuple(form)
+
+    @classmethod
+    def _get_compared_item(cls, cpe, att):
+        """
+        Returns the value of an attribute of CPE Name in the form it is
+        compared to match CPE Names: a tuple with the logical value, or the
+        string value in lower-case letters and without double quotes, True
+        if it is a string value and True if it is a string value with
+        unquoted wildcards.
+
+        :param CPE2_3_WFN cpe: WFN CPE Name or record of CPE Name
+        :param string att: attribute name
+        :returns: value of attribute in compared form
+        :rtype: tuple
+        """
+
+        return CPESet2_3._get_value_item(cpe.get_attribute_values(att)[0])
+
+    @classmethod
+    def _get_value_item(cls, value):
+        """
+        Returns the value of an attribute, as returned by
+        get_attribute_values, in compared form.
+
+        :param string value: value of attribute
+        :returns: value of attribute in compared form
+        :rtype: tuple
+        """
+
+        if value.find('"') > -1:
+            # Not a logical value: del double quotes
+            value = value[1:-1]
+
+        if not CPESet2_3._is_string(value):
+            return (value, False, False)
+
+        value = value.lower()
+
+        return (value, True, CPESet2_3._contains_wildcards(value))
+
+    @classmethod
+    def _get_member(cls, cpe):
+        """
+        Returns the CPE Name as it is stored in set: the WFN CPE Names and
+        the records of CPE Names without conversion, and other CPE Names
+        converted to WFN style.
+
+        :param CPE cpe: CPE Name or record of CPE Name to store in set
+        :returns: CPE Name or record of CPE Name to store in set
+        :rtype: CPE2_3_WFN or CPERecord
+        :exception: ValueError - invalid version of CPE Name or invalid
+            CPE Name in WFN style
+        """
+
+        if cpe.VERSION != CPE2_3.VERSION:
+            errmsg = "CPE Name version {0} not valid, version 2.3 expected".format(
+                cpe.VERSION)
+            raise ValueError(errmsg)
+
+        if not isinstance(cpe, (CPE2_3_WFN, CPERecord)):
+            # Convert the CPE Name to WFN
+            cpe = CPE2_3_WFN(cpe.as_wfn())
+
+        return cpe
+
+    @classmethod
+    def _get_name_str(cls, cpe):
+        """
+        Returns the CPE Name as lower-case string, to find it in set.
+        The records of CPE Names are identified by their WFN string.
+
+        :param CPE cpe: CPE Name or record of CPE Name
+        :returns: CPE Name string
+        :rtype: string
+        """
+
+        if isinstance(cpe, CPERecord):
+            return cpe.as_wfn().lower()
+
+        return cpe._str
+
     @classmethod
     def _is_even_wildcards(cls, str, idx):
         """
@@ -291,17 +584,10 @@ class CPESet2_3(CPESet):
 
         # Compare results using the get() function in WFN
         for att in CPEComponent.CPE_COMP_KEYS_EXTENDED:
-            value_src = source.get_attribute_values(att)[0]
-            if value_src.find('"') > -1:
-                # Not a logical value: del double quotes
-                value_src = value_src[1:-1]
-
-            value_tar = target.get_attribute_values(att)[0]
-            if value_tar.find('"') > -1:
-                # Not a logical value: del double quotes
-                value_tar = value_tar[1:-1]
+            item_src = CPESet2_3._get_compared_item(source, att)
+            item_tar = CPESet2_3._get_compared_item(target, att)
 
-            yield (att, CPESet2_3._compare(value_src, value_tar))
+            yield (att, CPESet2_3._compare_items(item_src, item_tar))
 
     @classmethod
     def cpe_disjoint(cls, source, target):
@@ -367,6 +653,35 @@ class CPESet2_3(CPESet):
                 return False
         return True
 
+    @classmethod
+    def _is_superset_form(cls, source, target, idxs=None):
+        """
+        Returns True if the set-theoretic relation between two WFNs in
+        compared form is (non-proper) SUPERSET, as cpe_superset does
+        with the WFNs.
+
+        :param tuple source: first WFN CPE Name in compared form
+        :param tuple target: second WFN CPE Name in compared form
+        :param tuple idxs: positions of the attributes compared, all of
+            them by default
+        :returns: True if the set relation between source and target
+            is SUPERSET, otherwise False.
+        :rtype: boolean
+        """
+
+        if idxs is None:
+            items = zip(source, target)
+        else:
+            items = [(source[i], target[i]) for i in idxs]
+
+        for item_src, item_tar in items:
+            result = CPESet2_3._compare_items(item_src, item_tar)
+            if ((result != CPESet2_3.LOGICAL_VALUE_SUPERSET) and
+               (result != CPESet2_3.LOGICAL_VALUE_EQUAL)):
+                return False
+
+        return True
+
     @classmethod
     def cpe_superset(cls, source, target):
         """
@@ -394,49 +709,241 @@ class CPESet2_3(CPESet):
     #  OBJECT METHODS  #
     ####################
 
+    def __init__(self):
+        """
+        Creates an empty set of CPE Names.
+
+        :returns: None
+        """
+
+        super(CPESet2_3, self).__init__()
+
+        #: Index of members, built when some CPE Name is matched
+        self._index = None
+
+    @classmethod
+    def _get_candidates(cls, form, index):
+        """
+        Returns the positions of the members of set that can match input
+        CPE Name, found in the index of set: the members with the values
+        of the indexed attribute with less candidates that can match the
+        value of CPE Name. A member with value ANY only can match value
+        ANY, and the source values ANY or with wildcards can match any
+        member, so they do not restrict the candidates.
+
+        :param tuple form: CPE Name to match in compared form
+        :param _MembersIndex index: index of the members of set
+        :returns: positions of candidate members, not sorted
+        :rtype: list
+        """
+
+        candidates = range(len(index.forms))
+
+        for att, i in zip(CPESet2_3._INDEXED_ATTS, CPESet2_3._INDEXED_IDXS):
+            value = form[i][0]
+
+            if value == CPEComponent2_3_WFN.VALUE_ANY:
+                continue
+            elif value == CPEComponent2_3_WFN.VALUE_NA:
+                members = index.buckets[att].get(value, [])
+            elif ((value == "") or
+                  (value.find(CPEComponent2_3_WFN.WILDCARD_MULTI) > -1) or
+                  (value.find(CPEComponent2_3_WFN.WILDCARD_ONE) > -1)):
+                continue
+            else:
+                members = index.buckets[att].get(value.rstrip("\\"), [])
+                others = index.others[att]
+                if others:
+                    members = members + others
+
+            if len(members) < len(candidates):
+                candidates = members
+
+        return candidates
+
+    def _update_index(self):
+        """
+        Returns the index of the members of set, adding the members
+        appended since the last time, or building it again if the members
+        were modified in other way.
+
+        :returns: index of members, or None if the members are not
+            stored in a list of members of set
+        :rtype: _MembersIndex
+        """
+
+        members = self.K
+        if not isinstance(members, _Members):
+            return None
+
+        index = self._index
+
+        if ((index is None) or (index.members is not members) or
+           (index.changes != members._changes) or
+           (index.count > len(members))):
+
+            index = _MembersIndex(members, CPESet2_3._INDEXED_ATTS)
+            self._index = index
+
+        for i in range(index.count, len(members)):
+            form = CPESet2_3._get_compared_form(members[i])
+            index.forms.append(form)
+
+            for att, j in zip(CPESet2_3._INDEXED_ATTS,
+                              CPESet2_3._INDEXED_IDXS):
+                key = CPESet2_3._get_index_key(form[j])
+
+                if key is None:
+                    index.others[att].append(i)
+                else:
+                    index.buckets[att].setdefault(key, []).append(i)
+
+        index.count = len(members)
+
+        return index
+
     def append(self, cpe):
         """
         Adds a CPE element to the set if not already.
         Only WFN CPE Names are valid, so this function converts the input CPE
-        object of version 2.3 to WFN style.
+        object of version 2.3 to WFN style. The records of CPE Names are
+        stored without conversion.
 
-        :param CPE cpe: CPE Name to store in set
+        :param CPE cpe: CPE Name or record of CPE Name to store in set
         :returns: None
-        :exception: ValueError - invalid version of CPE Name
+        :exception: ValueError - invalid version of CPE Name or invalid
+            CPE Name in WFN style
         """
 
-        if cpe.VERSION != CPE2_3.VERSION:
-            errmsg = "CPE Name version {0} not valid, version 2.3 expected".format(
-                cpe.VERSION)
-            raise ValueError(errmsg)
-
-        for k in self.K:
-            if cpe._str == k._str:
-                return None
-
-        if isinstance(cpe, CPE2_3_WFN):
-            self.K.append(cpe)
-        else:
-            # Convert the CPE Name to WFN
-            wfn = CPE2_3_WFN(cpe.as_wfn())
-            self.K.append(wfn)
+        self.extend([cpe])
 
     def name_match(self, wfn):
         """
         Accepts a set of CPE Names K and a candidate CPE Name X. It returns
         'True' if X matches any member of K, and 'False' otherwise.
 
+        Only the members found in the index of set by the values of part,
+        vendor and product of X are compared with it, in the compared form
+        stored in the index. X is converted to WFN style as the members of
+        set, as in match_many.
+
         :param CPESet self: A set of m known CPE Names K = {K1, K2, …, Km}.
         :param CPE cpe: A candidate CPE Name X.
         :returns: True if X matches K, otherwise False.
         :rtype: boolean
+        :exception: ValueError - invalid version of CPE Name or invalid
+            CPE Name in WFN style
         """
 
-        for N in self.K:
-            if CPESet2_3.cpe_superset(wfn, N):
+        form = CPESet2_3._get_compared_form(CPESet2_3._get_member(wfn))
+
+        index = self._update_index()
+        if index is None:
+            # Members not stored in a list of members of set
+            candidates = (CPESet2_3._get_compared_form(N) for N in self.K)
+        else:
+            candidates = (index.forms[i]
+                          for i in CPESet2_3._get_candidates(form, index))
+
+        for N in candidates:
+            if CPESet2_3._is_superset_form(form, N):
                 return True
         return False
 
+    def match_many(self, cpes, indices=False):
+        """
+        Accepts a set of CPE Names K and many candidate CPE Names of
+        version 2.3 of any style. It returns, for each candidate CPE Name
+        X, 'True' if the WFN of X matches any member of K and 'False'
+        otherwise, as name_match, or the positions of the members of K
+        matched by X.
+
+        The candidate CPE Names with the same values of part, vendor and
+        product are grouped, and the members of K found in the index of
+        set for a group are compared with these values once. The
+        candidate CPE Names with the same values are compared once.
+
+        :param iterable cpes: candidate CPE Names or records of CPE Names
+        :param boolean indices: if True, returns the positions of the
+            members matched instead of True or False
+        :returns: for each candidate CPE Name, True if it matches K,
+            otherwise False, or the sorted positions of members matched
+        :rtype: list
+        :exception: ValueError - invalid version of CPE Name
+
+        TEST: CPE Names of different styles
+
+        >>> from .cpe import CPE
+        >>> s = CPESet2_3()
+        >>> s.append(CPE('cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*'))
+        >>> s.append(CPE('cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*'))
+        >>> s.append(CPE('cpe:2.3:a:microsoft:ie:*:*:*:*:*:*:*:*'))
+        >>> names = [CPE('cpe:2.3:a:microsoft:ie:*:*:*:*:*:*:*:*'),
+        ...          CPE('cpe:/a:mozilla:firefox:3.0', CPE.VERSION_2_3)]
+        >>> s.match_many(names)
+        [True, False]
+        >>> s.match_many(names, indices=True)
+        [[0, 2], []]
+        """
+
+        # Values of candidates in compared form by value
+        items = dict()
+
+        forms = [CPESet2_3._get_compared_form(CPESet2_3._get_member(cpe),
+                                               items)
+                 for cpe in cpes]
+
+        index = self._update_index()
+        if index is None:
+            # Members not stored in a list of members of set
+            members = [CPESet2_3._get_compared_form(N) for N in self.K]
+        else:
+            members = index.forms
+
+        # Positions of the members matched by the values of part, vendor
+        # and product of candidates, and results of candidates
+        groups = dict()
+        results = dict()
+
+        matches = []
+
+        for form in forms:
+            result = results.get(form)
+
+            if result is None:
+                key = tuple(form[i] for i in CPESet2_3._INDEXED_IDXS)
+
+                candidates = groups.get(key)
+                if candidates is None:
+                    if index is None:
+                        candidates = range(len(members))
+                    else:
+                        candidates = CPESet2_3._get_candidates(form, index)
+
+                    candidates = sorted(
+                        i for i in candidates
+                        if CPESet2_3._is_superset_form(
+                            form, members[i], CPESet2_3._INDEXED_IDXS))
+                    groups[key] = candidates
+
+                result = []
+                for i in candidates:
+                    if CPESet2_3._is_superset_form(form, members[i],
+                                                   CPESet2_3._OTHER_IDXS):
+                        result.append(i)
+                        if not indices:
+                            break
+
+                if not indices:
+                    result = len(result) > 0
+                results[form] = result
+
+            if indices:
+                result = list(result)
+            matches.append(result)
+
+        return matches
+
 if __name__ == "__main__":
     import doctest
     doctest.testmod()
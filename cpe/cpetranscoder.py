@@ -0,0 +1,586 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+This file is part of cpe package.
+
+This module converts CPE Names of version 2.3 of Common Platform
+Enumeration (CPE) specification between the styles FS, URI and WFN,
+working on the strings, without creating CPE objects.
+
+Copyright (C) 2013  Alejandro Galindo García, Roberto Abdelkader Martínez Pérez
+
+This program is free software: you can redistribute it and/or modify
+it under the terms of the GNU Lesser General Public License as published by
+the Free Software Foundation, either version 3 of the License, or
+(at your option) any later version.
+
+This program is distributed in the hope that it will be useful,
+but WITHOUT ANY WARRANTY; without even the implied warranty of
+MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+GNU Lesser General Public License for more details.
+
+You should have received a copy of the GNU Lesser General Public License
+along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+For any problems using the cpe package, or general questions and
+feedback about it, please contact:
+
+- Alejandro Galindo García: galindo.garcia.alejandro@gmail.com
+- Roberto Abdelkader Martínez Pérez: robertomartinezp@gmail.com
+"""
+
+
+from .cpe import CPE
+from .cpe2_3_fs import CPE2_3_FS
+from .cpe2_3_uri import CPE2_3_URI
+from .cpe2_3_wfn import CPE2_3_WFN
+from .comp.cpecomp import CPEComponent
+from .comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from .comp.cpecomp2_3_uri import CPEComponent2_3_URI
+from .comp.cpecomp2_3_uri_edpacked import CPEComponent2_3_URI_edpacked
+from .comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+from .comp.cpecomp_simple import CPEComponentSimple
+
+
+class CPETranscoder(object):
+    """
+    Converts CPE Names of version 2.3 between the binding styles formatted
+    string (FS), URI and WFN.
+
+    Each CPE Name string is unbound into the WFN values of its eleven
+    attributes, in the order of CPEComponent.CPE_COMP_KEYS_EXTENDED, and
+    these values are bound to the string of the other style, with the
+    same rules and results than the CPE objects but without creating
+    them: the string values with double quotes, "ANY", "NA" and None
+    (undefined value), as in the records of CPE Names.
+
+    TEST: a formatted string to URI
+
+    >>> fs = 'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*'
+    >>> CPETranscoder.fs_to_uri(fs)
+    'cpe:/a:microsoft:internet_explorer:8.0.6001:beta'
+
+    TEST: an URI with packed edition to formatted string
+
+    >>> uri = 'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~'
+    >>> CPETranscoder.uri_to_fs(uri)
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:*:*:*:online:win2003:x64:*'
+    """
+
+    ###############
+    #  CONSTANTS  #
+    ###############
+
+    #: Position of value of each attribute in list of values
+    _ATT_IDX = dict((ck, i) for i, ck in enumerate(
+        CPEComponent.CPE_COMP_KEYS_EXTENDED))
+
+    #: Attributes packed in edition attribute of URI, in order
+    _PACKED_KEYS = (CPEComponent.ATT_EDITION,
+                    CPEComponent.ATT_SW_EDITION,
+                    CPEComponent.ATT_TARGET_SW,
+                    CPEComponent.ATT_TARGET_HW,
+                    CPEComponent.ATT_OTHER)
+
+    #: Undefined value of attribute
+    VALUE_UNDEFINED = None
+
+    #: Empty value of attribute (version 1.1 of CPE specification)
+    VALUE_EMPTY = ""
+
+    ###################
+    #  CLASS METHODS  #
+    ###################
+
+    @classmethod
+    def _get_uri_value(cls, value):
+        """
+        Returns the WFN value encoded as URI.
+
+        :param string value: WFN value
+        :returns: value as URI
+        :rtype: string
+        """
+
+        if value == CPEComponent2_3_WFN.VALUE_NA:
+            return CPEComponent2_3_URI.VALUE_NA
+        elif ((value is CPETranscoder.VALUE_UNDEFINED) or
+              (value == CPETranscoder.VALUE_EMPTY) or
+              (value == CPEComponent2_3_WFN.VALUE_ANY)):
+            return CPEComponent2_3_URI.VALUE_ANY
+        else:
+            return CPEComponentSimple._bind_to_uri(
+                value[1:-1], CPEComponentSimple._uri_unquoted)
+
+    @classmethod
+    def _get_uri_values(cls, att, value, validate):
+        """
+        Returns the WFN values of attribute "att" of CPE Name with URI
+        style: a list with the value, or the five values packed in it if
+        it is the edition attribute.
+
+        :param string att: attribute name
+        :param string value: value of attribute, None if undefined
+        :param boolean validate: False to not check the values
+        :returns: list of pairs of attribute and WFN value
+        :rtype: list
+        :exception: ValueError - invalid value of attribute
+        """
+
+        sep = CPEComponent2_3_URI.SEPARATOR_PACKED_EDITION
+
+        if ((att == CPEComponent.ATT_EDITION) and value and
+           (value[0] == sep)):
+
+            # Unpack the five values of edition, ignoring the rest
+            try:
+                packed = CPEComponent2_3_URI_edpacked._unpack_value(value)
+            except ValueError:
+                errmsg = "Bad-formed CPE Name: not correct value '{0}'".format(
+                    value)
+                raise ValueError(errmsg)
+
+            pairs = zip(CPETranscoder._PACKED_KEYS, packed)
+        else:
+            pairs = [(att, value)]
+
+        result = []
+
+        for ck, v in pairs:
+            if v is None:
+                wfn_value = CPETranscoder.VALUE_UNDEFINED
+            elif v == CPEComponent2_3_URI.VALUE_ANY:
+                wfn_value = CPEComponent2_3_WFN.VALUE_ANY
+            elif v == CPEComponent2_3_URI.VALUE_NA:
+                wfn_value = CPEComponent2_3_WFN.VALUE_NA
+            else:
+                if validate and not CPEComponent2_3_URI.validate(ck, v):
+                    errmsg = "Bad-formed CPE Name: not correct value '{0}'".format(
+                        value)
+                    raise ValueError(errmsg)
+
+                wfn_value = '"{0}"'.format(
+                    CPEComponent2_3_URI._decode_value(v))
+
+            result.append((ck, wfn_value))
+
+        return result
+
+    @classmethod
+    def _pack_edition(cls, values):
+        """
+        Pack the values of the five attributes into the simple edition
+        value of URI. If all the values except edition are blank, just
+        return the edition.
+
+        :param list values: WFN values of CPE Name
+        :returns: "edition", "sw_edition", "target_sw", "target_hw" and "other"
+            attributes packed in a only value
+        :rtype: string
+        """
+
+        idx = CPETranscoder._ATT_IDX
+
+        packed = [CPETranscoder._get_uri_value(values[idx[ck]])
+                  for ck in CPETranscoder._PACKED_KEYS]
+
+        return CPEComponent2_3_URI_edpacked._pack_values(packed)
+
+    @classmethod
+    def bind_fs(cls, values):
+        """
+        Returns the formatted string of the CPE Name with input values.
+
+        :param list values: WFN values of CPE Name
+        :returns: CPE Name as formatted string
+        :rtype: string
+        """
+
+        fs = []
+
+        for value in values:
+            if value == CPEComponent2_3_WFN.VALUE_NA:
+                v = CPEComponent2_3_FS.VALUE_NA
+            elif ((value is CPETranscoder.VALUE_UNDEFINED) or
+                  (value == CPETranscoder.VALUE_EMPTY) or
+                  (value == CPEComponent2_3_WFN.VALUE_ANY)):
+                v = CPEComponent2_3_FS.VALUE_ANY
+            else:
+                v = CPEComponentSimple._bind_to_fs(value[1:-1])
+
+            fs.append(v)
+
+        sep = CPEComponent2_3_FS.SEPARATOR_COMP
+        return CPE._trim(CPE.PREFIX_FS + sep.join(fs))
+
+    @classmethod
+    def bind_uri(cls, values):
+        """
+        Returns the URI of the CPE Name with input values.
+
+        :param list values: WFN values of CPE Name
+        :returns: CPE Name as URI string of version 2.3
+        :rtype: string
+        """
+
+        uri = []
+
+        for ck in CPEComponent.CPE_COMP_KEYS:
+            if ck == CPEComponent.ATT_EDITION:
+                # Call the pack() helper function to compute the proper
+                # binding for the edition element
+                uri.append(CPETranscoder._pack_edition(values))
+            else:
+                uri.append(CPETranscoder._get_uri_value(
+                    values[CPETranscoder._ATT_IDX[ck]]))
+
+        # Return the URI string, with trailing separator trimmed
+        sep = CPEComponent2_3_URI.SEPARATOR_COMP
+        return CPE._trim(CPE.PREFIX_URI + sep.join(uri))
+
+    @classmethod
+    def bind_wfn(cls, values):
+        """
+        Returns the WFN string of the CPE Name with input values.
+
+        :param list values: WFN values of CPE Name
+        :returns: CPE Name as WFN string
+        :rtype: string
+        """
+
+        wfn = []
+
+        for ck, value in zip(CPEComponent.CPE_COMP_KEYS_EXTENDED, values):
+            if ((value is CPETranscoder.VALUE_UNDEFINED) or
+               (value == CPETranscoder.VALUE_EMPTY)):
+                # Do not set the attribute
+                continue
+
+            wfn.append("{0}{1}{2}".format(
+                ck, CPEComponent2_3_WFN.SEPARATOR_PAIR, value))
+
+        return "{0}{1}{2}".format(CPE2_3_WFN.CPE_PREFIX,
+                                  CPEComponent2_3_WFN.SEPARATOR_COMP.join(wfn),
+                                  CPE2_3_WFN.CPE_SUFFIX)
+
+    @classmethod
+    def fs_to_uri(cls, cpe_str, validate=True):
+        """
+        Returns the formatted string of version 2.3 as URI string.
+
+        :param string cpe_str: CPE Name as formatted string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as URI string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+        """
+
+        return CPETranscoder.bind_uri(CPETranscoder.unbind_fs(cpe_str,
+                                                              validate))
+
+    @classmethod
+    def fs_to_wfn(cls, cpe_str, validate=True):
+        """
+        Returns the formatted string of version 2.3 as WFN string.
+
+        :param string cpe_str: CPE Name as formatted string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as WFN string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+
+        TEST:
+
+        >>> CPETranscoder.fs_to_wfn('cpe:2.3:o:microsoft:windows_xp:-:sp2:*:*:*:*:*:*')
+        'wfn:[part="o", vendor="microsoft", product="windows_xp", version=NA, update="sp2", edition=ANY, language=ANY, sw_edition=ANY, target_sw=ANY, target_hw=ANY, other=ANY]'
+        """
+
+        return CPETranscoder.bind_wfn(CPETranscoder.unbind_fs(cpe_str,
+                                                              validate))
+
+    @classmethod
+    def unbind_fs(cls, cpe_str, validate=True):
+        """
+        Returns the WFN values of the CPE Name as formatted string.
+
+        :param string cpe_str: CPE Name as formatted string
+        :param boolean validate: False to not check the values
+        :returns: WFN values of attributes
+        :rtype: list
+        :exception: ValueError - bad-formed CPE Name, or longer than the
+            maximum length
+        """
+
+        CPE._check_length(cpe_str)
+
+        # CPE Names are case-insensitive
+        s = cpe_str.lower()
+
+        # CPE Name must not have whitespaces
+        if (s.find(" ") != -1):
+            msg = "Bad-formed CPE Name: it must not have whitespaces"
+            raise ValueError(msg)
+
+        if not s.startswith(CPE.PREFIX_FS):
+            msg = "Bad-formed CPE Name: validation of parts failed"
+            raise ValueError(msg)
+
+        values = CPE2_3_FS._split(s[len(CPE.PREFIX_FS):])
+
+        if ((len(values) != CPE2_3_FS._COMP_COUNT) or
+           (values[0] not in CPE2_3_FS._PART_VALUES)):
+
+            msg = "Bad-formed CPE Name: validation of parts failed"
+            raise ValueError(msg)
+
+        result = []
+
+        for ck, value in zip(CPEComponent.CPE_COMP_KEYS_EXTENDED, values):
+            if (value == CPEComponent2_3_FS.VALUE_ANY):
+                value = CPEComponent2_3_WFN.VALUE_ANY
+            elif (value == CPEComponent2_3_FS.VALUE_NA):
+                value = CPEComponent2_3_WFN.VALUE_NA
+            else:
+                if validate and not CPEComponent2_3_FS.validate(ck, value):
+                    errmsg = "Bad-formed CPE Name: not correct value: {0}".format(
+                        value)
+                    raise ValueError(errmsg)
+
+                value = '"{0}"'.format(CPEComponent2_3_FS._decode_value(value))
+
+            result.append(value)
+
+        return result
+
+    @classmethod
+    def unbind_uri(cls, cpe_str, validate=True):
+        """
+        Returns the WFN values of the CPE Name as URI string of version 2.3.
+        The undefined attributes between two defined ones take the
+        logical value ANY.
+
+        :param string cpe_str: CPE Name as URI string
+        :param boolean validate: False to not check the values
+        :returns: WFN values of attributes
+        :rtype: list
+        :exception: ValueError - bad-formed CPE Name, or longer than the
+            maximum length
+
+        TEST: an undefined attribute in the middle
+
+        >>> CPETranscoder.unbind_uri('cpe:/a::firefox')
+        ['"a"', 'ANY', '"firefox"', None, None, None, None, None, None, None, None]
+        """
+
+        CPE._check_length(cpe_str)
+
+        # CPE Names are case-insensitive
+        s = cpe_str.lower()
+
+        # CPE Name must not have whitespaces
+        if (s.find(" ") != -1):
+            msg = "Bad-formed CPE Name: it must not have whitespaces"
+            raise ValueError(msg)
+
+        parts_match = CPE2_3_URI._match_parts(s)
+
+        if (parts_match is None):
+            msg = "Bad-formed CPE Name: validation of parts failed"
+            raise ValueError(msg)
+
+        result = [CPETranscoder.VALUE_UNDEFINED] * len(
+            CPEComponent.CPE_COMP_KEYS_EXTENDED)
+        idx = CPETranscoder._ATT_IDX
+        packed = False
+
+        for ck in CPEComponent.CPE_COMP_KEYS:
+            values = CPETranscoder._get_uri_values(
+                ck, parts_match.group(ck), validate)
+            packed = packed or len(values) > 1
+
+            for att, value in values:
+                result[idx[att]] = value
+
+        # Exchange the undefined values in middle attributes of CPE Name
+        # for logical value ANY, starting in the last attribute specified:
+        # an edition that is not packed is not considered specified
+        check_change = True
+
+        for ck in CPEComponent.CPE_COMP_KEYS[::-1]:
+            i = idx[ck]
+            undefined = result[i] is CPETranscoder.VALUE_UNDEFINED
+
+            if check_change:
+                if ck == CPEComponent.ATT_EDITION:
+                    check_change = not packed
+                else:
+                    check_change = undefined
+            elif undefined:
+                result[i] = CPEComponent2_3_WFN.VALUE_ANY
+
+        return result
+
+    @classmethod
+    def unbind_wfn(cls, cpe_str, validate=True):
+        """
+        Returns the WFN values of the CPE Name as WFN string.
+
+        :param string cpe_str: CPE Name as WFN string
+        :param boolean validate: False to not check the values
+        :returns: WFN values of attributes
+        :rtype: list
+        :exception: ValueError - bad-formed CPE Name, or longer than the
+            maximum length
+        """
+
+        CPE._check_length(cpe_str)
+
+        # CPE Names are case-insensitive
+        s = cpe_str.lower()
+
+        # Check prefix and initial bracket of WFN
+        if s[0:5] != CPE2_3_WFN.CPE_PREFIX:
+            errmsg = "Bad-formed CPE Name: WFN prefix not found"
+            raise ValueError(errmsg)
+
+        # Check final backet
+        if s[-1:] != CPE2_3_WFN.CPE_SUFFIX:
+            errmsg = "Bad-formed CPE Name: final bracket of WFN not found"
+            raise ValueError(errmsg)
+
+        result = [CPETranscoder.VALUE_UNDEFINED] * len(
+            CPEComponent.CPE_COMP_KEYS_EXTENDED)
+        content = s[5:-1]
+
+        if content == "":
+            return result
+
+        defined = set()
+
+        for e in content.split(CPEComponent2_3_WFN.SEPARATOR_COMP):
+            # Whitespace not valid in component names and values
+            if e.find(" ") != -1:
+                msg = "Bad-formed CPE Name: WFN with too many whitespaces"
+                raise ValueError(msg)
+
+            # Split pair attribute-value
+            pair = e.split(CPEComponent2_3_WFN.SEPARATOR_PAIR)
+
+            if len(pair) < 2:
+                msg = "Bad-formed CPE Name: invalid value '{0}'".format(e)
+                raise ValueError(msg)
+
+            att_name = pair[0]
+            att_value = pair[1]
+
+            # Check valid attribute name
+            if att_name not in CPETranscoder._ATT_IDX:
+                msg = "Bad-formed CPE Name: invalid attribute name '{0}'".format(
+                    att_name)
+                raise ValueError(msg)
+
+            if att_name in defined:
+                # Duplicate attribute
+                msg = "Bad-formed CPE Name: attribute '{0}' repeated".format(
+                    att_name)
+                raise ValueError(msg)
+
+            defined.add(att_name)
+
+            if not (att_value.startswith('"') and att_value.endswith('"')):
+                # Logical value
+                value = att_value.upper()
+                if ((value != CPEComponent2_3_WFN.VALUE_ANY) and
+                   (value != CPEComponent2_3_WFN.VALUE_NA)):
+
+                    msg = "Invalid logical value '{0}'".format(att_value)
+                    raise ValueError(msg)
+            else:
+                # String value
+                value = att_value[1:-1]
+                if validate and not CPEComponent2_3_WFN.validate(att_name,
+                                                                 value):
+                    msg = "Invalid value of attribute '{0}': {1}".format(
+                        att_name, value)
+                    raise ValueError(msg)
+
+                value = '"{0}"'.format(value)
+
+            result[CPETranscoder._ATT_IDX[att_name]] = value
+
+        return result
+
+    @classmethod
+    def uri_to_fs(cls, cpe_str, validate=True):
+        """
+        Returns the URI string of version 2.3 as formatted string.
+
+        :param string cpe_str: CPE Name as URI string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as formatted string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+        """
+
+        return CPETranscoder.bind_fs(CPETranscoder.unbind_uri(cpe_str,
+                                                              validate))
+
+    @classmethod
+    def uri_to_wfn(cls, cpe_str, validate=True):
+        """
+        Returns the URI string of version 2.3 as WFN string.
+
+        :param string cpe_str: CPE Name as URI string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as WFN string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+
+        TEST:
+
+        >>> CPETranscoder.uri_to_wfn('cpe:/a:microsoft:ie:8.%02')
+        'wfn:[part="a", vendor="microsoft", product="ie", version="8\\\\.*"]'
+        """
+
+        return CPETranscoder.bind_wfn(CPETranscoder.unbind_uri(cpe_str,
+                                                               validate))
+
+    @classmethod
+    def wfn_to_fs(cls, cpe_str, validate=True):
+        """
+        Returns the WFN string as formatted string.
+
+        :param string cpe_str: CPE Name as WFN string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as formatted string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+        """
+
+        return CPETranscoder.bind_fs(CPETranscoder.unbind_wfn(cpe_str,
+                                                              validate))
+
+    @classmethod
+    def wfn_to_uri(cls, cpe_str, validate=True):
+        """
+        Returns the WFN string as URI string of version 2.3.
+
+        :param string cpe_str: CPE Name as WFN string
+        :param boolean validate: False to not check the values
+        :returns: CPE Name as URI string
+        :rtype: string
+        :exception: ValueError - bad-formed CPE Name
+
+        TEST:
+
+        >>> CPETranscoder.wfn_to_uri('wfn:[part="a", vendor="foo\\\\!", target_sw="linux"]')
+        'cpe:/a:foo%21::::~~~linux~~'
+        """
+
+        return CPETranscoder.bind_uri(CPETranscoder.unbind_wfn(cpe_str,
+                                                               validate))
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
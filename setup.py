@@ -41,4 +41,9 @@ setuptools.setup(
     url=meta["__url__"],
     include_package_data=False,
     packages=setuptools.find_packages(exclude=['tests', 'docs']),
+    entry_points={
+        "console_scripts": [
+            "cpe-convert = cpe.convert:main",
+        ],
+    },
 )
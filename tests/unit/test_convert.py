@@ -0,0 +1,114 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.convert import CPEConverter, main
+
+import io
+import pytest
+
+
+LINES = [
+    'cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*\n',
+    '\n',
+    'cpe:2.3:a:mozilla:firefox\n',
+    'cpe:/a:mozilla:firefox:2.0:%up\n',
+    'foo\n',
+    '  wfn:[part="a", vendor="mozilla", product="firefox"]  \n',
+    'cpe:/cisco::3825;cisco:2:44/cisco:ios:12.3\n',
+]
+
+# Valid names of LINES
+NAMES = [
+    'cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*',
+    'cpe:/a:mozilla:firefox:2.0:%up',
+    'wfn:[part="a", vendor="mozilla", product="firefox"]',
+]
+
+
+@pytest.mark.parametrize("binding, method", [
+    (CPEConverter.BINDING_FS, "as_fs"),
+    (CPEConverter.BINDING_URI, "as_uri_2_3"),
+    (CPEConverter.BINDING_WFN, "as_wfn"),
+])
+def test_same_as_objects(binding, method):
+    converter = CPEConverter(binding)
+    names = list(converter.convert(LINES))
+
+    assert names == [getattr(CPE(cpe_str), method)() for cpe_str in NAMES]
+
+
+def test_errors():
+    converter = CPEConverter(CPEConverter.BINDING_FS)
+    list(converter.convert(LINES))
+
+    assert [(line, value) for line, value, reason in converter.errors] == [
+        (3, 'cpe:2.3:a:mozilla:firefox'),
+        (5, 'foo'),
+        (7, 'cpe:/cisco::3825;cisco:2:44/cisco:ios:12.3')]
+    assert converter.errors[1][2] == 'Version of CPE not implemented'
+
+
+def test_empty_names():
+    converter = CPEConverter(CPEConverter.BINDING_WFN)
+
+    assert list(converter.convert(['wfn:[]', 'cpe://', 'wfn:[part]'])) == [
+        'wfn:[]']
+    assert [line for line, value, reason in converter.errors] == [2, 3]
+
+
+def test_character_not_bound():
+    converter = CPEConverter(CPEConverter.BINDING_URI)
+
+    with pytest.raises(ValueError):
+        converter.convert_name('wfn:[part="a", vendor="foo\\_bar"]')
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1000])
+def test_write_in_order(chunk_size):
+    converter = CPEConverter(CPEConverter.BINDING_FS, chunk_size=chunk_size)
+    output = io.StringIO()
+    errors = io.StringIO()
+
+    count = converter.write([u''] + [u'' + s for s in LINES] * 2, output,
+                            errors)
+
+    assert count == (6, 6)
+    assert output.getvalue() == u''.join(
+        u'' + CPE(s).as_fs() + u'\n' for s in NAMES * 2)
+    assert errors.getvalue().splitlines()[0] == (
+        u'4\tcpe:2.3:a:mozilla:firefox\t'
+        u'Bad-formed CPE Name: validation of parts failed')
+
+
+def test_trusted():
+    cpe_str = 'cpe:2.3:a:mozilla:firefox:*:*:*:english:*:*:*:*'
+
+    with pytest.raises(ValueError):
+        CPEConverter(CPEConverter.BINDING_URI).convert_name(cpe_str)
+
+    converter = CPEConverter(CPEConverter.BINDING_URI, validate=False)
+    assert converter.convert_name(cpe_str) == (
+        'cpe:/a:mozilla:firefox::::english')
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CPEConverter('foo')
+    with pytest.raises(ValueError):
+        CPEConverter(CPEConverter.BINDING_FS, chunk_size=0)
+
+
+def test_main(tmpdir):
+    names = tmpdir.join('names.txt')
+    names.write(''.join(LINES))
+    output = tmpdir.join('output.txt')
+    errors = tmpdir.join('errors.txt')
+
+    status = main(['--to', 'uri', '--chunk-size', '2', '--buffer-size', '1024',
+                   '--errors', str(errors), str(names), str(output)])
+
+    assert status == 1
+    assert output.read().splitlines() == [CPE(s).as_uri_2_3() for s in NAMES]
+    assert len(errors.read().splitlines()) == 3
+
+    names.write(LINES[0])
+    assert main(['-t', 'wfn', str(names), str(output)]) == 0
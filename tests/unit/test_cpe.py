@@ -73,6 +73,81 @@ class CreateCPEs(unittest.TestCase):
         self.assertIsInstance(c23_wfn_uri_pack, CPE2_3_URI)
 
 
+class DetectCPEVersions(unittest.TestCase):
+    """
+    Check the prefix of CPE names selects the version and style of them.
+    """
+
+    def test_uri_fallback_to_version_2_2(self):
+        """
+        An URI with characters not allowed in version 2.3 should be
+        created as version 2.2.
+        """
+
+        self.assertIsInstance(CPE('cpe:/a:mozilla:firefox:2.0:%up'), CPE2_2)
+        self.assertIsInstance(CPE('cpe:/a:mozilla:firefox:2.0~1'), CPE2_2)
+
+    def test_uri_fallback_to_version_1_1(self):
+        """
+        A name without part of system or with characters only allowed
+        in version 1.1 should be created as version 1.1.
+        """
+
+        self.assertIsInstance(CPE('cpe:/cisco::3825/cisco:ios:12.3'), CPE1_1)
+        self.assertIsInstance(CPE('cpe:/a:mozilla:firefox,2.0'), CPE1_1)
+        self.assertIsInstance(CPE('cpe://microsoft:windows:xp!vista'), CPE1_1)
+
+    def test_prefix_case_insensitive(self):
+        """
+        The prefix of CPE names is case-insensitive.
+        """
+
+        self.assertIsInstance(CPE('CPE:2.3:a:mozilla:firefox:*:*:*:*:*:*:*:*'), CPE2_3_FS)
+        self.assertIsInstance(CPE('WFN:[part="a"]'), CPE2_3_WFN)
+        self.assertIsInstance(CPE('CPE:/A:mozilla:firefox'), CPE2_3_URI)
+
+    def test_try_parse(self):
+        """
+        try_parse should return None instead of raising an exception.
+        """
+
+        self.assertIsInstance(CPE.try_parse('cpe:/a:mozilla:firefox'), CPE2_3_URI)
+        self.assertIsInstance(CPE.try_parse('cpe:/a:mozilla:firefox', CPE.VERSION_2_2), CPE2_2)
+        self.assertIsNone(CPE.try_parse('cpe:2.3:a:mozilla:firefox'))
+        self.assertIsNone(CPE.try_parse('wfn:[part]'))
+        self.assertIsNone(CPE.try_parse('foo'))
+        self.assertIsNone(CPE2_2.try_parse('cpe:/a:mozilla:firefox:#2'))
+        self.assertIsNone(CPE.try_parse('wfn:[,]'))
+        self.assertIsNone(CPE2_3_WFN.try_parse('wfn:[vendor]'))
+
+    def test_malformed_names_raise_value_error(self):
+        """
+        Malformed names raise ValueError, not IndexError.
+        """
+
+        for s in ('wfn:[part]', 'wfn:[,]', 'wfn:[part="a",]'):
+            with self.assertRaises(ValueError):
+                CPE2_3_WFN(s)
+
+    def test_bind_empty_names(self):
+        """
+        An empty WFN binds as an empty URI; a name of version 1.1
+        without elements can not be bound.
+        """
+
+        c = CPE('wfn:[]')
+        self.assertEqual(len(c), 0)
+        self.assertEqual(c.as_fs(), CPE2_3_URI('cpe:/').as_fs())
+        self.assertEqual(c.as_uri_2_3(), '')
+        self.assertEqual(c.as_wfn(), 'wfn:[]')
+
+        c = CPE('cpe://')
+        self.assertIsInstance(c, CPE1_1)
+        for bind in (c.as_fs, c.as_uri_2_3, c.as_wfn):
+            with self.assertRaises(ValueError):
+                bind()
+
+
 class CreateBadCPEs(unittest.TestCase):
     """
     Check the __new__ function fails to create bad CPE names.
@@ -0,0 +1,33 @@
+from __future__ import print_function
+from cpe.cpe2_3_fs import CPE2_3_FS
+
+import pytest
+
+
+def test_quoted_colon():
+    fs = r'cpe:2.3:a:hp:insight_diagnostics:7\:4\:0:*:*:*:*:*:*:*'
+    c = CPE2_3_FS(fs)
+    assert c.get_version() == [r'7\:4\:0']
+    assert c.as_fs() == fs
+
+
+def test_quoted_backslash_before_separator():
+    fs = r'cpe:2.3:a:foo\\:bar:1.0:*:*:*:*:*:*:\\'
+    c = CPE2_3_FS(fs)
+    assert c.get_vendor() == [r'foo\\']
+    assert c.get_product() == ['bar']
+    assert c.get_other() == [r'\\']
+    assert c.as_fs() == fs
+
+
+@pytest.mark.parametrize('fs', [
+    'cpe:2.3:a:foo:bar:1.0:*:*:*:*:*:*',
+    'cpe:2.3:a:foo:bar:1.0:*:*:*:*:*:*:*:*',
+    'cpe:2.3:x:foo:bar:1.0:*:*:*:*:*:*:*',
+    'cpe:2x3:a:foo:bar:1.0:*:*:*:*:*:*:*',
+    'cpe:2.3:a:foo:bar\\',
+    'cpe:2.3:a:foo:bar:1.0:*:*:*:*:*:*:\\',
+])
+def test_bad_partitioning(fs):
+    with pytest.raises(ValueError):
+        CPE2_3_FS(fs)
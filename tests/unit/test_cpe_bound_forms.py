@@ -0,0 +1,82 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+
+import pytest
+
+FS = 'cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*'
+
+
+def _element(c):
+    return c.get(CPE.KEY_APP)[0]
+
+
+def test_bound_forms_computed_once():
+    c = CPE(FS)
+    CPE.reset_bound_stats()
+
+    for i in range(3):
+        assert c.as_fs() == FS
+        assert c.as_uri_2_3() == 'cpe:/a:microsoft:ie:8.0'
+        assert c.as_wfn().startswith('wfn:[part="a", vendor="microsoft"')
+
+    assert CPE.get_bound_stats() == (6, 3)
+
+
+def test_set_value_forgets_bound_forms():
+    att = CPEComponent.ATT_VENDOR
+    c = CPE(FS)
+    vendor = CPEComponent2_3_FS('mozilla', att)
+    _element(c)[att] = vendor
+
+    assert c.as_fs() == 'cpe:2.3:a:mozilla:ie:8.0:*:*:*:*:*:*:*'
+
+    vendor.set_value('google', att)
+    assert c.as_fs() == 'cpe:2.3:a:google:ie:8.0:*:*:*:*:*:*:*'
+
+
+def test_replaced_component_forgets_bound_forms():
+    att = CPEComponent.ATT_VENDOR
+    c = CPE(FS)
+    assert c.as_uri_2_3() == 'cpe:/a:microsoft:ie:8.0'
+
+    _element(c)[att] = CPEComponent2_3_FS('mozilla', att)
+    assert c.as_uri_2_3() == 'cpe:/a:mozilla:ie:8.0'
+
+
+def test_replaced_part_forgets_bound_forms():
+    c = CPE(FS)
+    other = CPE('cpe:2.3:a:mozilla:firefox:*:*:*:*:*:*:*:*')
+    assert c.as_fs() == FS
+
+    c[CPE.KEY_APP] = other.get(CPE.KEY_APP)
+    assert c.as_fs() == other.as_fs()
+
+
+def test_frozen_name_keeps_bound_forms():
+    att = CPEComponent.ATT_VENDOR
+    c = CPE(FS)
+    vendor = CPEComponent2_3_FS('mozilla', att)
+    _element(c)[att] = vendor
+    c.as_fs()
+
+    # Modified before freezing
+    vendor.set_value('google', att)
+    c.freeze()
+    assert c.as_fs() == 'cpe:2.3:a:google:ie:8.0:*:*:*:*:*:*:*'
+
+    with pytest.raises(TypeError):
+        vendor.set_value('apple', att)
+
+    CPE.reset_bound_stats()
+    assert c.as_fs() == 'cpe:2.3:a:google:ie:8.0:*:*:*:*:*:*:*'
+    assert CPE.get_bound_stats() == (1, 0)
+
+
+def test_incompatible_version_not_stored():
+    c = CPE('cpe:/cisco::3825;cisco:2:44/cisco:ios:12.3')
+
+    for i in range(2):
+        with pytest.raises(TypeError):
+            c.as_fs()
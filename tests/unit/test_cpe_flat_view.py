@@ -0,0 +1,140 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp_undefined import CPEComponentUndefined
+
+import pytest
+
+FS = 'cpe:2.3:a:microsoft:ie:8.0:*:*:*:*:*:*:*'
+
+
+@pytest.mark.parametrize("cpe_str, version", [
+    (FS, None),
+    ('cpe:/a:microsoft:ie:8.0', None),
+    ('cpe:/a:microsoft:ie:8.0', CPE.VERSION_2_2),
+    ('wfn:[part="a", vendor="microsoft", product="ie", version="8\\.0"]', None),
+])
+def test_accessors_of_parsed_name(cpe_str, version):
+    c = CPE(cpe_str, version)
+    assert c._get_flat_view() is not None
+
+    # The same CPE Name without flat view
+    other = CPE(cpe_str, version)
+    other._flat_view.valid = False
+
+    for att in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+        assert c.get_attribute_values(att) == other.get_attribute_values(att)
+        assert (c._get_attribute_components(att) ==
+                other._get_attribute_components(att))
+
+    assert len(c) == len(other)
+    assert c[1] == other[1]
+    assert c == other
+    assert other == c
+
+
+def test_accessors_of_logical_values():
+    c = CPE('cpe:2.3:o:microsoft:windows_xp:-:*:*:*:*:*:*:*')
+
+    assert len(c) == 11
+    assert c.get_version() == ['-']
+    assert c.get_update() == ['*']
+
+    c = CPE2_3_WFN('wfn:[part="o", vendor="microsoft", version=NA]')
+
+    assert len(c) == 3
+    assert c.get_version() == ['NA']
+    assert c.get_update() == ['ANY']
+    with pytest.raises(IndexError):
+        c[4]
+
+    c = CPE2_2('cpe:/o:microsoft::sp2')
+
+    assert len(c) == 4
+    assert c.get_product() == ['']
+    assert c.get_edition() == ['']
+
+
+def test_invalid_attribute():
+    c = CPE(FS)
+
+    with pytest.raises(ValueError):
+        c.get_attribute_values('bad')
+    with pytest.raises(ValueError):
+        c._get_attribute_components('bad')
+
+
+def test_replaced_component():
+    att = CPEComponent.ATT_VENDOR
+    c = CPE(FS)
+    elem = c.get(CPE.KEY_APP)[0]
+
+    elem[att] = CPEComponent2_3_FS('mozilla', att)
+
+    assert c._get_flat_view() is None
+    assert c.get_vendor() == ['mozilla']
+    assert c != CPE(FS)
+
+
+def test_deleted_component():
+    att = CPEComponent.ATT_OTHER
+    c = CPE2_3_WFN('wfn:[part="a", vendor="microsoft", other="x"]')
+
+    c.get(CPE.KEY_APP)[0][att] = CPEComponentUndefined()
+
+    assert len(c) == 2
+    with pytest.raises(IndexError):
+        c[10]
+
+
+def test_appended_element():
+    c = CPE('cpe:/a:microsoft:ie:8.0')
+    other = CPE('cpe:/o:microsoft:windows_xp')
+
+    c.get(CPE.KEY_OS).append(other.get(CPE.KEY_OS)[0])
+
+    assert c.get_vendor() == ['microsoft', 'microsoft']
+    assert c.get_product() == ['windows_xp', 'ie']
+
+
+def test_replaced_part():
+    c = CPE(FS)
+    other = CPE('cpe:2.3:o:microsoft:windows_xp:*:*:*:*:*:*:*:*')
+
+    c[CPE.KEY_APP] = []
+    c[CPE.KEY_OS] = other.get(CPE.KEY_OS)
+
+    assert c.get_product() == ['windows_xp']
+    assert c == other
+
+
+def test_frozen_name():
+    c = CPE(FS)
+    c.freeze()
+
+    assert c._get_flat_view() is not None
+    assert c.get_version() == ['8.0']
+    assert c == CPE(FS)
+
+
+def test_packed_edition():
+    c = CPE2_3_URI('cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~')
+
+    assert c.get_attribute_values(CPEComponent.ATT_SW_EDITION) == ['online']
+    assert c == CPE2_3_URI(c.cpe_str)
+
+
+def test_modified_component():
+    att = CPEComponent.ATT_VENDOR
+    c = CPE(FS)
+    assert c._get_flat_view() is not None
+
+    c[1].set_value('mozilla', att)
+
+    assert c._get_flat_view() is None
+    assert c.get_vendor() == ['mozilla']
+    assert c.as_fs() == FS.replace('microsoft', 'mozilla')
@@ -0,0 +1,99 @@
+from cpe.cpe import CPE
+from cpe.cpe1_1 import CPE1_1
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+
+import pytest
+
+FS = 'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*'
+URI = 'cpe:/a:Microsoft:Internet_Explorer:8.0.6001:beta'
+WFN = ('wfn:[part="a", vendor="microsoft", product="internet_explorer", '
+       'version="8\\.0\\.6001", update="beta"]')
+
+
+def frozen(cpe_str, version=None):
+    c = CPE(cpe_str, version)
+    c.freeze()
+    return c
+
+
+@pytest.mark.parametrize("cpe_str, version", [
+    (URI, None),
+    (URI, CPE.VERSION_2_2),
+    (WFN, None),
+])
+def test_key_of_equal_names(cpe_str, version):
+    c = CPE(FS)
+    other = CPE(cpe_str, version)
+
+    assert c == other
+    assert c.get_key() == other.get_key()
+
+    # The same CPE Name without flat view
+    other = CPE(cpe_str, version)
+    other._flat_view.valid = False
+
+    assert c.get_key() == other.get_key()
+
+
+@pytest.mark.parametrize("cpe_str, other_str", [
+    (FS, FS.replace('beta', 'sp1')),
+    ('cpe:/a:microsoft:ie:8.0', 'cpe:/o:microsoft:ie:8.0'),
+    ('cpe:/a:microsoft:ie:8.0:-', 'cpe:/a:microsoft:ie:8.0'),
+    ('cpe://microsoft:windows:xp', 'cpe://microsoft:windows:~xp'),
+    ('cpe://microsoft:windows:xp!vista', 'cpe://microsoft:windows:xp'),
+    ('cpe://sun:sunos:5.9/bea:weblogic:8.1;mysql:server:5.0',
+     'cpe://sun:sunos:5.9/bea:weblogic:8.1'),
+])
+def test_key_of_different_names(cpe_str, other_str):
+    c = CPE(cpe_str)
+    other = CPE(other_str)
+
+    assert c != other
+    assert c.get_key() != other.get_key()
+
+
+def test_key_of_logical_values():
+    # Undefined and empty values are equal to value ANY
+    c = CPE2_3_WFN('wfn:[part="a", vendor="microsoft", update=ANY]')
+    other = CPE('cpe:/a:microsoft::::')
+
+    assert c == other
+    assert c.get_key() == other.get_key()
+
+
+def test_key_of_modified_name():
+    c = CPE1_1('cpe://microsoft:windows:xp')
+    key = c.get_key()
+
+    c.get(CPE.KEY_OS)[0]['version'] = c.get(CPE.KEY_OS)[0]['vendor']
+
+    assert c.get_key() != key
+
+
+def test_hash_of_frozen_names():
+    names = [frozen(FS), frozen(URI), frozen(URI, CPE.VERSION_2_2),
+             frozen(WFN), frozen(FS.replace('beta', 'sp1'))]
+
+    assert len(set(names)) == 2
+    assert dict.fromkeys(names)[frozen(FS)] is None
+
+
+def test_hash_of_name_not_frozen():
+    with pytest.raises(TypeError):
+        hash(CPE(FS))
+    with pytest.raises(TypeError):
+        set([CPE(FS)])
+
+
+def test_equality_of_frozen_names():
+    c = frozen(FS)
+    assert c == frozen(URI)
+    assert c == CPE(URI)
+    assert CPE(URI) == c
+    assert c != frozen(FS.replace('beta', 'sp1'))
+
+    # The key is stored in the flat view of CPE Name not frozen
+    other = CPE(WFN)
+    other.get_key()
+    assert other._flat_view.key is not None
+    assert c == other
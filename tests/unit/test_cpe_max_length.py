@@ -0,0 +1,70 @@
+from cpe.cpe import CPE
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpetranscoder import CPETranscoder
+
+import pytest
+
+FS = 'cpe:2.3:a:microsoft:internet_explorer:8.0:*:*:*:*:*:*:*'
+URI = 'cpe:/a:microsoft:internet_explorer:8.0'
+WFN = 'wfn:[part="a", vendor="microsoft", product="internet_explorer"]'
+
+
+@pytest.fixture
+def max_length():
+    yield CPE.set_max_length
+    CPE.set_max_length(CPE.DEFAULT_MAX_LENGTH)
+
+
+def test_default_max_length():
+    value = 'a' * CPE.DEFAULT_MAX_LENGTH
+    with pytest.raises(ValueError):
+        CPE2_3_URI('cpe:/a:microsoft:' + value)
+    with pytest.raises(ValueError):
+        CPE('cpe:/a:microsoft:' + value)
+
+
+@pytest.mark.parametrize('parse', [
+    lambda s: CPE(s),
+    lambda s: CPE(s, CPE.VERSION_2_3),
+    lambda s: CPE2_3_URI(s),
+])
+def test_parse_longer_names(max_length, parse):
+    max_length(len(URI))
+    assert parse(URI) is not None
+
+    max_length(len(URI) - 1)
+    with pytest.raises(ValueError):
+        parse(URI)
+
+
+def test_try_parse_longer_names(max_length):
+    max_length(len(FS) - 1)
+    assert CPE.try_parse(FS) is None
+    assert CPE2_3_FS.try_parse(FS) is None
+
+
+@pytest.mark.parametrize('cpe_str, unbind', [
+    (FS, CPETranscoder.unbind_fs),
+    (URI, CPETranscoder.unbind_uri),
+    (WFN, CPETranscoder.unbind_wfn),
+])
+def test_transcode_longer_names(max_length, cpe_str, unbind):
+    max_length(len(cpe_str) - 1)
+    with pytest.raises(ValueError):
+        unbind(cpe_str)
+
+    max_length(None)
+    assert unbind(cpe_str)
+
+
+def test_invalid_max_length():
+    with pytest.raises(ValueError):
+        CPE.set_max_length(0)
+
+
+def test_uri_with_too_many_components():
+    with pytest.raises(ValueError):
+        CPE2_3_URI('cpe:/a' + ':x' * 8)
+    with pytest.raises(NotImplementedError):
+        CPE('cpe:/a:' + 'x' * 1000 + ':' * 10)
@@ -0,0 +1,59 @@
+from cpe.cpe import CPE
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpetranscoder import CPETranscoder
+from cpe.comp.cpecomp2_3_uri_edpacked import CPEComponent2_3_URI_edpacked
+
+import pytest
+
+
+@pytest.mark.parametrize("cpe_str", [
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:-:*:en-us:online:win2003:x64:*',
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:*:*:*:*:*:*:-',
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:2.3:*:*:*:*:*:*:*:*:*:*:*',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~:en-us',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~sp2~~~~',
+    'cpe:/a:microsoft:internet_explorer:::beta',
+    'cpe:/',
+    'wfn:[part="a", vendor="hp", target_sw="win2003", other=NA]',
+    'wfn:[edition="\\~sp2", language=ANY]',
+])
+def test_bind_uri_in_one_pass(cpe_str):
+    c = CPE(cpe_str, CPE.VERSION_2_3)
+    assert c._get_flat_view() is not None
+
+    # The same CPE Name without flat view
+    other = CPE(cpe_str, CPE.VERSION_2_3)
+    other._flat_view.valid = False
+
+    assert c._as_uri_2_3() == other._as_uri_2_3()
+
+
+def test_pack_values():
+    pack = CPEComponent2_3_URI_edpacked._pack_values
+
+    assert pack(['', '', '', '', '']) == ''
+    assert pack(['-', '', '', '', '']) == '-'
+    assert pack(['', '', '', '', '-']) == '~~~~~-'
+
+
+def test_unpack_value():
+    unpack = CPEComponent2_3_URI_edpacked._unpack_value
+
+    assert unpack('~~~~~') == ['', '', '', '', '']
+    assert unpack('~a~b~c~d~e~f') == ['a', 'b', 'c', 'd', 'e']
+
+    with pytest.raises(ValueError):
+        unpack('~a~b~c~d')
+
+
+@pytest.mark.parametrize("validate", [True, False])
+@pytest.mark.parametrize("cpe_str", [
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~a~b',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~',
+])
+def test_short_packed_edition(cpe_str, validate):
+    with pytest.raises(ValueError):
+        CPE2_3_URI(cpe_str, validate=validate)
+    with pytest.raises(ValueError):
+        CPETranscoder.uri_to_fs(cpe_str, validate)
@@ -0,0 +1,90 @@
+from cpe.cpe import CPE
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpeset2_3 import CPESet2_3
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_checks():
+    yield
+    CPE.check_trusted(0)
+    CPE.disable_cache()
+
+
+@pytest.mark.parametrize('cpe_str, version', [
+    ('cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*', None),
+    ('cpe:/a:microsoft:internet_explorer:8.0.6001:beta', None),
+    ('cpe:/a:microsoft:internet_explorer:8.0:beta:~~pro~~x64~', '2.3'),
+    ('cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1', '2.2'),
+    ('wfn:[part="a", vendor="microsoft", product="internet_explorer"]', None),
+    ('cpe://microsoft:windows:xp!vista', None)])
+def test_same_structure(cpe_str, version):
+    c = CPE(cpe_str, version)
+    t = CPE(cpe_str, version, validate=False)
+
+    assert type(t) is type(c)
+    assert t == c
+    assert t.as_wfn() == c.as_wfn()
+    assert t.as_fs() == c.as_fs()
+    assert t.as_uri_2_3() == c.as_uri_2_3()
+
+
+def test_same_matching():
+    cpe_str = ('wfn:[part="a", vendor="microsoft", '
+               'product="internet_explorer", version="8\\.0\\.6"]')
+    name = ('wfn:[part="a", vendor="microsoft", '
+            'product="internet_explorer", version="8\\.0\\.*"]')
+
+    s = CPESet2_3()
+    s.append(CPE(cpe_str, validate=False))
+    assert s.name_match(CPE(name, validate=False))
+
+
+def test_values_not_checked():
+    c = CPE2_3_FS('cpe:2.3:a:micro$oft:windows:*:*:*:*:*:*:*:*',
+                  validate=False)
+    assert c.get_vendor() == ['micro$oft']
+
+    with pytest.raises(ValueError):
+        CPE2_3_FS('cpe:2.3:a:micro$oft:windows:*:*:*:*:*:*:*:*')
+
+
+def test_uri_version_detected():
+    c = CPE('cpe:/a:micro~soft:windows', validate=False)
+    assert c.VERSION == CPE.VERSION_2_2
+
+
+def test_check_sample():
+    cpe_str = 'cpe:/a:micro$oft:windows'
+    assert CPE2_3_URI(cpe_str, validate=False).get_vendor() == ['micro$oft']
+
+    CPE.check_trusted(1)
+    with pytest.raises(ValueError):
+        CPE2_3_URI(cpe_str, validate=False)
+
+    CPE2_3_URI('cpe:/a:microsoft:windows', validate=False)
+
+
+def test_check_invalid_rate():
+    with pytest.raises(ValueError):
+        CPE.check_trusted(2)
+
+
+def test_trusted_not_cached():
+    cache = CPE.enable_cache(10)
+    cpe_str = 'cpe:2.3:a:mozilla:firefox:*:*:*:*:*:*:*:*'
+
+    CPE(cpe_str, validate=False)
+    assert len(cache) == 0
+
+    c = CPE(cpe_str)
+    assert CPE(cpe_str, validate=False) is c
+
+
+def test_parse_many():
+    names = CPE.parse_many(['cpe:2.3:a:micro$oft:windows:*:*:*:*:*:*:*:*',
+                            'cpe:/a:micro~soft:windows'], validate=False)
+    assert [c.VERSION for c in names] == ['2.3', '2.2']
+    assert names.errors == []
@@ -0,0 +1,69 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+
+import io
+import pytest
+
+
+LINES = [
+    'cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*\n',
+    '\n',
+    'cpe:2.3:a:mozilla:firefox\n',
+    'cpe:/a:mozilla:firefox:2.0:%up\n',
+    'foo\n',
+    '  cpe:/a:mozilla:firefox  \n',
+]
+
+
+def test_collect_errors():
+    names = CPE.parse_many(LINES)
+    assert [type(c) for c in names] == [CPE2_3_FS, CPE2_2, CPE2_3_URI]
+    assert [(line, value) for line, value, reason in names.errors] == [
+        (3, 'cpe:2.3:a:mozilla:firefox'),
+        (5, 'foo')]
+    assert names.errors[1][2] == 'Version of CPE not implemented'
+
+
+def test_file_and_version():
+    stream = io.StringIO(u''.join(LINES))
+    names = CPE.parse_many(stream, CPE.VERSION_2_2)
+    assert [c.cpe_str for c in names] == [
+        'cpe:/a:mozilla:firefox:2.0:%up', 'cpe:/a:mozilla:firefox']
+    assert [line for line, value, reason in names.errors] == [1, 3, 5]
+
+
+def test_class_forces_version():
+    names = CPE2_2.parse_many(LINES)
+    assert [type(c) for c in names] == [CPE2_2, CPE2_2]
+    assert [line for line, value, reason in names.errors] == [1, 3, 5]
+
+    # The version of the generic class is ignored
+    names = CPE2_3_URI.parse_many(LINES, CPE.VERSION_2_2)
+    assert [type(c) for c in names] == [CPE2_3_URI]
+
+    names = CPE2_2.parse_many(['foo'], on_error='raise')
+    with pytest.raises(ValueError):
+        next(names)
+
+
+def test_ignore_errors():
+    names = CPE.parse_many(LINES, on_error='ignore')
+    assert len(list(names)) == 3
+    assert names.errors == []
+
+
+def test_raise_errors():
+    names = CPE.parse_many(LINES, on_error='raise')
+    assert isinstance(next(names), CPE2_3_FS)
+    with pytest.raises(NotImplementedError):
+        next(names)
+
+
+def test_bad_arguments():
+    with pytest.raises(ValueError):
+        CPE.parse_many(LINES, on_error='fail')
+    with pytest.raises(NotImplementedError):
+        CPE.parse_many(LINES, version='3.0')
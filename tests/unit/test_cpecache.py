@@ -0,0 +1,74 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3 import CPE2_3
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpecache import CPECache
+
+import pytest
+
+
+FS = 'cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*'
+URI = 'cpe:/a:mozilla:firefox:2.0'
+
+
+@pytest.fixture
+def cache():
+    yield CPE.enable_cache(4)
+    CPE.disable_cache()
+
+
+def test_disabled_by_default():
+    assert CPE.get_cache() is None
+    c = CPE(FS)
+    assert CPE(FS) is not c
+    assert not c.is_frozen()
+
+
+def test_factory_and_styles(cache):
+    c = CPE(FS)
+    assert CPE(FS) is c
+    assert CPE2_3_FS(FS) is c
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # The requested version is part of the key
+    assert CPE(FS, CPE.VERSION_2_3) is not c
+    assert CPE2_3(FS) is CPE(FS, CPE.VERSION_2_3)
+    assert type(CPE(URI, CPE.VERSION_2_2)) is CPE2_2
+
+
+def test_eviction(cache):
+    c = CPE2_2(URI)
+    for version in ('1.0', '3.0', '4.0', '5.0'):
+        CPE2_2('cpe:/a:mozilla:firefox:' + version)
+
+    assert len(cache) == 4
+    assert CPE2_2(URI) is not c
+
+
+def test_frozen(cache):
+    c = CPE(URI)
+    elem = c.get(CPE.KEY_APP)[0]
+
+    with pytest.raises(TypeError):
+        c[CPE.KEY_APP] = []
+    with pytest.raises(TypeError):
+        c.update({CPE.KEY_APP: []})
+    with pytest.raises(TypeError):
+        elem['vendor'] = None
+    with pytest.raises(TypeError):
+        elem['vendor'].set_value('microsoft', 'vendor')
+
+    assert c.get_vendor() == ['mozilla']
+    assert c.as_fs() == FS
+
+
+def test_invalid_not_cached(cache):
+    with pytest.raises(NotImplementedError):
+        CPE('foo')
+    assert len(cache) == 0
+
+
+def test_bad_maxsize():
+    with pytest.raises(ValueError):
+        CPECache(0)
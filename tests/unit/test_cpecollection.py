@@ -0,0 +1,140 @@
+from cpe.cpe import CPE
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+from cpe.cpeset2_3 import CPESet2_3
+from cpe.cperecord import CPERecord
+from cpe.comp.cpecomp import CPEComponent
+
+from io import BytesIO
+
+import pytest
+
+
+NAMES = [
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:2.3:o:microsoft:windows_xp:-:sp3:*:*:*:*:*:*',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~',
+    'wfn:[part="a", vendor="mozilla", product="firefox", version=NA]']
+
+
+@pytest.fixture
+def names():
+    return CPECollection(NAMES)
+
+
+def test_rows(names):
+    assert len(names) == 4
+
+    for cpe_str, c in zip(NAMES, names):
+        assert isinstance(c, CPE2_3_WFN)
+        assert c.as_wfn() == CPE(cpe_str).as_wfn()
+
+    assert names.get_record(2).as_uri_2_3() == NAMES[2]
+
+    with pytest.raises(IndexError):
+        names[4]
+
+
+def test_shared_values(names):
+    names.extend([CPE(NAMES[0]), CPERecord.parse(NAMES[1])])
+
+    assert len(names) == 6
+    assert names.get_code('"a"') == CPECollection.CODE_UNDEFINED + 1
+    assert names.get_code('NA') == CPECollection.CODE_NA
+    assert names.get_code('"apple"') is None
+    assert names.distinct(CPEComponent.ATT_VENDOR) == [
+        '"hp"', '"microsoft"', '"mozilla"']
+
+
+def test_slice(names):
+    part = names[1:3]
+
+    assert isinstance(part, CPECollection)
+    assert [c.as_wfn() for c in part] == [names[1].as_wfn(),
+                                          names[2].as_wfn()]
+
+    part.append('cpe:/a:apple:safari')
+    assert len(part) == 3
+    assert len(names) == 4
+
+
+def test_filter(names):
+    att = CPEComponent.ATT_VERSION
+    na = names.filter(att, CPECollection.CODE_NA)
+
+    assert na.column(CPEComponent.ATT_PRODUCT) == ['"windows_xp"', '"firefox"']
+
+    undefined = names.filter(CPEComponent.ATT_LANGUAGE,
+                             CPECollection.CODE_UNDEFINED)
+    assert len(undefined) == 2
+
+
+def test_only_version_2_3():
+    with pytest.raises(ValueError):
+        CPECollection(['cpe://microsoft:windows:xp'])
+
+
+def dumped(names):
+    f = BytesIO()
+    names.dump(f)
+    return f.getvalue()
+
+
+def test_dump_and_load_file(names, tmp_path):
+    path = tmp_path / 'names.bin'
+    with open(str(path), 'wb') as f:
+        names.dump(f)
+
+    with open(str(path), 'rb') as f:
+        loaded = CPECollection.load(f)
+
+    assert len(loaded) == len(names)
+    for i in range(len(names)):
+        assert loaded.get_record(i) == names.get_record(i)
+    assert loaded.get_code('"microsoft"') == names.get_code('"microsoft"')
+
+    # The loaded collection can grow
+    part = loaded[1:3]
+    loaded.append(NAMES[0])
+    part.append(NAMES[0])
+    assert loaded.column(CPEComponent.ATT_VENDOR)[-1] == '"microsoft"'
+    assert loaded.get_code('"microsoft"') == part.get_code('"microsoft"')
+    assert len(loaded._values) == len(names._values)
+
+
+def test_dump_and_load_other_values():
+    names = CPECollection()
+    record = CPERecord.from_values(
+        CPE.VERSION_2_3, 'WFN',
+        ['"a"', '"caf\u00e9"', '""', 'ANY', 'NA', None, None, None, None,
+         None, None])
+    names.append(record)
+
+    loaded = CPECollection.load(BytesIO(dumped(names)))
+    assert loaded.get_record(0) == record
+
+    empty = CPECollection.load(BytesIO(dumped(CPECollection())))
+    assert len(empty) == 0
+
+
+def test_load_bad_data(names):
+    data = dumped(names)
+
+    corrupt = data[:-1] + bytearray([data[-1] ^ 1])
+    truncated = data[:-4]
+    version = data[:4] + b'\x02' + data[5:]
+
+    for bad in (b'', data[:10], b'XXXX' + data[4:], corrupt, truncated,
+                version):
+        with pytest.raises(ValueError):
+            CPECollection.load(BytesIO(bytes(bad)))
+
+
+def test_to_set(names):
+    names.extend(NAMES)
+    s = names.to_set()
+
+    assert isinstance(s, CPESet2_3)
+    assert len(s) == len(NAMES)
+    assert all(isinstance(k, CPERecord) for k in s)
+    assert s.name_match(CPE2_3_WFN(CPE(NAMES[0]).as_wfn()))
@@ -0,0 +1,80 @@
+from __future__ import print_function
+from cpe.comp.cpecomp1_1 import CPEComponent1_1
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+
+import pytest
+
+LONG = 64 * 1024
+
+
+@pytest.mark.parametrize("value, expected", [
+    ('', ''),
+    ('internet_explorer', 'internet_explorer'),
+    ('8.0.6001', '8\\.0\\.6001'),
+    ('%02ab%01%01', '*ab??'),
+    ('%01%01ab', '??ab'),
+    ('foo%21bar~', 'foo\\!bar\\~'),
+    ('%3a%5c', '\\:\\\\'),
+])
+def test_uri_decode(value, expected):
+    assert CPEComponent2_3_URI._decode_value(value) == expected
+
+
+@pytest.mark.parametrize("value, message", [
+    ('a%02b', 'Invalid value: a%02b'),
+    ('a%01b', 'Invalid value: a%01b'),
+    ('a%zz', 'Invalid value: a%zz. Invalid percent-encoded character: %zz'),
+    ('a%2', 'Invalid value: a%2. Invalid percent-encoded character: %2'),
+])
+def test_uri_decode_error(value, message):
+    with pytest.raises(ValueError) as excinfo:
+        CPEComponent2_3_URI._decode_value(value)
+    assert str(excinfo.value) == message
+
+
+@pytest.mark.parametrize("value, expected", [
+    ('', ''),
+    ('internet_explorer', 'internet_explorer'),
+    ('8.0.6001', '8\\.0\\.6001'),
+    ('8\\.0', '8\\.0'),
+    ('*ab??', '*ab??'),
+    ('??ab*', '??ab*'),
+    ('a!@b', 'a\\!\\@b'),
+])
+def test_fs_decode(value, expected):
+    assert CPEComponent2_3_FS._decode_value(value) == expected
+
+
+@pytest.mark.parametrize("value, message", [
+    ('ab*c', "Invalid character '*' in position 2: ab*c"),
+    ('a?b', "Invalid character '?' in position 1: a?b"),
+])
+def test_fs_decode_error(value, message):
+    with pytest.raises(ValueError) as excinfo:
+        CPEComponent2_3_FS._decode_value(value)
+    assert str(excinfo.value) == message
+
+
+def test_decode_long_values():
+    value = "a." * (LONG // 2)
+    expected = "a\\." * (LONG // 2)
+
+    assert CPEComponent2_3_FS._decode_value(value) == expected
+    assert CPEComponent2_3_URI._decode_value(value) == expected
+    assert CPEComponent2_3_URI._decode_value(
+        "a%21" * (LONG // 4)) == "a\\!" * (LONG // 4)
+
+    # The error is raised at the end of the value
+    with pytest.raises(ValueError):
+        CPEComponent2_3_FS._decode_value(value + "*a")
+    with pytest.raises(ValueError):
+        CPEComponent2_3_URI._decode_value(value + "%zz")
+
+
+def test_1_1_decode():
+    c = CPEComponent1_1('sun!windows_(x64)', CPEComponent1_1.ATT_PRODUCT)
+    assert c._standard_value == ['sun', 'windows_\\(x64\\)']
+
+    c = CPEComponent1_1('~8.0', CPEComponent1_1.ATT_VERSION)
+    assert c._standard_value == ['8\\.0']
@@ -0,0 +1,76 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+
+import pytest
+
+
+def _vendor(c):
+    return c._get_attribute_components(CPEComponent.ATT_VENDOR)[0]
+
+
+@pytest.mark.parametrize('cpe_str, wfn', [
+    ('cpe:2.3:a:lazy_fs\\!:firefox:*:*:*:*:*:*:*:*',
+     'wfn:[part="a", vendor="lazy_fs\\!", product="firefox", '
+     'version=ANY, update=ANY, edition=ANY, language=ANY, '
+     'sw_edition=ANY, target_sw=ANY, target_hw=ANY, other=ANY]'),
+    ('cpe:/a:lazy_uri%21:firefox',
+     'wfn:[part="a", vendor="lazy_uri\\!", product="firefox"]'),
+    ('cpe:/a:lazy_2.2:firefox:~~~',
+     'wfn:[part="a", vendor="lazy_2\\.2", product="firefox", '
+     'version="\\~\\~\\~"]')])
+def test_decoded_on_first_access(cpe_str, wfn):
+    c = CPE(cpe_str)
+    vendor = _vendor(c)
+    value = vendor.get_value()
+
+    assert vendor._decoded_value is None
+    assert c.as_wfn() == wfn
+    assert vendor._decoded_value is not None
+    assert vendor.get_value() == value
+
+
+def test_invalid_edition_raises_on_parse():
+    with pytest.raises(ValueError):
+        CPE2_3_FS('cpe:2.3:a:mozilla:firefox:*:*:a*b:*:*:*:*:*')
+
+
+@pytest.mark.parametrize('cls, cpe_str', [
+    (CPE2_3_FS, 'cpe:2.3:a:v:p:1:*:*:a*--:*:*:*:*'),
+    (CPE2_3_FS, 'cpe:2.3:a:v:p:1:*:*:a?--:*:*:*:*'),
+    (CPE2_3_FS, 'cpe:2.3:a:v:p:1:*:*:en-*-:*:*:*:*'),
+    (CPE2_3_URI, 'cpe:/a:v:p:1::~~~~~:a%02--')])
+def test_invalid_language_raises_on_parse(cls, cpe_str):
+    # The language matches the grammar, but it can not be decoded
+    with pytest.raises(ValueError):
+        cls(cpe_str)
+
+    with pytest.raises(NotImplementedError):
+        CPE(cpe_str)
+
+
+def test_set_value_decodes_new_value():
+    att = CPEComponent.ATT_VENDOR
+    comp = CPEComponent2_3_URI('mozilla', att)
+    comp._standard_value
+
+    comp.set_value('micro%21soft', att)
+    assert comp._standard_value == 'micro\\!soft'
+
+    with pytest.raises(ValueError):
+        comp.set_value('bad%zz', att)
+    assert comp._standard_value == 'micro\\!soft'
+
+
+def test_set_value_validates_new_value():
+    att = CPEComponent.ATT_VENDOR
+    comp = CPEComponent2_3_FS('mozilla', att)
+    comp.set_value('micro\\!soft', att)
+
+    with pytest.raises(ValueError):
+        comp.set_value('micro soft', att)
+    assert comp.get_value() == 'micro\\!soft'
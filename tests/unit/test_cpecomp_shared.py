@@ -0,0 +1,87 @@
+from __future__ import print_function
+from cpe.cpe import CPE
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp_anyvalue import CPEComponentAnyValue
+from cpe.comp.cpecomp_empty import CPEComponentEmpty
+from cpe.comp.cpecomp_notapplicable import CPEComponentNotApplicable
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+from cpe.comp.cpecomp_undefined import CPEComponentUndefined
+from cpe.comp.cpecomp2_2 import CPEComponent2_2
+
+import gc
+import pytest
+
+
+@pytest.mark.parametrize('cls', [CPEComponentAnyValue, CPEComponentEmpty,
+                                 CPEComponentNotApplicable,
+                                 CPEComponentUndefined])
+def test_logical_singletons(cls):
+    assert cls() is cls()
+    assert cls().is_frozen()
+
+
+NAMES = [
+    'cpe:2.3:a:microsoft:windows:xp:*:*:*:*:*:*:*',
+    'cpe:/a:microsoft:windows:xp',
+    'cpe:/a:microsoft:windows:xp:~~~',
+    'wfn:[part="a", vendor="microsoft", product="windows", version="xp"]',
+    'cpe://microsoft:windows:xp']
+
+
+@pytest.fixture
+def cache():
+    yield CPE.enable_cache(10)
+    CPE.disable_cache()
+
+
+@pytest.mark.parametrize('cpe_str', NAMES)
+def test_components_shared_between_cached_names(cache, cpe_str):
+    c1 = CPE(cpe_str)
+    cache.clear()
+    c2 = CPE(cpe_str)
+    assert c1 is not c2
+
+    vendor1 = c1._get_attribute_components(CPEComponent.ATT_VENDOR)[0]
+    vendor2 = c2._get_attribute_components(CPEComponent.ATT_VENDOR)[0]
+    assert vendor1 is vendor2
+
+    value = vendor1.get_value()
+    with pytest.raises(TypeError):
+        vendor1.set_value('mozilla', CPEComponent.ATT_VENDOR)
+    assert vendor1.get_value() == value
+
+
+@pytest.mark.parametrize('cpe_str', NAMES)
+def test_modify_parsed_name(cpe_str):
+    c1 = CPE(cpe_str)
+    c2 = CPE(cpe_str)
+    fs = c1.as_fs()
+
+    vendor1 = c1._get_attribute_components(CPEComponent.ATT_VENDOR)[0]
+    vendor2 = c2._get_attribute_components(CPEComponent.ATT_VENDOR)[0]
+    assert vendor1 is not vendor2
+    assert not vendor1.is_frozen()
+
+    value = vendor1.get_value().replace('microsoft', 'mozilla')
+    vendor1.set_value(value, CPEComponent.ATT_VENDOR)
+
+    assert c1.get_vendor() == [value]
+    assert c1.as_fs() == fs.replace('microsoft', 'mozilla')
+    assert c2.as_fs() == fs
+
+
+def test_new_component_not_shared():
+    att = CPEComponent.ATT_VENDOR
+    comp = CPEComponent2_2('microsoft', att)
+    assert comp is not CPEComponent2_2.intern('microsoft', att)
+
+    comp.set_value('mozilla', att)
+    assert comp.get_value() == 'mozilla'
+
+
+def test_unused_components_released():
+    CPE('cpe:/a:released_vendor:released_product')
+    gc.collect()
+
+    values = [key[2] for key in CPEComponentSimple._interned.keys()]
+    assert 'released_vendor' not in values
@@ -0,0 +1,57 @@
+from __future__ import print_function
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp1_1 import CPEComponent1_1
+from cpe.comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+
+import threading
+
+import pytest
+
+
+@pytest.mark.parametrize('value, uri', [
+    ('"internet_explorer"', 'internet_explorer'),
+    ('"8\\.0\\.6001"', '8.0.6001'),
+    ('"foo\\-bar"', 'foo-bar'),
+    ('"8\\.*"', '8.%02'),
+    ('"?\\.?"', '%01.%01'),
+    ('"foo\\!bar\\@baz\\~qux"', 'foo%21bar%40baz%7equx'),
+    ('"\\\\\\""', '%5c%22')])
+def test_bind_wfn_value(value, uri):
+    comp = CPEComponent2_3_WFN(value, CPEComponent.ATT_VERSION)
+    assert comp.as_uri_2_3() == uri
+
+
+def test_bind_1_1_value():
+    comp = CPEComponent1_1('#nvidi@!foo', CPEComponent.ATT_VENDOR)
+    assert comp.as_uri_2_3() == '%23nvidi%40%21foo'
+
+
+def test_pct_encode_does_not_modify_table():
+    table = dict(CPEComponentSimple.spechar_to_pce)
+
+    assert CPEComponentSimple._pct_encode_uri('-') == '-'
+    assert CPEComponentSimple._pct_encode_uri('.') == '.'
+    assert CPEComponentSimple._pct_encode_uri('@') == '%40'
+    assert CPEComponentSimple.spechar_to_pce == table
+
+
+def test_bind_from_several_threads():
+    values = [('"{0}\\-{0}\\.{0}\\@"'.format(i), '{0}-{0}.{0}%40'.format(i))
+              for i in range(8)]
+    errors = []
+
+    def bind(value, uri):
+        comp = CPEComponent2_3_WFN(value, CPEComponent.ATT_VERSION)
+        for i in range(2000):
+            if comp.as_uri_2_3() != uri:
+                errors.append(value)
+                return
+
+    threads = [threading.Thread(target=bind, args=v) for v in values]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
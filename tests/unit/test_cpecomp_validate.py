@@ -0,0 +1,112 @@
+from cpe.comp.cpecomp import CPEComponent
+from cpe.comp.cpecomp_simple import CPEComponentSimple
+from cpe.comp.cpecomp1_1 import CPEComponent1_1
+from cpe.comp.cpecomp2_2 import CPEComponent2_2
+from cpe.comp.cpecomp2_3_fs import CPEComponent2_3_FS
+from cpe.comp.cpecomp2_3_uri import CPEComponent2_3_URI
+from cpe.comp.cpecomp2_3_wfn import CPEComponent2_3_WFN
+
+import itertools
+import pytest
+
+#: Tokens combined to build the values compared with their decoding
+TOKENS = {
+    CPEComponent2_3_FS: ['e', '1', '-', '*', '?', '\\-', '.'],
+    CPEComponent2_3_URI: ['e', '1', '-', '%01', '%02', '%21', '.']}
+
+
+@pytest.mark.parametrize('cls, att, value, valid', [
+    (CPEComponent1_1, CPEComponent.ATT_VERSION, 'xp!vista', True),
+    (CPEComponent1_1, CPEComponent.ATT_VERSION, 'xp!', False),
+    (CPEComponent2_2, CPEComponent.ATT_LANGUAGE, 'en-us', True),
+    (CPEComponent2_2, CPEComponent.ATT_PART, 'x', False),
+    (CPEComponent2_3_FS, CPEComponent.ATT_PART, '?', True),
+    (CPEComponent2_3_FS, CPEComponent.ATT_LANGUAGE, 'en-*', True),
+    (CPEComponent2_3_FS, CPEComponent.ATT_EDITION, 'a*b', False),
+    (CPEComponent2_3_URI, CPEComponent.ATT_PART, '%01', True),
+    (CPEComponent2_3_URI, CPEComponent.ATT_EDITION, '~~pro~~x64~', True),
+    (CPEComponent2_3_URI, CPEComponent.ATT_LANGUAGE, 'en-?', False),
+    (CPEComponent2_3_WFN, CPEComponent.ATT_LANGUAGE, 'en\\-us', True),
+    (CPEComponent2_3_WFN, CPEComponent.ATT_VENDOR, 'micro soft', False)])
+def test_validate(cls, att, value, valid):
+    assert cls.validate(att, value) is valid
+
+
+def test_validator_compiled_once_per_class():
+    att = CPEComponent.ATT_LANGUAGE
+    CPEComponent2_3_FS.validate(att, 'en-us')
+    CPEComponent2_3_URI.validate(att, 'en-us')
+    validator = CPEComponentSimple._validators[(CPEComponent2_3_FS, att)]
+
+    CPEComponent2_3_FS.validate(att, 'es-es')
+    assert CPEComponentSimple._validators[(CPEComponent2_3_FS, att)] is validator
+    assert CPEComponentSimple._validators[(CPEComponent2_3_URI, att)] is not validator
+
+
+def test_validate_invalid_attribute():
+    with pytest.raises(ValueError):
+        CPEComponent2_3_FS.validate('colour', 'red')
+
+
+@pytest.mark.parametrize('cls, value, valid', [
+    (CPEComponent2_3_FS, '??', True),
+    (CPEComponent2_3_FS, '??*', True),
+    (CPEComponent2_3_FS, '*?', False),
+    (CPEComponent2_3_FS, '*', True),
+    (CPEComponent2_3_FS, '-', True),
+    (CPEComponent2_3_FS, '8.0\n', False),
+    (CPEComponent2_3_URI, '', True),
+    (CPEComponent2_3_URI, '%01%01', False),
+    (CPEComponent2_3_URI, '%02foo%01%01', True),
+    (CPEComponent2_3_URI, 'foo%01bar', False),
+    (CPEComponent2_3_URI, '8.0\n', False),
+    (CPEComponent2_3_WFN, '\\-', False),
+    (CPEComponent2_3_WFN, '\\-8', True),
+    (CPEComponent2_3_WFN, '*?', True),
+    (CPEComponent2_3_WFN, '?*?', False),
+    (CPEComponent2_3_WFN, '8\\.0\n', False)])
+def test_validate_wildcards(cls, value, valid):
+    assert cls.validate(CPEComponent.ATT_VERSION, value) is valid
+
+
+@pytest.mark.parametrize('cls, value', [
+    (CPEComponent2_3_FS, '?' * 65536 + '!'),
+    (CPEComponent2_3_FS, '?' * 32768 + 'a' * 32768 + '!'),
+    (CPEComponent2_3_URI, '%01' * 21845 + 'a!'),
+    (CPEComponent2_3_URI, '%21' * 21845 + '%01!'),
+    (CPEComponent2_3_WFN, '?' * 65536 + '!'),
+    (CPEComponent2_3_WFN, '\\-' * 32768 + '!')])
+def test_validate_adversarial(cls, value):
+    # Each value is scanned once: the patterns used before backtracked
+    # for seconds on them
+    assert cls.validate(CPEComponent.ATT_VERSION, value) is False
+    assert cls.validate(CPEComponent.ATT_VERSION, value[:-1]) is True
+
+
+@pytest.mark.parametrize('cls, att, value', [
+    (CPEComponent2_3_FS, CPEComponent.ATT_LANGUAGE, 'a*--'),
+    (CPEComponent2_3_FS, CPEComponent.ATT_LANGUAGE, 'a?--'),
+    (CPEComponent2_3_FS, CPEComponent.ATT_LANGUAGE, 'en-*-'),
+    (CPEComponent2_3_URI, CPEComponent.ATT_LANGUAGE, 'a%02--'),
+    (CPEComponent2_3_FS, CPEComponent.ATT_EDITION, 'a*b')])
+def test_validate_not_decoded(cls, att, value):
+    # The grammar of attribute accepts the value, but not its decoding
+    with pytest.raises(ValueError):
+        cls._decode_value(value)
+
+    assert cls.validate(att, value) is False
+
+
+@pytest.mark.parametrize('cls', [CPEComponent2_3_FS, CPEComponent2_3_URI])
+def test_validate_rejects_decoding_errors(cls):
+    # The values are decoded lazily, so the validator alone has to reject
+    # every value whose decoding fails
+    for count in range(1, 5):
+        for tokens in itertools.product(TOKENS[cls], repeat=count):
+            value = "".join(tokens)
+
+            try:
+                cls._decode_value(value)
+            except ValueError:
+                for att in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+                    assert cls.validate(att, value) is False, (att, value)
@@ -0,0 +1,116 @@
+from cpe.cpe import CPE
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cperecord import CPERecord
+from cpe.cpeset2_3 import CPESet2_3
+from cpe.comp.cpecomp import CPEComponent
+
+import pytest
+
+
+NAMES = [
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:-:*:*:online:win2003:x64:*',
+    'cpe:/a:microsoft:internet_explorer:8.0.6001:beta',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~',
+    'cpe:/a:foo%5cbar:big%24money_2010%07:::~~special~ipod_touch~80gb~',
+    'wfn:[part="a", vendor="microsoft", product="internet_explorer", '
+    'version="8\\.0\\.6001", update=NA]',
+    'cpe:/a:microsoft:internet_explorer:8.0.6001:beta~1',
+    'cpe://microsoft:windows:xp!vista',
+    'cpe:///microsoft::xp']
+
+
+@pytest.mark.parametrize('cpe_str', NAMES)
+def test_same_bound_forms(cpe_str):
+    c = CPE(cpe_str)
+    r = CPERecord.from_cpe(c)
+
+    assert r.VERSION == c.VERSION
+    assert r.as_wfn() == c.as_wfn()
+    assert r.as_fs() == c.as_fs()
+    assert r.as_uri_2_3() == c.as_uri_2_3()
+    assert r.to_cpe().as_wfn() == c.as_wfn()
+
+
+@pytest.mark.parametrize('cpe_str', NAMES[:6])
+def test_same_attribute_values(cpe_str):
+    c = CPE2_3_WFN(CPE(cpe_str).as_wfn())
+    r = CPERecord.parse(cpe_str)
+
+    for att in CPEComponent.CPE_COMP_KEYS_EXTENDED:
+        assert r.get_attribute_values(att) == c.get_attribute_values(att)
+
+    with pytest.raises(ValueError):
+        r.get_attribute_values('colour')
+
+
+def test_immutable_and_hashable():
+    r = CPERecord.parse(NAMES[0])
+
+    assert r == CPERecord.parse(NAMES[0])
+    assert r != CPERecord.parse(NAMES[2])
+    assert len(set([r, CPERecord.parse(NAMES[0])])) == 1
+    assert r.STYLE == 'FS'
+
+    with pytest.raises(TypeError):
+        r[2] = '"h"'
+    with pytest.raises(AttributeError):
+        r.version = '"1\\.0"'
+
+
+def test_to_cpe_styles():
+    r = CPERecord.parse(NAMES[3])
+
+    assert isinstance(r.to_cpe(), CPE2_3_URI)
+    assert isinstance(r.to_cpe('FS'), CPE2_3_FS)
+    assert r.to_cpe('FS').as_uri_2_3() == NAMES[3]
+
+    with pytest.raises(NotImplementedError):
+        r.to_cpe('XML')
+
+
+def test_several_elements():
+    with pytest.raises(TypeError):
+        CPERecord.parse('cpe:/cisco::3825/cisco:ios:12.3')
+
+
+def test_matching():
+    s = CPESet2_3()
+    s.append(CPERecord.parse(NAMES[0]))
+    s.append(CPERecord.parse(NAMES[0]))
+    s.append(CPE(NAMES[0]))
+    assert len(s) == 1
+
+    name = CPERecord.parse('cpe:2.3:a:microsoft:internet_explorer:*:*:*:*:*:*:*:*')
+    assert s.name_match(name)
+
+    other = CPERecord.parse('cpe:2.3:a:microsoft:windows:*:*:*:*:*:*:*:*')
+    assert not s.name_match(other)
+
+
+@pytest.mark.parametrize('flat', [True, False])
+def test_version_1_1_mixed_case(flat):
+    c = CPE('cpe:///Microsoft:Windows:XP')
+    if not flat:
+        c._flat_view.valid = False
+    r = CPERecord.from_cpe(c)
+
+    # The same values as the CPE Name of version 2.3
+    wfn = CPE2_3_WFN(c.as_wfn())
+    assert r.as_wfn() == wfn.as_wfn() == (
+        'wfn:[part="a", vendor="microsoft", product="windows", version="xp"]')
+    assert r.to_cpe() == wfn
+    assert CPERecord.from_cpe(r.to_cpe())[2:] == r[2:]
+
+
+def test_empty_name():
+    with pytest.raises(ValueError):
+        CPERecord.from_cpe(CPE('cpe://'))
+    with pytest.raises(ValueError):
+        CPERecord.parse('cpe:///')
+
+    r = CPERecord.parse('wfn:[]')
+    assert r.get_values() == (None,) * 11
+    assert r.to_cpe() == CPE('wfn:[]')
@@ -0,0 +1,160 @@
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecache import CPECache
+from cpe.cpecollection import CPECollection
+from cpe.cpeset2_3 import CPESet2_3
+
+import pytest
+
+NAMES = [
+    'wfn:[part="a", vendor="microsoft", product="internet_explorer", '
+    'version="8\\.0\\.6001"]',
+    'wfn:[part="a", vendor="Mozilla", product="firefox", version="2\\.0"]',
+    'wfn:[part="o", vendor="microsoft", product=NA]',
+    'wfn:[part="a", vendor=ANY, product="firefox", version="3\\.0"]',
+    'wfn:[part="a", vendor="hp", product="\\-insight"]',
+    'wfn:[part="a", vendor="sun", product="jre\\-"]',
+]
+
+
+def new_set(names=NAMES):
+    s = CPESet2_3()
+    for cpe_str in names:
+        s.append(CPE2_3_WFN(cpe_str))
+    return s
+
+
+def linear_match(s, wfn):
+    return any(CPESet2_3.cpe_superset(wfn, k) for k in s.K)
+
+
+@pytest.mark.parametrize("cpe_str", [
+    'wfn:[part="a", vendor="microsoft", product="internet_explorer"]',
+    'wfn:[part="a", vendor="MICROSOFT", product="internet_explorer", '
+    'version="8\\.0\\.6001"]',
+    'wfn:[part="a", vendor="mozilla", product="firefox", version="2\\.0"]',
+    'wfn:[part="a", vendor="mozilla", product="firefox", version="3\\.0"]',
+    'wfn:[part="a", vendor=ANY, product="firefox", version="3\\.0"]',
+    'wfn:[part="o", vendor="microsoft", product=NA]',
+    'wfn:[part="o", vendor="microsoft", product="windows"]',
+    'wfn:[part="a", vendor="micro*", product="internet*"]',
+    'wfn:[part="a", vendor="hp", product="\\-insight"]',
+    'wfn:[part="a", vendor="sun", product="jre"]',
+    'wfn:[part="a", vendor="sun", product="jre\\-"]',
+    'wfn:[part="a", vendor="apple"]',
+    'wfn:[part=ANY]',
+])
+def test_match_as_linear_scan(cpe_str):
+    s = new_set()
+    wfn = CPE2_3_WFN(cpe_str)
+
+    assert s.name_match(wfn) == linear_match(s, wfn)
+
+
+def test_match_after_modifying_members():
+    s = new_set()
+    wfn = CPE2_3_WFN('wfn:[part="a", vendor="apple", product="safari"]')
+    assert not s.name_match(wfn)
+
+    # Added at the end
+    s.append(CPE2_3_WFN('wfn:[part="a", vendor="apple", product="safari"]'))
+    assert s.name_match(wfn)
+
+    # Replaced
+    s.K[-1] = CPE2_3_WFN('wfn:[part="a", vendor="apple", product="itunes"]')
+    assert not s.name_match(wfn)
+
+    s.K[0] = CPE2_3_WFN('wfn:[part="a", vendor="apple", product="safari"]')
+    assert s.name_match(wfn)
+
+    # Removed
+    del s.K[0]
+    assert not s.name_match(wfn)
+
+    # Members not stored in a list of members of set
+    s.K = list(s.K) + [
+        CPE2_3_WFN('wfn:[part="a", vendor="apple", product="safari"]')]
+    assert s.name_match(wfn)
+
+
+def test_match_records():
+    s = CPECollection(NAMES).to_set()
+    wfn = CPE2_3_WFN('wfn:[part="a", vendor="mozilla", product="firefox", '
+                     'version="2\\.0"]')
+
+    assert s.name_match(wfn)
+    assert s._index.count == len(s)
+
+
+def test_compared_form():
+    c = CPE2_3_WFN('wfn:[part="a", vendor="Microsoft", product="ie*", '
+                   'version=NA, update="sp\\*"]')
+    form = CPESet2_3._get_compared_form(c)
+
+    assert form[:5] == (('a', True, False),
+                        ('microsoft', True, False),
+                        ('ie*', True, True),
+                        ('NA', False, False),
+                        ('sp\\*', True, False))
+    assert form[5] == ('ANY', False, False)
+
+
+@pytest.mark.parametrize("source, target", [
+    ('"microsoft"', '"Microsoft"'),
+    ('"micro*"', '"microsoft"'),
+    ('"microsoft"', '"micro*"'),
+    ('ANY', 'NA'),
+    ('NA', 'ANY'),
+    ('"\\\\-"', '"\\\\-"'),
+    ('"ie"', '"ie\\\\"'),
+])
+def test_compare_items(source, target):
+    wfns = [CPE2_3_WFN('wfn:[part="a", vendor={0}]'.format(value),
+                       validate=False)
+            for value in (source, target)]
+    items = [CPESet2_3._get_compared_item(c, 'vendor') for c in wfns]
+
+    assert (CPESet2_3._compare_items(*items) ==
+            CPESet2_3._compare(*[c.get_attribute_values('vendor')[0].strip('"')
+                                 for c in wfns]))
+
+
+@pytest.mark.parametrize("source, target, result", [
+    ('8\\.0\\.*', '8\\.0\\.6001', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('8\\.0\\.*', '8\\.1', CPESet2_3.LOGICAL_VALUE_DISJOINT),
+    ('*explorer', 'internet_explorer', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('sp?', 'sp2', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('sp?', 'sp', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('sp?', 'sp10', CPESet2_3.LOGICAL_VALUE_DISJOINT),
+    ('*x\\-', 'x\\-' * 50 + 'yy', CPESet2_3.LOGICAL_VALUE_DISJOINT),
+    ('*x\\-?', 'x\\-' * 50 + 'yy', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('x\\-?', 'x\\-' * 50, CPESet2_3.LOGICAL_VALUE_DISJOINT),
+    ('*', '', CPESet2_3.LOGICAL_VALUE_DISJOINT),
+])
+def test_compare_strings(source, target, result):
+    assert CPESet2_3._compare_strings(source, target) == result
+
+    # The same source string compiled before
+    assert CPESet2_3._matchers.get(source) is not None
+    assert CPESet2_3._compare_strings(source, target) == result
+
+
+def test_matchers_limited(monkeypatch):
+    monkeypatch.setattr(CPESet2_3, '_matchers', CPECache(2))
+
+    for source in ('a*', 'b*', 'a*', 'c*'):
+        CPESet2_3._compare_strings(source, 'abc')
+
+    # Only the least recently used matcher is removed
+    assert len(CPESet2_3._matchers) == 2
+    assert CPESet2_3._matchers.get('a*') is not None
+    assert CPESet2_3._matchers.get('b*') is None
+
+
+@pytest.mark.parametrize("source, target, result", [
+    ('?p2', 'sp2', CPESet2_3.LOGICAL_VALUE_DISJOINT),
+    ('??2', '??2', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+    ('?', 'a', CPESet2_3.LOGICAL_VALUE_SUPERSET),
+])
+def test_compare_strings_initial_one(source, target, result):
+    # Initial "?" are compared as part of the source string
+    assert CPESet2_3._compare_strings(source, target) == result
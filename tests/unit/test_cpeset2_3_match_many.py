@@ -0,0 +1,89 @@
+from cpe.cpe import CPE
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpecollection import CPECollection
+from cpe.cperecord import CPERecord
+from cpe.cpeset2_3 import CPESet2_3
+
+import pytest
+
+MEMBERS = [
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:2.3:a:microsoft:internet_explorer:8.*:*:*:*:*:*:*:*',
+    'cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*',
+    'cpe:2.3:o:microsoft:windows_xp:-:sp3:*:*:*:*:*:*',
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:-:*:*:online:win2003:x64:*',
+]
+
+NAMES = [
+    'cpe:2.3:a:microsoft:internet_explorer:*:*:*:*:*:*:*:*',
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:/a:mozilla:firefox:2.0',
+    'cpe:2.3:a:mozilla:firefox:3.0:*:*:*:*:*:*:*',
+    'wfn:[part="o", vendor="microsoft", product="windows_xp", update=ANY]',
+    'wfn:[part=ANY, vendor=ANY]',
+    'cpe:2.3:a:micro*:*:*:*:*:*:*:*:*:*',
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:*:*:*:*:*:*:*',
+    'cpe:2.3:a:microsoft:internet_explorer:*:*:*:*:*:*:*:*',
+]
+
+
+def new_set():
+    s = CPESet2_3()
+    s.extend(CPE(cpe_str) for cpe_str in MEMBERS)
+    return s
+
+
+def names():
+    return [CPE(cpe_str, CPE.VERSION_2_3) for cpe_str in NAMES]
+
+
+def test_match_as_name_match():
+    s = new_set()
+
+    # CPE Names of FS, URI and WFN styles
+    assert s.match_many(names()) == [s.name_match(c) for c in names()]
+
+
+def test_indices_of_members():
+    s = new_set()
+    wfns = [CPE2_3_WFN(c.as_wfn()) for c in names()]
+
+    matches = s.match_many(names(), indices=True)
+
+    assert matches == [
+        [i for i, k in enumerate(s.K) if CPESet2_3.cpe_superset(wfn, k)]
+        for wfn in wfns]
+    assert matches[0] == [0]
+    # Member with wildcards not matched
+    assert matches[5] == [0, 2, 3, 4]
+
+    # Equal candidates get different lists
+    assert matches[-1] == matches[0]
+    assert matches[-1] is not matches[0]
+
+
+def test_match_records():
+    s = CPECollection(MEMBERS).to_set()
+    records = [CPERecord.from_cpe(c) for c in names()]
+
+    assert s.match_many(records) == new_set().match_many(names())
+
+
+def test_members_not_indexed():
+    s = new_set()
+    expected = s.match_many(names(), indices=True)
+
+    s.K = list(s.K)
+
+    assert s.match_many(names(), indices=True) == expected
+
+
+def test_match_empty():
+    assert CPESet2_3().match_many(names()) == [False] * len(NAMES)
+    assert new_set().match_many([]) == []
+
+
+def test_match_invalid_version():
+    with pytest.raises(ValueError):
+        new_set().match_many([CPE2_2('cpe:/a:mozilla:firefox:2.0')])
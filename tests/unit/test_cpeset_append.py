@@ -0,0 +1,97 @@
+from cpe.cpe import CPE
+from cpe.cpe1_1 import CPE1_1
+from cpe.cpe2_2 import CPE2_2
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cperecord import CPERecord
+from cpe.cpeset1_1 import CPESet1_1
+from cpe.cpeset2_2 import CPESet2_2
+from cpe.cpeset2_3 import CPESet2_3
+
+import pytest
+
+FS = 'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*'
+
+
+@pytest.mark.parametrize("cls, names", [
+    (CPESet1_1, [CPE1_1('cpe://microsoft:windows:xp'),
+                 CPE1_1('cpe://microsoft:windows:xp!vista'),
+                 CPE1_1('cpe://microsoft:windows:xp')]),
+    (CPESet2_2, [CPE2_2('cpe:/h:hp'),
+                 CPE2_2('cpe:/a:hp:insight'),
+                 CPE2_2('cpe:/h:hp')]),
+    (CPESet2_3, [CPE(FS),
+                 CPE('cpe:2.3:a:mozilla:firefox:2.0:*:*:*:*:*:*:*'),
+                 CPE2_3_FS(FS)]),
+])
+def test_append_and_extend(cls, names):
+    s = cls()
+    for c in names:
+        s.append(c)
+
+    assert len(s) == 2
+
+    other = cls()
+    other.extend(names + names)
+
+    assert [str(k) for k in other.K] == [str(k) for k in s.K]
+
+
+def test_extend_invalid_version():
+    s = CPESet2_3()
+
+    with pytest.raises(ValueError):
+        s.extend([CPE(FS), CPE2_2('cpe:/h:hp')])
+
+    # No CPE Name is added
+    assert len(s) == 0
+
+
+def test_names_converted_to_wfn():
+    s = CPESet2_3()
+    s.append(CPE2_3_FS(FS))
+    s.extend([CPE('cpe:/a:mozilla:firefox:2.0', CPE.VERSION_2_3)])
+
+    assert all(isinstance(k, CPE2_3_WFN) for k in s.K)
+    assert s.K[0].as_fs() == FS
+
+    # The same CPE Name in WFN style and as record
+    s.append(CPE2_3_WFN(CPE(FS).as_wfn()))
+    s.append(CPERecord.parse(FS))
+
+    assert len(s) == 2
+    assert s.name_match(CPE2_3_WFN(CPE(FS).as_wfn()))
+
+
+def test_append_invalid_wfn():
+    s = CPESet2_3()
+    name = CPE2_3_FS('cpe:2.3:a:hp:-*:*:*:*:*:*:*:*:*')
+
+    # The CPE Name bound to WFN is not valid
+    with pytest.raises(ValueError):
+        s.append(name)
+
+    with pytest.raises(ValueError):
+        s.extend([CPE(FS), name])
+
+    assert len(s) == 0
+
+
+def test_append_after_modifying_members():
+    s = CPESet2_2()
+    s.extend([CPE2_2('cpe:/h:hp'), CPE2_2('cpe:/a:hp:insight')])
+
+    del s.K[0]
+    s.append(CPE2_2('cpe:/h:hp'))
+    assert len(s) == 2
+
+    # Added without checking if it is already in set
+    s.K.append(CPE2_2('cpe:/a:mozilla:firefox'))
+    s.append(CPE2_2('cpe:/a:mozilla:firefox'))
+    assert len(s) == 3
+
+    # Members not stored in a list of members of set
+    s.K = list(s.K)
+    s.append(CPE2_2('cpe:/h:hp'))
+    s.append(CPE2_2('cpe:/o:linux'))
+    assert len(s) == 4
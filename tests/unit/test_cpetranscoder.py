@@ -0,0 +1,116 @@
+from __future__ import print_function
+from cpe.cpe2_3_fs import CPE2_3_FS
+from cpe.cpe2_3_uri import CPE2_3_URI
+from cpe.cpe2_3_wfn import CPE2_3_WFN
+from cpe.cpetranscoder import CPETranscoder
+
+import pytest
+
+FS_NAMES = [
+    'cpe:2.3:a:microsoft:internet_explorer:8.0.6001:beta:*:*:*:*:*:*',
+    'cpe:2.3:a:hp:insight_diagnostics:7.4.0.1570:-:*:*:online:win2003:x64:*',
+    'cpe:2.3:a:foo\\\\bar:big\\$money_2010:*:*:*:en-us:*:*:*:*',
+    'cpe:2.3:a:Microsoft:IE:8.*:sp?:*:*:*:*:*:*',
+    'cpe:2.3:o:foo\\:bar:os:1\\.0:*:*:*:*:*:*:*',
+    'cpe:2.3:*:*:*:*:*:*:*:*:*:*:*',
+]
+
+URI_NAMES = [
+    'cpe:/a:microsoft:internet_explorer:8.0.6001:beta',
+    'cpe:/a:hp:insight_diagnostics:7.4.0.1570::~~online~win2003~x64~',
+    'cpe:/a:hp:openview_network_manager:7.51:-:~~~linux~~',
+    'cpe:/a:foo%5cbar:big%24money_2010%07:::en-us',
+    'cpe:/a:Microsoft:IE:8.%02:sp%01',
+    'cpe:/a::firefox',
+    'cpe:/',
+]
+
+WFN_NAMES = [
+    'wfn:[part="a", vendor="microsoft", product="internet_explorer", '
+    'version="8\\.0\\.6001", update="beta"]',
+    'wfn:[part="a", vendor="foo\\!", target_sw="linux"]',
+    'wfn:[part="o", vendor="microsoft", product="windows_xp", version=NA, '
+    'update="sp?", edition=any]',
+    'wfn:[product="x", update="u"]',
+]
+
+
+def _convert(cls, method, cpe_str):
+    try:
+        return getattr(cls(cpe_str), method)()
+    except ValueError:
+        return ValueError
+
+
+def _transcode(transcode, cpe_str):
+    try:
+        return transcode(cpe_str)
+    except ValueError:
+        return ValueError
+
+
+@pytest.mark.parametrize('cpe_str', FS_NAMES)
+@pytest.mark.parametrize('method, transcode', [
+    ('as_uri_2_3', CPETranscoder.fs_to_uri),
+    ('as_wfn', CPETranscoder.fs_to_wfn)])
+def test_fs_same_as_object(cpe_str, method, transcode):
+    assert (_transcode(transcode, cpe_str) ==
+            _convert(CPE2_3_FS, method, cpe_str))
+
+
+@pytest.mark.parametrize('cpe_str', URI_NAMES)
+@pytest.mark.parametrize('method, transcode', [
+    ('as_fs', CPETranscoder.uri_to_fs),
+    ('as_wfn', CPETranscoder.uri_to_wfn)])
+def test_uri_same_as_object(cpe_str, method, transcode):
+    assert (_transcode(transcode, cpe_str) ==
+            _convert(CPE2_3_URI, method, cpe_str))
+
+
+@pytest.mark.parametrize('cpe_str', WFN_NAMES)
+@pytest.mark.parametrize('method, transcode', [
+    ('as_fs', CPETranscoder.wfn_to_fs),
+    ('as_uri_2_3', CPETranscoder.wfn_to_uri)])
+def test_wfn_same_as_object(cpe_str, method, transcode):
+    assert (_transcode(transcode, cpe_str) ==
+            _convert(CPE2_3_WFN, method, cpe_str))
+
+
+@pytest.mark.parametrize('transcode, cpe_str', [
+    (CPETranscoder.fs_to_uri, 'cpe:2.3:a:microsoft:ie'),
+    (CPETranscoder.fs_to_uri, 'cpe:2.3:x:microsoft:ie:*:*:*:*:*:*:*:*'),
+    (CPETranscoder.fs_to_uri, 'cpe:2.3:a:micro soft:ie:*:*:*:*:*:*:*:*'),
+    (CPETranscoder.fs_to_wfn, 'cpe:2.3:a:micro*soft:ie:*:*:*:*:*:*:*:*'),
+    (CPETranscoder.uri_to_fs, 'cpe:/a:microsoft:ie:8.0:sp1:~online'),
+    (CPETranscoder.uri_to_fs, 'cpe:/a:microsoft:ie:8%zz'),
+    (CPETranscoder.uri_to_wfn, 'cpe:2.3:a:microsoft:ie:*:*:*:*:*:*:*:*'),
+    (CPETranscoder.wfn_to_fs, 'wfn:[part="a", vendor="microsoft"'),
+    (CPETranscoder.wfn_to_fs, 'wfn:[part="a", part="o"]'),
+    (CPETranscoder.wfn_to_fs, 'wfn:[part="a", color="red"]'),
+    (CPETranscoder.wfn_to_uri, 'wfn:[part="a", vendor=SOME]'),
+    (CPETranscoder.wfn_to_uri, 'wfn:[part="a", vendor]')])
+def test_bad_formed_name(transcode, cpe_str):
+    with pytest.raises(ValueError):
+        transcode(cpe_str)
+
+
+def test_trusted_name_not_checked():
+    fs = 'cpe:2.3:a:microsoft:ie:8.0:*:*:x:*:*:*:*'
+
+    with pytest.raises(ValueError):
+        CPETranscoder.fs_to_uri(fs)
+
+    assert CPETranscoder.fs_to_uri(fs, False) == 'cpe:/a:microsoft:ie:8.0:::x'
+
+
+def test_undefined_attributes_before_packed_edition():
+    wfn = 'wfn:[part="a", vendor="foo\\!", target_sw="linux"]'
+    uri = 'cpe:/a:foo%21::::~~~linux~~'
+
+    assert CPE2_3_WFN(wfn).as_uri_2_3() == uri
+    assert CPETranscoder.wfn_to_uri(wfn) == uri
+
+
+def test_name_without_attributes_as_wfn():
+    assert CPE2_3_URI('cpe:/').as_wfn() == 'wfn:[]'
+    assert CPETranscoder.uri_to_wfn('cpe:/') == 'wfn:[]'